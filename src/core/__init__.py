@@ -7,11 +7,40 @@ from src.core.config_manager import ConfigManager
 from src.core.plugin_manager import PluginManager
 from src.core.web_driver_manager import WebDriverManager
 from src.core.excel_processor import ExcelProcessor
+from src.core.driver_profiler import CommandProfiler
+from src.core.tracing import Tracer
+from src.core.screenshot_pipeline import ScreenshotPipeline
+from src.core.option_index import OptionIndex
+from src.core.site_cache import SiteCache
+from src.core.site_fingerprint import SiteFingerprint
+from src.core.form_schema import FormSchema
+from src.core.strategy_memo import StrategyMemo
+from src.core.dom_observers import DomObservers
+from src.core.launch_benchmark import LaunchBenchmark
+from src.core.profile_template import ProfileTemplate
+from src.core.browser_registry import BrowserRegistry
+from src.core.browser_supervisor import BrowserSupervisor
+from src.core.command_watchdog import CommandWatchdog, CommandTimeoutError
 
 __all__ = [
     'BaseAutomation',
     'ConfigManager', 
     'PluginManager',
     'WebDriverManager',
-    'ExcelProcessor'
+    'ExcelProcessor',
+    'CommandProfiler',
+    'Tracer',
+    'ScreenshotPipeline',
+    'OptionIndex',
+    'SiteCache',
+    'SiteFingerprint',
+    'FormSchema',
+    'StrategyMemo',
+    'DomObservers',
+    'LaunchBenchmark',
+    'ProfileTemplate',
+    'BrowserRegistry',
+    'BrowserSupervisor',
+    'CommandWatchdog',
+    'CommandTimeoutError'
 ] 
\ No newline at end of file
@@ -4,21 +4,49 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from contextlib import nullcontext
+from typing import Dict, Any, Optional, Callable
 from selenium import webdriver
 from selenium.webdriver.support.ui import WebDriverWait
 from loguru import logger
 
+from src.core.config_manager import ConfigManager
+from src.core.driver_profiler import CommandProfiler
+from src.core.tracing import Tracer
+from src.core.screenshot_pipeline import ScreenshotPipeline
+from src.core.site_cache import SiteCache
+from src.core.site_fingerprint import SiteFingerprint
+from src.core.strategy_memo import StrategyMemo
+from src.core.command_watchdog import CommandWatchdog
+from src.core.web_driver_manager import WebDriverManager
+
 
 class BaseAutomation(ABC):
     """웹사이트 자동화 기본 클래스"""
     
+    # 사이트 식별자 (레지스트리의 website_id, 사이트 캐시 파일명으로 사용)
+    SITE_ID: str = ""
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.driver: Optional[webdriver.Chrome] = None
         self.wait: Optional[WebDriverWait] = None
         self.logger = logger
         self.keep_browser = True  # 기본적으로 브라우저 유지
+        self.profiler: Optional[CommandProfiler] = None
+        self.tracer: Optional[Tracer] = None
+        self.screenshots: Optional[ScreenshotPipeline] = None
+        self._site_cache: Optional[SiteCache] = None
+        self._strategy_memo: Optional[StrategyMemo] = None
+        self.watchdog: Optional[CommandWatchdog] = CommandWatchdog.from_config(config)
+        
+        tracing = ConfigManager.get_value(config, 'tracing', {}) or {}
+        if tracing.get('enabled', False):
+            self.tracer = Tracer(
+                name=type(self).__name__,
+                trace_dir=tracing.get('trace_dir', 'logs/traces'),
+                slow_threshold_ms=tracing.get('slow_threshold_ms', 3000)
+            )
         
     @abstractmethod
     def setup_driver(self) -> None:
@@ -50,12 +78,128 @@ class BaseAutomation(ABC):
         """결과 검증"""
         pass
         
+    def attach_driver_instrumentation(self) -> None:
+        """드라이버 생성 직후 호출 - 프로파일러/트레이서/스크린샷 파이프라인 연결"""
+        if not self.driver:
+            return
+            
+        if self.tracer:
+            self.tracer.attach(self.driver)
+            
+        profiling = ConfigManager.get_value(self.config, 'profiling', {}) or {}
+        if profiling.get('enabled', False):
+            if self.profiler is None:
+                self.profiler = CommandProfiler(
+                    report_dir=profiling.get('report_dir', 'logs/profiling'),
+                    top_n=profiling.get('top_n', 20)
+                )
+            self.profiler.attach(self.driver)
+            
+        if self.screenshots:
+            self.screenshots.close()
+        screenshot_config = ConfigManager.get_value(self.config, 'screenshots', {}) or {}
+        self.screenshots = ScreenshotPipeline.from_config(
+            self.driver, screenshot_config, prefix=type(self).__name__
+        )
+        
+        # 감시기는 가장 바깥쪽 래퍼로 연결 (멈춘 명령은 프로파일러 기록 전에 끊김)
+        if self.watchdog:
+            self.watchdog.attach(self.driver)
+        
+    def capture_screenshot(self, label: str, failed: bool = False) -> Optional[str]:
+        """정책 기반 비동기 스크린샷 (on_failure 정책에서는 failed=True 일 때만 촬영)"""
+        if not self.screenshots:
+            return None
+        return self.screenshots.capture(label, failed=failed)
+        
+    def set_step(self, step: str) -> None:
+        """현재 자동화 단계 설정 (프로파일 집계 및 단계 스팬 기준)"""
+        if self.profiler:
+            self.profiler.set_step(step)
+        if self.tracer:
+            self.tracer.start_step(step)
+        if self.watchdog:
+            self.watchdog.set_step(step)
+            
+    def span(self, name: str, **attributes):
+        """트레이싱 스팬 (트레이싱 비활성 시 아무 동작 없음)"""
+        if not self.tracer:
+            return nullcontext()
+        return self.tracer.span(name, **attributes)
+        
+    def annotate_span(self, **attributes) -> None:
+        """현재 스팬에 속성 추가 (예: 사용된 선택자)"""
+        if self.tracer:
+            self.tracer.annotate(**attributes)
+            
+    def traced(self, name: str, func: Callable, *args, attributes: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """함수를 스팬으로 감싸서 실행하고 결과를 스팬 속성으로 기록"""
+        with self.span(name, **(attributes or {})):
+            result = func(*args, **kwargs)
+            self.annotate_span(result=bool(result))
+            return result
+            
+    def write_trace(self) -> Optional[Dict[str, str]]:
+        """트레이스 JSON 및 HTML 타임라인 저장"""
+        if not self.tracer:
+            return None
+        return self.tracer.export()
+        
+    def write_profile_report(self, name: str = "run") -> Optional[str]:
+        """WebDriver 명령 프로파일 리포트 저장"""
+        if not self.profiler:
+            return None
+        return self.profiler.write_report(name)
+        
+    def get_site_cache(self) -> SiteCache:
+        """사이트별 영속 캐시 (paths.cache 디렉토리)"""
+        if self._site_cache is None:
+            cache_dir = ConfigManager.get_value(self.config, 'paths.cache', 'data/cache')
+            self._site_cache = SiteCache(self.SITE_ID or type(self).__name__, cache_dir)
+        return self._site_cache
+        
+    def fingerprint_site(self) -> Optional[str]:
+        """사이트 진입 페이지에서 빌드 ID를 계산하고 사이트 캐시를 해당 빌드에 연결"""
+        if not self.driver:
+            return None
+        fingerprint = SiteFingerprint.compute(self.driver)
+        if not fingerprint:
+            return None
+        if self.get_site_cache().bind_build(fingerprint['build_id'], fingerprint['assets']):
+            # 빌드가 바뀌면 이전 빌드에서 학습한 전략은 사용하지 않음
+            self._strategy_memo = None
+        return fingerprint['build_id']
+        
+    def get_strategy_memo(self) -> StrategyMemo:
+        """사이트 빌드별 전략 메모 (다중 방법 fallback의 성공 방법 기억)"""
+        if self._strategy_memo is None:
+            self._strategy_memo = StrategyMemo(self.get_site_cache())
+        return self._strategy_memo
+        
+    def flush_strategy_memo(self) -> None:
+        """전략 메모 저장 및 지표 로그 출력"""
+        if not self._strategy_memo:
+            return
+        self._strategy_memo.flush()
+        for kind, summary in self._strategy_memo.metrics().items():
+            self.logger.info(
+                f"전략 지표 [{kind}] 우선 방법: {summary['winner']}, "
+                f"성공당 평균 시도: {summary['avg_attempts_per_success']}"
+            )
+        
     def cleanup(self) -> None:
         """리소스 정리"""
+        if self.screenshots:
+            self.screenshots.flush()
+        self.flush_strategy_memo()
+        if self.watchdog:
+            self.watchdog.close()
         if self.driver and not self.keep_browser:
-            self.driver.quit()
+            WebDriverManager.quit_driver(self.driver)
             self.logger.info("웹드라이버 종료")
         elif self.keep_browser:
+            if self.driver:
+                WebDriverManager.release_driver(self.driver)
             self.logger.info("브라우저를 열린 상태로 유지합니다")
             
     def set_keep_browser(self, keep_browser: bool) -> None:
@@ -70,27 +214,33 @@ class BaseAutomation(ABC):
             self.logger.info("자동화 시작")
             
             # 1. 웹드라이버 설정
+            self.set_step('setup_driver')
             self.setup_driver()
             
             # 2. 웹사이트 접속
+            self.set_step('navigate_to_website')
             if not self.navigate_to_website():
                 return False
                 
             # 3. 로그인 (필요시)
+            self.set_step('login')
             if self.config.get('requires_login', False):
                 credentials = self.config.get('credentials', {})
                 if not self.login(credentials):
                     return False
                     
             # 4. 폼 작성
+            self.set_step('fill_form')
             if not self.fill_form(data):
                 return False
                 
             # 5. 폼 제출
+            self.set_step('submit_form')
             if not self.submit_form():
                 return False
                 
             # 6. 결과 검증
+            self.set_step('validate_result')
             if not self.validate_result():
                 return False
                 
@@ -0,0 +1,264 @@
+"""
+브라우저 세션 레지스트리
+브라우저 유지(detach) 모드로 남겨 둔 Chrome 의 원격 디버깅 포트와 소유자를 JSON 파일에 기록하여
+다음 실행에서 새 Chrome 을 띄우지 않고 debuggerAddress 로 붙어서 재사용
+유효 시간(TTL)과 최대 개수(LRU) 기준으로 오래된 브라우저를 정리
+"""
+
+import json
+import os
+import shutil
+import socket
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+from loguru import logger
+
+from src.core.config_manager import ConfigManager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class BrowserRegistry:
+    """원격 디버깅 포트 단위 브라우저 세션 목록 (프로세스 간 공유)"""
+
+    _thread_lock = threading.Lock()
+
+    def __init__(self, config: Dict[str, Any]):
+        settings = ConfigManager.get_value(config, 'browser_registry', {}) or {}
+        self.registry_path = Path(settings.get('registry_file', './data/cache/browser_registry.json'))
+        self.host = settings.get('host', '127.0.0.1')
+        self.ttl_seconds = float(settings.get('ttl_minutes', 60)) * 60
+        self.max_browsers = int(settings.get('max_browsers', 3))
+
+    @staticmethod
+    def is_enabled(config: Dict[str, Any]) -> bool:
+        return bool(ConfigManager.get_value(config, 'browser_registry.enabled', False))
+
+    @contextmanager
+    def _locked(self):
+        """레지스트리 파일 잠금 (같은 프로세스의 스레드 + 다른 프로세스)"""
+        with self._thread_lock:
+            self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.registry_path.with_suffix('.lock'), 'w') as lock_file:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            if self.registry_path.exists():
+                with open(self.registry_path, 'r', encoding='utf-8') as f:
+                    return json.load(f).get('sessions', {})
+        except Exception as e:
+            logger.warning(f"브라우저 레지스트리 로드 실패, 새로 시작합니다: {e}")
+        return {}
+
+    def _save(self, sessions: Dict[str, Dict[str, Any]]) -> None:
+        temp_path = self.registry_path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'sessions': sessions}, f, ensure_ascii=False, indent=2)
+        temp_path.replace(self.registry_path)
+
+    @staticmethod
+    def find_free_port() -> int:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+
+    def is_alive(self, port: int) -> bool:
+        """원격 디버깅 포트가 응답하는지 확인 (/json/version)"""
+        try:
+            with urllib.request.urlopen(f"http://{self.host}:{port}/json/version", timeout=1) as response:
+                return response.status == 200
+        except Exception:
+            return False
+
+    @staticmethod
+    def _pid_alive(pid: Optional[int]) -> bool:
+        if not pid:
+            return False
+        try:
+            os.kill(pid, 0)
+            return True
+        except OSError:
+            return False
+
+    def _is_idle(self, entry: Dict[str, Any]) -> bool:
+        """사용 중 표시가 없거나 사용 중이던 프로세스가 이미 종료된 경우"""
+        return not entry.get('in_use_pid') or not self._pid_alive(entry.get('in_use_pid'))
+
+    @staticmethod
+    def _process_started(pid: Optional[int]) -> Optional[float]:
+        """프로세스 시작 시각 (psutil 이 없거나 프로세스가 없으면 None)"""
+        try:
+            import psutil
+            return psutil.Process(pid).create_time()
+        except Exception:
+            return None
+
+    def _owned_process(self, entry: Dict[str, Any]):
+        """등록된 PID 가 여전히 이 항목의 Chrome 인지 확인하여 psutil.Process 반환 (PID 재사용 시 None)
+
+        이름(chrome/chromium), 시작 시각(등록 시 기록값 또는 등록 시각 이전), 명령줄의 --remote-debugging-port 를 모두 확인
+        """
+        pid = entry.get('pid')
+        if not pid:
+            return None
+        import psutil
+        try:
+            process = psutil.Process(pid)
+            name = (process.name() or '').lower()
+            if 'chrome' not in name and 'chromium' not in name:
+                return None
+            started = entry.get('pid_started')
+            if started is not None and abs(process.create_time() - started) > 1:
+                return None
+            if started is None and process.create_time() > entry.get('created_at', 0) + 1:
+                return None
+            if f"--remote-debugging-port={entry['port']}" not in process.cmdline():
+                return None
+            return process
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+
+    def _close(self, entry: Dict[str, Any]) -> None:
+        """등록된 브라우저 프로세스 트리 종료 및 프로필 복제본 삭제
+
+        PID 는 재사용될 수 있으므로 psutil 로 같은 Chrome 인지 확인된 경우에만 종료하고,
+        psutil 이 없으면 원격 디버깅 포트가 응답할 때만 종료한다.
+        """
+        pid = entry.get('pid')
+        if pid:
+            try:
+                process = self._owned_process(entry)
+                if process:
+                    for child in process.children(recursive=True):
+                        child.kill()
+                    process.kill()
+                else:
+                    logger.debug(f"등록된 PID {pid} 는 포트 {entry['port']} 의 브라우저가 아니므로 종료하지 않습니다")
+            except ImportError:
+                if self.is_alive(entry['port']):
+                    try:
+                        os.kill(pid, 9)
+                    except OSError:
+                        pass
+            except Exception:
+                pass
+        if entry.get('profile_dir'):
+            shutil.rmtree(entry['profile_dir'], ignore_errors=True)
+
+    def _evict(self, sessions: Dict[str, Dict[str, Any]], reserve: int = 0) -> List[str]:
+        """응답 없는 브라우저, TTL 이 지난 유휴 브라우저, 최대 개수를 넘는 오래된 유휴 브라우저 제거"""
+        now = time.time()
+        evicted = []
+
+        for key, entry in list(sessions.items()):
+            if not self.is_alive(entry['port']):
+                reason = '응답 없음'
+            elif self._is_idle(entry) and now - entry.get('last_used', 0) > self.ttl_seconds:
+                reason = 'TTL 만료'
+            else:
+                continue
+            self._close(entry)
+            sessions.pop(key)
+            evicted.append(key)
+            logger.info(f"브라우저 세션 정리 ({reason}): 포트 {entry['port']}, 소유자 {entry.get('owner')}")
+
+        idle = sorted((entry.get('last_used', 0), key) for key, entry in sessions.items() if self._is_idle(entry))
+        while len(sessions) + reserve > self.max_browsers and idle:
+            _, key = idle.pop(0)
+            entry = sessions.pop(key)
+            self._close(entry)
+            evicted.append(key)
+            logger.info(f"브라우저 세션 정리 (최대 {self.max_browsers}개 초과, LRU): 포트 {entry['port']}")
+
+        return evicted
+
+    def acquire(self, owner: str) -> Optional[Dict[str, Any]]:
+        """소유자의 유휴 브라우저 중 가장 최근에 사용한 것을 사용 중으로 표시하고 반환"""
+        try:
+            with self._locked():
+                sessions = self._load()
+                self._evict(sessions)
+                candidates = sorted(
+                    (entry for entry in sessions.values() if entry.get('owner') == owner and self._is_idle(entry)),
+                    key=lambda entry: entry.get('last_used', 0), reverse=True
+                )
+                entry = candidates[0] if candidates else None
+                if entry:
+                    entry['in_use_pid'] = os.getpid()
+                    entry['last_used'] = time.time()
+                self._save(sessions)
+                return dict(entry) if entry else None
+
+        except Exception as e:
+            logger.warning(f"브라우저 세션 조회 실패: {e}")
+            return None
+
+    def register(self, owner: str, port: int, pid: Optional[int] = None, profile_dir: Optional[str] = None) -> None:
+        """새로 띄운 브라우저를 사용 중 상태로 등록 (최대 개수를 넘으면 오래된 유휴 브라우저 정리)"""
+        try:
+            with self._locked():
+                sessions = self._load()
+                self._evict(sessions, reserve=1)
+                now = time.time()
+                sessions[str(port)] = {
+                    'owner': owner,
+                    'port': port,
+                    'pid': pid,
+                    'pid_started': self._process_started(pid) if pid else None,
+                    'profile_dir': profile_dir,
+                    'created_at': now,
+                    'last_used': now,
+                    'in_use_pid': os.getpid()
+                }
+                self._save(sessions)
+            logger.info(f"브라우저 세션 등록: 포트 {port}, 소유자 {owner}")
+
+        except Exception as e:
+            logger.warning(f"브라우저 세션 등록 실패: {e}")
+
+    def release(self, port: int) -> None:
+        """사용 완료 - 다음 실행에서 재사용할 수 있도록 유휴 상태로 표시"""
+        try:
+            with self._locked():
+                sessions = self._load()
+                entry = sessions.get(str(port))
+                if entry:
+                    entry['in_use_pid'] = None
+                    entry['last_used'] = time.time()
+                    self._save(sessions)
+
+        except Exception as e:
+            logger.warning(f"브라우저 세션 반환 실패: {e}")
+
+    def unregister(self, port: int) -> None:
+        """목록에서 제거 - 연결만 끊기고 브라우저가 남아 있으면 프로세스도 종료"""
+        try:
+            with self._locked():
+                sessions = self._load()
+                entry = sessions.pop(str(port), None)
+                if entry:
+                    self._save(sessions)
+            if entry and self.is_alive(port):
+                self._close(entry)
+
+        except Exception as e:
+            logger.warning(f"브라우저 세션 제거 실패: {e}")
+
+    def sessions(self) -> Dict[str, Dict[str, Any]]:
+        """현재 등록된 세션 목록"""
+        with self._locked():
+            return self._load()
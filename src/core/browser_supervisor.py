@@ -0,0 +1,218 @@
+"""
+브라우저 프로세스 감독기 (psutil)
+직접 띄운 브라우저 프로세스 트리의 메모리(RSS)/CPU 를 측정하여 기준 이상 커진 브라우저를 교체하고,
+종료된 Python 프로세스가 남긴 chrome/chromedriver 고아 프로세스를 시작 시 정리
+"""
+
+import os
+from typing import Dict, Any, Optional, List, Set, Tuple
+from loguru import logger
+
+from src.core.config_manager import ConfigManager
+from src.core.browser_registry import BrowserRegistry
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+# 브라우저를 띄운 Python 프로세스 PID 를 Chrome 명령줄에 남기는 표시 (Chrome 은 모르는 스위치를 무시함)
+OWNER_SWITCH = '--rpa-owner-pid='
+# Python 종료 후에도 유지되도록(detach) 띄운 브라우저 표시
+DETACHED_SWITCH = '--rpa-detached'
+
+
+class BrowserSupervisor:
+    """브라우저별 메모리 기준선 관리 및 교체 판단"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        settings = ConfigManager.get_value(config, 'supervisor', {}) or {}
+        self.enabled = bool(settings.get('enabled', True)) and psutil is not None
+        self.max_rss_mb = float(settings.get('max_rss_mb', 1500))
+        self.rss_growth_mb = float(settings.get('rss_growth_mb', 600))
+        # id(driver) -> {'baseline_mb', 'processes': {pid: psutil.Process}, 'samples'}
+        self._tracked: Dict[int, Dict[str, Any]] = {}
+
+    @staticmethod
+    def owner_arguments(detach: bool) -> List[str]:
+        """고아 판별용 Chrome 명령줄 표시"""
+        arguments = [f"{OWNER_SWITCH}{os.getpid()}"]
+        if detach:
+            arguments.append(DETACHED_SWITCH)
+        return arguments
+
+    def _processes(self, driver) -> List[Any]:
+        from src.core.web_driver_manager import WebDriverManager
+        return WebDriverManager.get_browser_processes(driver)
+
+    def track(self, driver) -> None:
+        """브라우저 감시 시작 - 첫 측정값을 메모리 기준선으로 사용"""
+        if not self.enabled or not driver:
+            return
+        self._tracked[id(driver)] = {'baseline_mb': None, 'processes': {}, 'samples': 0}
+        sample = self.sample(driver)
+        if sample:
+            logger.info(f"브라우저 감시 시작: 프로세스 {sample['processes']}개, 기준 메모리 {sample['rss_mb']}MB")
+
+    def untrack(self, driver) -> None:
+        self._tracked.pop(id(driver), None)
+
+    def sample(self, driver) -> Optional[Dict[str, Any]]:
+        """브라우저 프로세스 트리의 RSS 합계(MB)와 CPU 사용률(%) 측정"""
+        if not self.enabled or not driver:
+            return None
+
+        state = self._tracked.setdefault(id(driver), {'baseline_mb': None, 'processes': {}, 'samples': 0})
+        rss = 0
+        cpu = 0.0
+        alive = {}
+        for process in self._processes(driver):
+            # cpu_percent 는 같은 Process 객체의 직전 호출 대비 값이므로 객체를 재사용
+            process = state['processes'].get(process.pid, process)
+            try:
+                rss += process.memory_info().rss
+                cpu += process.cpu_percent(None)
+                alive[process.pid] = process
+            except Exception:
+                continue
+        state['processes'] = alive
+        if not alive:
+            return None
+
+        rss_mb = round(rss / (1024 * 1024), 1)
+        if state['baseline_mb'] is None:
+            state['baseline_mb'] = rss_mb
+        state['samples'] += 1
+        return {
+            'rss_mb': rss_mb,
+            'cpu_percent': round(cpu, 1),
+            'processes': len(alive),
+            'baseline_mb': state['baseline_mb'],
+            'growth_mb': round(rss_mb - state['baseline_mb'], 1)
+        }
+
+    def should_recycle(self, driver) -> bool:
+        """메모리가 최대치를 넘었거나 기준선 대비 증가량이 한도를 넘으면 True"""
+        sample = self.sample(driver)
+        if not sample:
+            return False
+        if sample['rss_mb'] > self.max_rss_mb:
+            logger.warning(f"브라우저 메모리 {sample['rss_mb']}MB > 최대 {self.max_rss_mb}MB, 브라우저를 교체합니다")
+            return True
+        if sample['growth_mb'] > self.rss_growth_mb:
+            logger.warning(f"브라우저 메모리 증가 {sample['growth_mb']}MB > 한도 {self.rss_growth_mb}MB "
+                           f"(기준 {sample['baseline_mb']}MB), 브라우저를 교체합니다")
+            return True
+        return False
+
+    @staticmethod
+    def _registered_pids_and_ports(config: Dict[str, Any]) -> Tuple[Set[int], Set[int]]:
+        """세션 레지스트리에 등록된(재사용 대기 중인) 브라우저의 PID/포트"""
+        if not BrowserRegistry.is_enabled(config):
+            return set(), set()
+        try:
+            sessions = BrowserRegistry(config).sessions()
+        except Exception:
+            return set(), set()
+        pids = {entry['pid'] for entry in sessions.values() if entry.get('pid')}
+        ports = {int(entry['port']) for entry in sessions.values() if entry.get('port')}
+        return pids, ports
+
+    @staticmethod
+    def _owner_pid(cmdline: List[str]) -> Optional[int]:
+        """Chrome 명령줄의 소유자(Python) PID"""
+        owner = next((arg[len(OWNER_SWITCH):] for arg in cmdline if arg.startswith(OWNER_SWITCH)), None)
+        return int(owner) if owner and owner.isdigit() else None
+
+    @staticmethod
+    def _has_dead_owner(process) -> bool:
+        """하위 브라우저 중 소유자 표시가 있고 그 소유자가 이미 종료된 것이 있는지 (chromedriver 판별용)"""
+        try:
+            children = process.children()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False
+        for child in children:
+            try:
+                owner = BrowserSupervisor._owner_pid(child.cmdline() or [])
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            if owner and not psutil.pid_exists(owner):
+                return True
+        return False
+
+    @staticmethod
+    def reap_orphans(config: Dict[str, Any]) -> int:
+        """종료된 Python 프로세스가 띄운 브라우저와 chromedriver 를 종료하고 정리한 개수 반환
+
+        소유자 표시(OWNER_SWITCH)가 있고 그 소유자가 종료된 프로세스만 대상으로 한다.
+        chromedriver 는 하위 브라우저의 소유자로 판단하고, 세션 레지스트리에 등록된 유지 브라우저는 재사용 대상이므로
+        건드리지 않으며, 유지(detach) 모드 브라우저는 supervisor.reap_detached 를 켠 경우에만 정리한다.
+        """
+        if psutil is None:
+            logger.warning("psutil 이 설치되어 있지 않아 고아 브라우저 정리를 건너뜁니다")
+            return 0
+
+        reap_detached = bool(ConfigManager.get_value(config, 'supervisor.reap_detached', False))
+        registered_pids, registered_ports = BrowserSupervisor._registered_pids_and_ports(config)
+        orphans = []
+        drivers = []
+        for process in psutil.process_iter(['pid', 'name', 'cmdline']):
+            try:
+                name = (process.info['name'] or '').lower()
+                cmdline = process.info['cmdline'] or []
+
+                if 'chromedriver' in name:
+                    # 드라이버만 종료 (하위 브라우저는 유지 대상일 수 있으므로 아래 브라우저 규칙으로 따로 판단)
+                    if BrowserSupervisor._has_dead_owner(process):
+                        drivers.append(process)
+                    continue
+
+                owner = BrowserSupervisor._owner_pid(cmdline)
+                if not owner:
+                    continue
+                if any(arg.startswith('--type=') for arg in cmdline):
+                    continue  # 렌더러/GPU 등 하위 프로세스는 메인 프로세스와 함께 종료
+                if psutil.pid_exists(owner) or process.pid in registered_pids:
+                    continue
+                port = next((arg.split('=', 1)[1] for arg in cmdline if arg.startswith('--remote-debugging-port=')), None)
+                if port and port.isdigit() and int(port) in registered_ports:
+                    continue
+                if DETACHED_SWITCH in cmdline and not reap_detached:
+                    continue
+                orphans.append(process)
+
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+        for process in orphans:
+            BrowserSupervisor.kill_tree(process)
+        for process in drivers:
+            try:
+                process.kill()
+            except Exception:
+                pass
+
+        if orphans or drivers:
+            logger.info(f"고아 프로세스 정리: 브라우저 {len(orphans)}개 트리, chromedriver {len(drivers)}개")
+        return len(orphans) + len(drivers)
+
+    @staticmethod
+    def kill_tree(process) -> None:
+        """프로세스와 모든 하위 프로세스 종료 (terminate 후 남으면 kill)"""
+        try:
+            tree = process.children(recursive=True) + [process]
+        except Exception:
+            tree = [process]
+        for item in tree:
+            try:
+                item.terminate()
+            except Exception:
+                pass
+        try:
+            _, remaining = psutil.wait_procs(tree, timeout=3)
+            for item in remaining:
+                item.kill()
+        except Exception:
+            pass
@@ -0,0 +1,179 @@
+"""
+WebDriver 명령 감시기 (watchdog)
+driver.execute 를 감싸서 명령마다 마감 시각(명령 시간 한도와 현재 단계의 남은 예산 중 빠른 쪽)을 두고,
+마감이 지나도 응답이 없으면 감시 스레드가 chromedriver/브라우저 프로세스를 종료하여 멈춘 호출을 풀어줌
+"""
+
+import itertools
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+from loguru import logger
+
+from src.core.config_manager import ConfigManager
+
+
+class CommandTimeoutError(Exception):
+    """명령이 마감 시각을 넘겨 브라우저를 종료한 경우"""
+
+
+class CommandWatchdog:
+    """드라이버 명령 마감 감시
+
+    시간 초과가 발생하면 tripped 가 True 가 되고 이후 같은 드라이버의 모든 명령은 즉시
+    CommandTimeoutError 를 발생시킨다. 호출 측은 브라우저를 다시 띄우고 해당 건을 재시도한다.
+    """
+
+    def __init__(self, command_timeout: float = 60.0, step_budgets: Optional[Dict[str, float]] = None,
+                 default_step_budget: Optional[float] = None, poll_interval: float = 0.5):
+        self.command_timeout = float(command_timeout)
+        self.step_budgets = step_budgets or {}
+        self.default_step_budget = default_step_budget
+        self.poll_interval = poll_interval
+        self.driver = None
+        self.tripped = False
+        self.trip_reason = ''
+        self._step = 'setup'
+        self._step_deadline: Optional[float] = None
+        # 호출 번호 -> (마감 시각, 명령, 단계)
+        self._active: Dict[int, Tuple[float, str, str]] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._monitor: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["CommandWatchdog"]:
+        """watchdog 설정으로 생성 (비활성 시 None)"""
+        settings = ConfigManager.get_value(config, 'watchdog', {}) or {}
+        if not settings.get('enabled', False):
+            return None
+        return cls(
+            command_timeout=settings.get('command_timeout', 60),
+            step_budgets=settings.get('step_budgets', {}) or {},
+            default_step_budget=settings.get('default_step_budget'),
+            poll_interval=settings.get('poll_interval', 0.5)
+        )
+
+    def attach(self, driver) -> None:
+        """새 드라이버의 execute 를 감시 래퍼로 교체하고 상태 초기화"""
+        with self._lock:
+            self.driver = driver
+            self.tripped = False
+            self.trip_reason = ''
+            self._active.clear()
+
+        if getattr(driver, '_rpa_command_watchdog', None) is not self:
+            original_execute = driver.execute
+            watchdog = self
+
+            def guarded_execute(driver_command, params=None):
+                call_id = watchdog._begin(driver, driver_command)
+                try:
+                    return original_execute(driver_command, params)
+                except Exception as e:
+                    if watchdog.tripped and watchdog.driver is driver:
+                        raise CommandTimeoutError(watchdog.trip_reason) from e
+                    raise
+                finally:
+                    watchdog._end(call_id)
+
+            driver.execute = guarded_execute
+            driver._rpa_command_watchdog = self
+
+        if self._monitor is None or not self._monitor.is_alive():
+            self._stop.clear()
+            self._monitor = threading.Thread(target=self._run_monitor, name='command-watchdog', daemon=True)
+            self._monitor.start()
+        logger.info(f"WebDriver 명령 감시기 연결 완료 (명령 한도 {self.command_timeout}초)")
+
+    def set_step(self, step: str) -> None:
+        """현재 단계와 단계 예산 마감 시각 설정"""
+        budget = self.step_budgets.get(step, self.default_step_budget)
+        with self._lock:
+            self._step = step
+            self._step_deadline = time.time() + float(budget) if budget else None
+
+    def _begin(self, driver, command: str) -> int:
+        if self.tripped and self.driver is driver:
+            raise CommandTimeoutError(self.trip_reason)
+
+        now = time.time()
+        with self._lock:
+            step, step_deadline = self._step, self._step_deadline
+        if step_deadline is not None and now >= step_deadline:
+            self._trip(f"단계 예산 초과: {step} ({command})")
+            raise CommandTimeoutError(self.trip_reason)
+
+        deadline = now + self.command_timeout
+        if step_deadline is not None:
+            deadline = min(deadline, step_deadline)
+        call_id = next(self._counter)
+        with self._lock:
+            self._active[call_id] = (deadline, command, step)
+        return call_id
+
+    def _end(self, call_id: int) -> None:
+        with self._lock:
+            self._active.pop(call_id, None)
+
+    def _run_monitor(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            now = time.time()
+            with self._lock:
+                expired = [(command, step) for deadline, command, step in self._active.values() if now >= deadline]
+            if expired and not self.tripped:
+                command, step = expired[0]
+                self._trip(f"명령 시간 초과: {command} (단계 {step})")
+
+    def _trip(self, reason: str) -> None:
+        """브라우저/드라이버 프로세스를 종료하여 멈춘 HTTP 호출을 끊음"""
+        with self._lock:
+            if self.tripped:
+                return
+            self.tripped = True
+            self.trip_reason = reason
+            driver = self.driver
+
+        logger.error(f"WebDriver 감시기 작동 - {reason}, 브라우저를 강제 종료합니다")
+        self.kill_driver(driver)
+
+    @staticmethod
+    def kill_driver(driver) -> None:
+        """chromedriver 와 하위 브라우저 프로세스 트리 강제 종료"""
+        if driver is None:
+            return
+        try:
+            service_process = driver.service.process
+        except Exception:
+            service_process = None
+        if service_process is None:
+            return
+
+        try:
+            import psutil
+            from src.core.browser_supervisor import BrowserSupervisor
+            BrowserSupervisor.kill_tree(psutil.Process(service_process.pid))
+        except ImportError:
+            # psutil 이 없으면 chromedriver 만 종료 (남은 브라우저는 다음 시작 시 고아 정리 대상)
+            try:
+                service_process.kill()
+            except Exception:
+                pass
+        except Exception as e:
+            logger.warning(f"브라우저 강제 종료 중 경고: {e}")
+
+    def consume_trip(self) -> Optional[str]:
+        """시간 초과가 있었으면 사유를 반환하고 다음 드라이버를 위해 상태 초기화"""
+        with self._lock:
+            if not self.tripped:
+                return None
+            reason = self.trip_reason
+            self.tripped = False
+            self.trip_reason = ''
+            self.driver = None
+            return reason
+
+    def close(self) -> None:
+        """감시 스레드 종료"""
+        self._stop.set()
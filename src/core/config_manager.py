@@ -92,6 +92,16 @@ class ConfigManager:
             
         return deep_merge(merged, website_config)
         
+    @staticmethod
+    def get_value(config: Dict[str, Any], key: str, default: Any = None) -> Any:
+        """점(.)으로 구분된 키로 중첩 설정 값 조회 (예: 'browser.headless')"""
+        value: Any = config
+        for part in key.split('.'):
+            if not isinstance(value, dict) or part not in value:
+                return default
+            value = value[part]
+        return value
+        
     def get_website_registry(self) -> Dict[str, Any]:
         """웹사이트 레지스트리 반환"""
         return self.website_registry
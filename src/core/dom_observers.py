@@ -0,0 +1,231 @@
+"""
+DOM 옵저버 기반 대기 도우미
+고정 sleep 과 반복 폴링 대신 페이지 내 IntersectionObserver/MutationObserver 프로미스를
+execute_async_script 로 한 번에 기다림
+"""
+
+from typing import Dict, Any, List, Optional
+from loguru import logger
+
+
+SCROLL_INTO_VIEW_SCRIPT = """
+    var element = arguments[0];
+    var timeoutMs = arguments[1];
+    var done = arguments[arguments.length - 1];
+
+    element.scrollIntoView({block: 'center', inline: 'nearest'});
+
+    function fullyVisible(rect, rootHeight, rootWidth) {
+        // 뷰포트보다 큰 요소는 일부만 보여도 보이는 것으로 간주
+        var fitsHeight = rect.height > rootHeight || (rect.top >= 0 && rect.bottom <= rootHeight);
+        var fitsWidth = rect.width > rootWidth || (rect.left >= 0 && rect.right <= rootWidth);
+        return fitsHeight && fitsWidth;
+    }
+
+    if (!('IntersectionObserver' in window)) {
+        done(fullyVisible(element.getBoundingClientRect(), window.innerHeight, window.innerWidth));
+        return;
+    }
+
+    var observer = new IntersectionObserver(function(entries) {
+        entries.forEach(function(entry) {
+            var root = entry.rootBounds || {height: window.innerHeight, width: window.innerWidth};
+            if (entry.isIntersecting && fullyVisible(entry.boundingClientRect, root.height, root.width)) {
+                clearTimeout(timer);
+                observer.disconnect();
+                done(true);
+            }
+        });
+    }, {threshold: [0, 0.25, 0.5, 0.75, 1]});
+
+    var timer = setTimeout(function() {
+        observer.disconnect();
+        done(false);
+    }, timeoutMs);
+
+    observer.observe(element);
+"""
+
+WATCH_ADDED_SCRIPT = """
+    var key = arguments[0];
+    var container = arguments[1];
+    var selector = arguments[2];
+    var registry = window.__rpaAddedNodeWatchers = window.__rpaAddedNodeWatchers || {};
+    var watcher = registry[key];
+
+    // 같은 컨테이너에 이미 설치되어 있으면 재사용 (SPA 재렌더링으로 컨테이너가 바뀐 경우만 재설치)
+    if (watcher && watcher.container === container && container.isConnected) return true;
+    if (watcher) watcher.observer.disconnect();
+
+    watcher = registry[key] = {container: container, queue: [], waiter: null};
+    watcher.observer = new MutationObserver(function(mutations) {
+        mutations.forEach(function(mutation) {
+            mutation.addedNodes.forEach(function(node) {
+                if (node.nodeType !== 1) return;
+                var matches = node.matches(selector) ? [node] : Array.from(node.querySelectorAll(selector));
+                matches.forEach(function(match) {
+                    if (watcher.waiter) watcher.waiter(match);
+                    else watcher.queue.push(match);
+                });
+            });
+        });
+    });
+    watcher.observer.observe(container, {childList: true, subtree: true});
+    return true;
+"""
+
+CLICK_AND_WAIT_ADDED_SCRIPT = """
+    var key = arguments[0];
+    var target = arguments[1];
+    var timeoutMs = arguments[2];
+    var done = arguments[arguments.length - 1];
+    var watcher = (window.__rpaAddedNodeWatchers || {})[key];
+
+    if (!watcher || !watcher.container.isConnected) {
+        done({clicked: false, node: null});
+        return;
+    }
+
+    watcher.queue = [];
+    var timer = setTimeout(function() {
+        watcher.waiter = null;
+        done({clicked: true, node: null});
+    }, timeoutMs);
+    watcher.waiter = function(node) {
+        clearTimeout(timer);
+        watcher.waiter = null;
+        done({clicked: true, node: node});
+    };
+
+    target.scrollIntoView({block: 'center'});
+    target.click();
+"""
+
+WATCH_FIELDS_SCRIPT = """
+    var key = arguments[0];
+    var elements = arguments[1];
+    var labels = arguments[2];
+    var registry = window.__rpaFieldWatchers = window.__rpaFieldWatchers || {};
+    if (registry[key]) registry[key].dispose();
+
+    var watcher = {changes: [], fields: []};
+
+    function record(field, trigger) {
+        var value = field.element.value;
+        if (value === field.last) return;
+        watcher.changes.push({
+            time: new Date().toISOString(),
+            field: field.label,
+            old: field.last,
+            new: value,
+            trigger: trigger
+        });
+        field.last = value;
+    }
+
+    elements.forEach(function(element, index) {
+        var descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value');
+        var field = {element: element, label: labels[index] || ('field_' + index), last: element.value, handlers: []};
+        watcher.fields.push(field);
+
+        // 이벤트 없이 값을 바꾸는 스크립트/재렌더링도 기록하도록 value 프로퍼티 setter 를 감쌈
+        Object.defineProperty(element, 'value', {
+            configurable: true,
+            get: function() { return descriptor.get.call(this); },
+            set: function(value) { descriptor.set.call(this, value); record(field, 'property'); }
+        });
+
+        ['input', 'change'].forEach(function(type) {
+            var handler = function() { record(field, 'event:' + type); };
+            element.addEventListener(type, handler, true);
+            field.handlers.push([type, handler]);
+        });
+    });
+
+    watcher.observer = new MutationObserver(function(mutations) {
+        mutations.forEach(function(mutation) {
+            watcher.fields.forEach(function(field) {
+                if (field.element === mutation.target) record(field, 'attribute');
+            });
+        });
+    });
+    elements.forEach(function(element) {
+        watcher.observer.observe(element, {attributes: true, attributeFilter: ['value']});
+    });
+
+    watcher.dispose = function() {
+        watcher.observer.disconnect();
+        watcher.fields.forEach(function(field) {
+            delete field.element.value;
+            field.handlers.forEach(function(pair) { field.element.removeEventListener(pair[0], pair[1], true); });
+        });
+    };
+
+    registry[key] = watcher;
+    return watcher.fields.map(function(field) { return {label: field.label, value: field.last}; });
+"""
+
+DRAIN_FIELDS_SCRIPT = """
+    var watcher = (window.__rpaFieldWatchers || {})[arguments[0]];
+    if (!watcher) return null;
+    var result = {changes: watcher.changes.slice(), values: {}, detached: []};
+    watcher.fields.forEach(function(field) {
+        result.values[field.label] = field.element.value;
+        if (!field.element.isConnected) result.detached.push(field.label);
+    });
+    if (arguments[1]) watcher.changes = [];
+    return result;
+"""
+
+
+class DomObservers:
+    """옵저버 기반 대기 함수 모음"""
+
+    @staticmethod
+    def scroll_into_view_and_wait(driver, element, timeout: float = 2.0) -> bool:
+        """요소를 화면 중앙으로 한 번 스크롤하고 실제로 뷰포트에 들어올 때까지 대기"""
+        try:
+            return bool(driver.execute_async_script(SCROLL_INTO_VIEW_SCRIPT, element, int(timeout * 1000)))
+        except Exception as e:
+            logger.warning(f"IntersectionObserver 가시성 대기 실패: {e}")
+            return False
+
+    @staticmethod
+    def watch_added(driver, key: str, container, selector: str) -> bool:
+        """컨테이너에 MutationObserver 설치 (key 당 한 번) - selector 와 일치하는 추가 노드를 수집"""
+        try:
+            return bool(driver.execute_script(WATCH_ADDED_SCRIPT, key, container, selector))
+        except Exception as e:
+            logger.warning(f"MutationObserver 설치 실패 ({key}): {e}")
+            return False
+
+    @staticmethod
+    def click_and_wait_added(driver, key: str, target, timeout: float = 5.0) -> Dict[str, Any]:
+        """요소를 클릭하고 watch_added 로 감시 중인 컨테이너에 새 노드가 붙을 때까지 대기
+
+        반환값: {'clicked': 클릭 수행 여부, 'node': 추가된 요소 (시간 초과 시 None)}
+        """
+        try:
+            result = driver.execute_async_script(CLICK_AND_WAIT_ADDED_SCRIPT, key, target, int(timeout * 1000))
+            return result or {'clicked': False, 'node': None}
+        except Exception as e:
+            logger.warning(f"노드 추가 대기 실패 ({key}): {e}")
+            return {'clicked': False, 'node': None}
+
+    @staticmethod
+    def watch_fields(driver, key: str, elements: List[Any], labels: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """입력 필드 값 변경 감시기 설치 - 변경마다 시각, 이전/이후 값, 발생 원인(이벤트/프로퍼티/속성)을 기록"""
+        try:
+            return driver.execute_script(WATCH_FIELDS_SCRIPT, key, elements, labels)
+        except Exception as e:
+            logger.warning(f"필드 감시기 설치 실패 ({key}): {e}")
+            return None
+
+    @staticmethod
+    def drain_field_changes(driver, key: str, clear: bool = True) -> Optional[Dict[str, Any]]:
+        """감시기에 쌓인 변경 기록과 현재 값을 한 번에 조회 (clear=False 이면 기록 유지)"""
+        try:
+            return driver.execute_script(DRAIN_FIELDS_SCRIPT, key, clear)
+        except Exception as e:
+            logger.warning(f"필드 변경 기록 조회 실패 ({key}): {e}")
+            return None
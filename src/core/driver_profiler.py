@@ -0,0 +1,145 @@
+"""
+웹드라이버 명령 프로파일러
+모든 WebDriver 명령(chromedriver HTTP 호출)의 횟수와 소요 시간을
+호출한 플러그인 메서드 및 현재 단계별로 집계
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple
+from loguru import logger
+
+
+class CommandProfiler:
+    """WebDriver 명령 프로파일러
+
+    driver.execute 를 감싸서 동작한다. find_element, get_attribute,
+    execute_script, is_displayed 등 WebElement 명령도 모두 driver.execute 를
+    거치므로 호출부 코드를 수정하지 않고 전체 왕복 횟수를 측정할 수 있다.
+    """
+
+    def __init__(self, report_dir: str = "logs/profiling", top_n: int = 20,
+                 source_marker: str = "websites"):
+        self.report_dir = Path(report_dir)
+        self.top_n = top_n
+        self.source_marker = f"{os.sep}{source_marker}{os.sep}"
+        self.current_step = "setup"
+        self.started_at = datetime.now()
+        # (단계, 호출 위치, 명령) -> [호출 횟수, 누적 시간(초)]
+        self._stats: Dict[Tuple[str, str, str], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, driver) -> None:
+        """드라이버 인스턴스의 execute 메서드를 프로파일링 래퍼로 교체"""
+        if getattr(driver, '_rpa_command_profiler', None) is self:
+            return
+
+        original_execute = driver.execute
+        profiler = self
+
+        def profiled_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                profiler.record(driver_command, time.perf_counter() - start)
+
+        driver.execute = profiled_execute
+        driver._rpa_command_profiler = self
+        logger.info("WebDriver 명령 프로파일러 연결 완료")
+
+    def set_step(self, step: str) -> None:
+        """현재 자동화 단계 설정"""
+        self.current_step = step
+
+    def record(self, command: str, elapsed: float) -> None:
+        """명령 1건 기록"""
+        key = (self.current_step, self._find_call_site(), command)
+        with self._lock:
+            entry = self._stats.setdefault(key, [0, 0.0])
+            entry[0] += 1
+            entry[1] += elapsed
+
+    def _find_call_site(self) -> str:
+        """호출 스택에서 가장 안쪽의 플러그인 메서드를 찾아 '클래스.메서드' 형태로 반환"""
+        frame = sys._getframe(2)
+        while frame is not None:
+            if self.source_marker in frame.f_code.co_filename:
+                owner = frame.f_locals.get('self')
+                name = frame.f_code.co_name
+                if owner is not None:
+                    return f"{type(owner).__name__}.{name}"
+                return name
+            frame = frame.f_back
+        return "<core>"
+
+    def _aggregate(self, index: int) -> List[Dict[str, Any]]:
+        """지정한 키 위치(0=단계, 1=호출 위치, 2=명령) 기준으로 집계"""
+        totals: Dict[str, List[float]] = {}
+        with self._lock:
+            for key, (count, elapsed) in self._stats.items():
+                entry = totals.setdefault(key[index], [0, 0.0])
+                entry[0] += count
+                entry[1] += elapsed
+        return [
+            {
+                'name': name,
+                'count': int(count),
+                'total_ms': round(elapsed * 1000, 1),
+                'avg_ms': round(elapsed * 1000 / count, 2) if count else 0.0
+            }
+            for name, (count, elapsed) in totals.items()
+        ]
+
+    def build_report(self) -> Dict[str, Any]:
+        """실행 단위 리포트 생성"""
+        call_sites = self._aggregate(1)
+        with self._lock:
+            details = [
+                {
+                    'step': step,
+                    'call_site': call_site,
+                    'command': command,
+                    'count': int(count),
+                    'total_ms': round(elapsed * 1000, 1)
+                }
+                for (step, call_site, command), (count, elapsed) in self._stats.items()
+            ]
+
+        return {
+            'started_at': self.started_at.isoformat(),
+            'finished_at': datetime.now().isoformat(),
+            'total_commands': sum(item['count'] for item in call_sites),
+            'total_ms': round(sum(item['total_ms'] for item in call_sites), 1),
+            'top_call_sites_by_count': sorted(call_sites, key=lambda x: x['count'], reverse=True)[:self.top_n],
+            'top_call_sites_by_time': sorted(call_sites, key=lambda x: x['total_ms'], reverse=True)[:self.top_n],
+            'steps': sorted(self._aggregate(0), key=lambda x: x['total_ms'], reverse=True),
+            'commands': sorted(self._aggregate(2), key=lambda x: x['count'], reverse=True),
+            'details': sorted(details, key=lambda x: x['total_ms'], reverse=True)
+        }
+
+    def write_report(self, name: str = "run") -> Optional[str]:
+        """리포트를 JSON 파일로 저장하고 상위 호출 위치를 로그로 출력"""
+        try:
+            report = self.build_report()
+            self.report_dir.mkdir(parents=True, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            report_path = self.report_dir / f"{name}_webdriver_commands_{timestamp}.json"
+
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+
+            logger.info(f"=== WebDriver 명령 프로파일 ({report['total_commands']}건, {report['total_ms']}ms) ===")
+            for item in report['top_call_sites_by_count'][:10]:
+                logger.info(f"  {item['name']}: {item['count']}건, {item['total_ms']}ms (평균 {item['avg_ms']}ms)")
+            logger.info(f"프로파일 리포트 저장 완료: {report_path}")
+            return str(report_path)
+
+        except Exception as e:
+            logger.error(f"프로파일 리포트 저장 오류: {e}")
+            return None
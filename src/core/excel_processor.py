@@ -226,6 +226,98 @@ class ExcelProcessor:
             logger.error(f"방문객 정보 읽기 오류: {e}")
             return []
             
+    def read_visit_requests(self, filename: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        방문신청 블록 전체를 읽어서 반환 (신청자 행 + 해당 방문객정보 블록)
+        
+        시트는 '방문사업장' 헤더 행 → 신청자 행 → '방문객정보' 행 → 방문객 행들 의 블록이 반복되는 구조
+        
+        Args:
+            filename: 읽을 엑셀 파일명 (None이면 input 폴더의 첫 번째 파일)
+            
+        Returns:
+            List[Dict]: [{'applicant': 신청자 데이터, 'visitors': 방문객 데이터 리스트}, ...]
+        """
+        try:
+            if filename is None:
+                excel_files = list(self.input_folder.glob("*.xlsx"))
+                if not excel_files:
+                    logger.error(f"엑셀 파일을 찾을 수 없습니다: {self.input_folder}")
+                    return []
+                filename = excel_files[0].name
+                
+            file_path = self.input_folder / filename
+            if not file_path.exists():
+                logger.error(f"엑셀 파일이 존재하지 않습니다: {file_path}")
+                return []
+                
+            logger.info(f"방문신청 블록 읽기 시작: {filename}")
+            
+            df = pd.read_excel(file_path, header=None)
+            rows = [['' if pd.isna(value) else value for value in row] for row in df.itertuples(index=False)]
+            requests = self.parse_visit_request_rows(rows)
+            
+            total_visitors = sum(len(request['visitors']) for request in requests)
+            logger.info(f"방문신청 블록 읽기 완료: {len(requests)}건, 방문객 {total_visitors}명")
+            return requests
+            
+        except Exception as e:
+            logger.error(f"방문신청 블록 읽기 오류: {e}")
+            return []
+            
+    @staticmethod
+    def parse_visit_request_rows(rows: List[List[Any]]) -> List[Dict[str, Any]]:
+        """
+        시트 행 목록(빈 칸은 '')을 방문신청 블록 목록으로 변환
+        
+        '방문사업장' 헤더 다음의 데이터 행은 각각 별도 신청자(방문신청)가 되고,
+        '방문객정보' 행 아래의 방문객 행들은 바로 앞 신청자에 속한다.
+        """
+        visitor_columns = ['번호', '성명', '휴대폰번호', '차종', '차량번호']
+        requests = []
+        header = None
+        current = None
+        in_visitors = False
+        
+        for row_no, values in enumerate(rows, start=1):
+            values = list(values)
+            texts = [str(value).strip() for value in values]
+            if not any(texts):
+                continue
+            
+            # 새 방문신청 블록 시작 (헤더 행)
+            if '방문사업장' in texts:
+                header = texts
+                current = None
+                in_visitors = False
+                continue
+            
+            # 방문객정보 구간 시작
+            if any('방문객정보' in text for text in texts):
+                in_visitors = current is not None
+                continue
+            
+            if header is None:
+                continue
+            
+            if not in_visitors:
+                # 헤더 아래의 데이터 행은 각각 신청자 행 (방문객은 마지막 신청자의 방문객정보 블록에 속함)
+                if current is not None:
+                    logger.warning(f"{row_no}행: 방문객정보 블록 없이 신청자 행이 이어집니다. "
+                                   f"앞 신청자({current['applicant'].get('신청자', '')})는 방문객 없이 처리합니다")
+                applicant = {name: value for name, value in zip(header, values) if name}
+                current = {'applicant': applicant, 'visitors': []}
+                requests.append(current)
+                continue
+            
+            visitor = dict(zip(visitor_columns, values))
+            name = str(visitor.get('성명', '')).strip()
+            if not name or name == '성명':
+                continue
+            current['visitors'].append(visitor)
+        
+        return requests
+            
     def debug_visitor_structure(self, visitor_data: List[Dict[str, Any]]) -> None:
         """방문객 데이터 구조 디버깅"""
         try:
@@ -0,0 +1,119 @@
+"""
+폼 스키마 추출기
+한 번의 스크립트 호출로 폼의 모든 입력 필드(name, id, 라벨, 타입, 안정적인 locator)를 수집
+"""
+
+from typing import Dict, Any, Optional, List
+from loguru import logger
+
+
+SCHEMA_SCRIPT = """
+    var root = arguments[0] ? document.querySelector(arguments[0]) : document;
+    if (!root) return [];
+    // 자동 생성 id (예: mui-12, :r3:) 는 렌더링마다 바뀌므로 locator 로 사용하지 않음
+    var unstableId = /^(mui-\\d+|:r[0-9a-z]+:|\\d+)$/;
+
+    function cssEscape(value) {
+        return window.CSS && CSS.escape ? CSS.escape(value) : value.replace(/(["\\\\])/g, '\\\\$1');
+    }
+
+    function labelOf(element) {
+        if (element.id) {
+            var byFor = document.querySelector('label[for="' + cssEscape(element.id) + '"]');
+            if (byFor && byFor.innerText.trim()) return byFor.innerText.trim();
+        }
+        var wrapping = element.closest('label');
+        if (wrapping && wrapping.innerText.trim()) return wrapping.innerText.trim();
+        var labelledBy = element.getAttribute('aria-labelledby');
+        if (labelledBy) {
+            var labelElement = document.getElementById(labelledBy.split(' ')[0]);
+            if (labelElement && labelElement.innerText.trim()) return labelElement.innerText.trim();
+        }
+        var control = element.closest('.MuiFormControl-root, .form-group, td, li');
+        if (control) {
+            var inner = control.querySelector('label, .MuiFormLabel-root');
+            if (inner && inner.innerText.trim()) return inner.innerText.trim();
+            var previous = control.previousElementSibling;
+            if (previous && previous.innerText && previous.innerText.trim().length < 40) return previous.innerText.trim();
+        }
+        return element.getAttribute('aria-label') || element.getAttribute('placeholder') || '';
+    }
+
+    function locatorOf(element) {
+        var tag = element.tagName.toLowerCase();
+        var name = element.getAttribute('name');
+        if (name && document.querySelectorAll(tag + '[name="' + cssEscape(name) + '"]').length === 1) {
+            return tag + '[name="' + name + '"]';
+        }
+        if (element.id && !unstableId.test(element.id)) {
+            return '#' + cssEscape(element.id);
+        }
+        var path = [];
+        var node = element;
+        while (node && node.nodeType === 1 && node !== document.body) {
+            var index = 1, sibling = node;
+            while ((sibling = sibling.previousElementSibling)) {
+                if (sibling.tagName === node.tagName) index++;
+            }
+            path.unshift(node.tagName.toLowerCase() + ':nth-of-type(' + index + ')');
+            node = node.parentElement;
+        }
+        return 'body > ' + path.join(' > ');
+    }
+
+    var fields = root.querySelectorAll('input:not([type="hidden"]), textarea, select, [role="button"][id^="mui-component-select-"]');
+    return Array.from(fields).map(function(element) {
+        return {
+            name: element.getAttribute('name') || element.id.replace('mui-component-select-', '') || '',
+            id: element.id || '',
+            label: labelOf(element).replace(/\\s*\\*\\s*$/, ''),
+            type: element.getAttribute('type') || element.tagName.toLowerCase(),
+            tag: element.tagName.toLowerCase(),
+            placeholder: element.getAttribute('placeholder') || '',
+            visible: !!(element.offsetWidth || element.offsetHeight || element.getClientRects().length),
+            locator: locatorOf(element)
+        };
+    });
+"""
+
+
+class FormSchema:
+    """폼 스키마 (name/라벨 → 필드 정보 인덱스)"""
+
+    def __init__(self, fields: List[Dict[str, Any]]):
+        self.fields = fields
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        self._by_label: Dict[str, Dict[str, Any]] = {}
+        for field in fields:
+            if field.get('name'):
+                self._by_name.setdefault(field['name'], field)
+            if field.get('label'):
+                self._by_label.setdefault(field['label'], field)
+
+    @classmethod
+    def extract(cls, driver, root_selector: Optional[str] = None) -> Optional["FormSchema"]:
+        """현재 페이지에서 스키마 추출 (스크립트 호출 1회)"""
+        try:
+            fields = driver.execute_script(SCHEMA_SCRIPT, root_selector)
+            if not fields:
+                logger.warning("폼 스키마 추출 결과가 비어 있습니다")
+                return None
+            logger.info(f"폼 스키마 추출 완료: 필드 {len(fields)}개")
+            return cls(fields)
+        except Exception as e:
+            logger.error(f"폼 스키마 추출 오류: {e}")
+            return None
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def field(self, key: str) -> Optional[Dict[str, Any]]:
+        """name 또는 라벨 텍스트로 필드 조회"""
+        return self._by_name.get(key) or self._by_label.get(key)
+
+    def locator(self, key: str) -> Optional[str]:
+        field = self.field(key)
+        return field['locator'] if field else None
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return list(self.fields)
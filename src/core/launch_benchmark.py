@@ -0,0 +1,125 @@
+"""
+Chrome 실행 프로파일 벤치마크
+프로파일별로 브라우저를 여러 번 띄워 시작 시간, 첫 페이지 로드 시간, 브라우저 프로세스 메모리를 측정하고
+호스트별로 알맞은 프로파일을 고를 수 있도록 JSON 리포트로 저장
+"""
+
+import copy
+import json
+import platform
+import statistics
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+from loguru import logger
+
+from src.core.config_manager import ConfigManager
+from src.core.web_driver_manager import WebDriverManager
+
+
+class LaunchBenchmark:
+    """실행 프로파일별 시작 시간/메모리 측정"""
+
+    def __init__(self, config: Dict[str, Any], report_dir: str = "logs/profiling"):
+        self.config = config
+        self.report_dir = Path(report_dir)
+
+    def _profile_config(self, profile_name: str) -> Dict[str, Any]:
+        config = copy.deepcopy(self.config)
+        config.setdefault('browser', {})['launch_profile'] = profile_name
+        # 벤치마크용 브라우저는 측정 후 반드시 종료
+        profiles = config.setdefault('launch_profiles', {})
+        profiles[profile_name] = dict(profiles.get(profile_name) or {}, detach=False)
+        return config
+
+    def measure(self, profile_name: str, url: Optional[str] = None) -> Dict[str, Any]:
+        """프로파일로 브라우저 1회 실행 측정"""
+        sample = {'startup_s': None, 'page_load_s': None, 'memory_mb': None, 'error': None}
+        driver = None
+        try:
+            started = time.time()
+            driver = WebDriverManager.create_driver(self._profile_config(profile_name))
+            sample['startup_s'] = round(time.time() - started, 2)
+
+            if url:
+                started = time.time()
+                driver.get(url)
+                sample['page_load_s'] = round(time.time() - started, 2)
+
+            sample['memory_mb'] = WebDriverManager.get_browser_memory_mb(driver)
+
+        except Exception as e:
+            logger.error(f"실행 프로파일 측정 오류 ({profile_name}): {e}")
+            sample['error'] = str(e)
+
+        finally:
+            if driver:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+
+        return sample
+
+    @staticmethod
+    def _summarize(values: List[Optional[float]]) -> Optional[Dict[str, float]]:
+        values = [value for value in values if value is not None]
+        if not values:
+            return None
+        return {
+            'min': min(values),
+            'median': round(statistics.median(values), 2),
+            'max': max(values)
+        }
+
+    def run(self, profiles: Optional[List[str]] = None, url: Optional[str] = None, runs: int = 3) -> Dict[str, Any]:
+        """프로파일마다 runs 회 측정하여 요약 반환"""
+        if not profiles:
+            profiles = list((ConfigManager.get_value(self.config, 'launch_profiles', {}) or {}).keys())
+
+        results = {}
+        for profile_name in profiles:
+            logger.info(f"실행 프로파일 측정 시작: {profile_name} ({runs}회)")
+            samples = [self.measure(profile_name, url) for _ in range(max(1, int(runs)))]
+            results[profile_name] = {
+                'startup_s': self._summarize([sample['startup_s'] for sample in samples]),
+                'page_load_s': self._summarize([sample['page_load_s'] for sample in samples]),
+                'memory_mb': self._summarize([sample['memory_mb'] for sample in samples]),
+                'errors': [sample['error'] for sample in samples if sample['error']],
+                'samples': samples
+            }
+
+        return {
+            'host': {
+                'node': platform.node(),
+                'system': platform.system(),
+                'machine': platform.machine()
+            },
+            'url': url,
+            'runs': runs,
+            'profiles': results
+        }
+
+    def write_report(self, report: Dict[str, Any], name: str = "launch_profiles") -> Optional[str]:
+        """리포트를 JSON 파일로 저장하고 프로파일별 중앙값을 로그로 출력"""
+        try:
+            self.report_dir.mkdir(parents=True, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            report_path = self.report_dir / f"{name}_{timestamp}.json"
+
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+
+            logger.info(f"=== 실행 프로파일 벤치마크 ({report['host']['node']}, {report['runs']}회) ===")
+            for profile_name, result in report['profiles'].items():
+                def median(key: str) -> str:
+                    return str(result[key]['median']) if result[key] else '-'
+                logger.info(f"  {profile_name}: 시작 {median('startup_s')}초, 페이지 로드 {median('page_load_s')}초, "
+                            f"메모리 {median('memory_mb')}MB" + (f", 오류 {len(result['errors'])}건" if result['errors'] else ""))
+            logger.info(f"벤치마크 리포트 저장 완료: {report_path}")
+            return str(report_path)
+
+        except Exception as e:
+            logger.error(f"벤치마크 리포트 저장 오류: {e}")
+            return None
@@ -0,0 +1,109 @@
+"""
+드롭다운 옵션 인덱스
+한 번의 스크립트 호출로 읽은 옵션 목록(text → value/index)을 보관하고
+브라우저를 건드리지 않고 정규화/유사도 매칭을 수행
+"""
+
+import difflib
+import re
+import unicodedata
+from typing import Dict, Any, Optional, List
+
+
+# 회사명 비교 시 무시할 법인 표기 (앞/뒤에 붙은 독립 토큰일 때만 제거)
+CORPORATE_MARKERS = ['주식회사', '(주)', '(유)', '유한회사', 'co.,ltd.', 'co.,ltd', 'co.ltd', 'inc.', 'inc', 'corp.', 'corp']
+
+
+def _marker_pattern(marker: str) -> str:
+    # 표기 내부 공백 허용 (예: "co., ltd.")
+    return r'\s*'.join(re.escape(char) for char in marker)
+
+
+# 괄호 표기는 이름에 붙어 있어도 경계가 분명하므로 바로 제거, 단어 표기는 공백/쉼표로 분리된 경우만 제거
+_BRACKET_MARKERS = '|'.join(_marker_pattern(m) for m in CORPORATE_MARKERS if m.startswith('('))
+_WORD_MARKERS = '|'.join(_marker_pattern(m) for m in CORPORATE_MARKERS if not m.startswith('('))
+_LEADING_MARKER = re.compile(rf'^(?:(?:{_BRACKET_MARKERS})\s*|(?:{_WORD_MARKERS})(?:\s+|\s*,\s*))')
+_TRAILING_MARKER = re.compile(rf'(?:\s*(?:{_BRACKET_MARKERS})|(?:\s+|\s*,\s*)(?:{_WORD_MARKERS}))$')
+
+
+def normalize_option_text(text: Any) -> str:
+    """옵션 텍스트 정규화 (NFKC, 소문자, 앞/뒤 법인 표기 토큰, 공백/구두점 제거)"""
+    if text is None:
+        return ""
+    normalized = unicodedata.normalize('NFKC', str(text)).lower().strip()
+    previous = None
+    while previous != normalized:
+        previous = normalized
+        normalized = _TRAILING_MARKER.sub('', _LEADING_MARKER.sub('', normalized)).strip()
+    normalized = re.sub(r'\s+', '', normalized)
+    return re.sub(r'[\-_.,·]', '', normalized)
+
+
+class OptionIndex:
+    """옵션 목록 인덱스
+
+    entries: [{'text': 표시 텍스트, 'value': 값, 'index': 순번}, ...]
+    부분 문자열 매칭은 하지 않는다 ("전자" → "삼성전자" 같은 오선택 방지).
+    유사도 매칭은 min_fuzzy_length 글자 이상일 때만 사용하고, 최고 점수 후보가 여럿이면 모호한 이름으로 본다.
+    """
+
+    def __init__(self, entries: List[Dict[str, Any]], cutoff: float = 0.8, min_fuzzy_length: int = 4):
+        self.entries = [entry for entry in entries if str(entry.get('text', '')).strip()]
+        self.cutoff = cutoff
+        self.min_fuzzy_length = min_fuzzy_length
+        self._by_key: Dict[str, Dict[str, Any]] = {}
+        for entry in self.entries:
+            self._by_key.setdefault(normalize_option_text(entry['text']), entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def candidates(self, name: Any) -> List[Dict[str, Any]]:
+        """이름에 해당하는 옵션 후보 (정확 일치 1개, 없으면 최고 유사도 후보들)"""
+        key = normalize_option_text(name)
+        if not key:
+            return []
+
+        if key in self._by_key:
+            return [self._by_key[key]]
+
+        if len(key) < self.min_fuzzy_length:
+            return []
+        scored = []
+        for option_key in self._by_key:
+            if not option_key:
+                continue
+            ratio = difflib.SequenceMatcher(None, key, option_key).ratio()
+            if ratio >= self.cutoff:
+                scored.append((ratio, option_key))
+        if not scored:
+            return []
+        best = max(ratio for ratio, _ in scored)
+        return [self._by_key[option_key] for ratio, option_key in scored if best - ratio < 1e-9]
+
+    def match(self, name: Any) -> Optional[Dict[str, Any]]:
+        """이름에 해당하는 옵션 검색 (정확 → 유사도 순, 후보가 여럿이면 None)"""
+        found = self.candidates(name)
+        return found[0] if len(found) == 1 else None
+
+    def find_unknown(self, names: List[Any]) -> List[Any]:
+        """인덱스에서 찾을 수 없거나 모호한 이름 목록 (사전 검증용)"""
+        unknown = []
+        for name in names:
+            if name and self.match(name) is None and name not in unknown:
+                unknown.append(name)
+        return unknown
+
+    def find_ambiguous(self, names: List[Any]) -> Dict[Any, List[str]]:
+        """후보가 여럿인 이름 → 후보 옵션 텍스트 목록"""
+        ambiguous = {}
+        for name in names:
+            if not name or name in ambiguous:
+                continue
+            found = self.candidates(name)
+            if len(found) > 1:
+                ambiguous[name] = [entry['text'] for entry in found]
+        return ambiguous
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return list(self.entries)
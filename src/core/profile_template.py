@@ -0,0 +1,332 @@
+"""
+Chrome 프로필 템플릿
+첫 실행 초기화(first-run), 사이트 권한, 로케일이 끝난 user-data-dir 를 한 번 만들어 두고
+워커마다 임시 폴더에 복제본을 만들어 격리된 프로필로 빠르게 시작
+"""
+
+import copy
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+from loguru import logger
+
+from src.core.config_manager import ConfigManager
+
+
+# 실행 중인 Chrome 이 만드는 잠금/포트 파일 (복제본에 남아 있으면 새 Chrome 이 시작하지 못함)
+LOCK_FILES = ['SingletonLock', 'SingletonCookie', 'SingletonSocket', 'DevToolsActivePort', 'lockfile']
+
+# 템플릿에 남길 필요가 없는 캐시 폴더 (복제 비용만 늘어남)
+CACHE_DIRS = ['Default/Cache', 'Default/GPUCache', 'GrShaderCache', 'ShaderCache', 'Crashpad']
+
+
+class ProfileTemplate:
+    """사이트별 프로필 템플릿과 워커별 복제본 관리"""
+
+    MARKER_FILE = '.rpa_template.json'
+    # 복제본 소유 정보 (복제한 Python PID, 복제본으로 띄운 브라우저 PID)
+    CLONE_FILE = '.rpa_clone.json'
+    CLONE_PREFIX = 'rpa_profile_'
+
+    # 같은 프로세스의 여러 워커가 동시에 템플릿을 만들지 않도록 잠금
+    _build_lock = threading.Lock()
+    # 프로세스당 한 번 남은 복제본 정리
+    _clones_reaped = False
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        settings = ConfigManager.get_value(config, 'profile_template', {}) or {}
+        self.settings = settings
+        site_url = ConfigManager.get_value(config, 'website.url', '') or ''
+        name = re.sub(r'[^A-Za-z0-9_.-]', '_', urlparse(site_url).netloc or 'default')
+        self.template_dir = Path(settings.get('template_dir', './data/cache/profile_templates/')) / name
+        self.clone_root = settings.get('clone_dir') or None
+
+    @staticmethod
+    def is_enabled(config: Dict[str, Any]) -> bool:
+        return bool(ConfigManager.get_value(config, 'profile_template.enabled', False))
+
+    def _read_marker(self) -> Optional[Dict[str, Any]]:
+        marker_path = self.template_dir / self.MARKER_FILE
+        if not marker_path.exists():
+            return None
+        try:
+            with open(marker_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return None
+
+    def is_ready(self) -> bool:
+        """템플릿이 만들어져 있고 rebuild_after_days 가 지나지 않았는지 확인"""
+        marker = self._read_marker()
+        if not marker:
+            return False
+        max_age_days = self.settings.get('rebuild_after_days')
+        if max_age_days:
+            age_days = (time.time() - marker.get('built_at_ts', 0)) / 86400
+            if age_days > float(max_age_days):
+                logger.info(f"프로필 템플릿이 오래되어 다시 만듭니다: {self.template_dir} ({age_days:.1f}일)")
+                return False
+        return True
+
+    def ensure(self) -> bool:
+        """템플릿이 없으면 생성"""
+        with self._build_lock:
+            if self.is_ready():
+                return True
+            return self.build()
+
+    def build(self) -> bool:
+        """브라우저를 한 번 띄워 사이트에 접속한 뒤 종료하여 초기화가 끝난 프로필을 템플릿으로 저장"""
+        from src.core.web_driver_manager import WebDriverManager
+
+        driver = None
+        try:
+            started = time.time()
+            if self.template_dir.exists():
+                shutil.rmtree(self.template_dir, ignore_errors=True)
+            self.template_dir.mkdir(parents=True, exist_ok=True)
+
+            build_config = copy.deepcopy(self.config)
+            build_config['profile_template'] = dict(self.settings, enabled=False)
+            build_config.setdefault('browser', {}).update({
+                'headless': True,
+                'user_data_dir': str(self.template_dir.resolve())
+            })
+            build_config.setdefault('resource_blocking', {})['enabled'] = False
+            profiles = build_config.setdefault('launch_profiles', {})
+            profile_name = ConfigManager.get_value(build_config, 'browser.launch_profile', 'default') or 'default'
+            profiles[profile_name] = dict(profiles.get(profile_name) or {}, detach=False, headless=True)
+
+            logger.info(f"프로필 템플릿 생성 중: {self.template_dir}")
+            driver = WebDriverManager.create_driver(build_config)
+            browser_version = driver.capabilities.get('browserVersion', '')
+
+            site_url = ConfigManager.get_value(self.config, 'website.url')
+            if site_url:
+                driver.get(site_url)
+                self._store_locale(driver)
+
+            driver.quit()
+            driver = None
+
+            self._write_preferences()
+            self._remove_runtime_files(self.template_dir)
+
+            with open(self.template_dir / self.MARKER_FILE, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'built_at': datetime.now().isoformat(),
+                    'built_at_ts': time.time(),
+                    'site_url': site_url,
+                    'browser_version': browser_version
+                }, f, ensure_ascii=False, indent=2)
+
+            logger.info(f"프로필 템플릿 생성 완료: {self.template_dir} ({time.time() - started:.1f}초)")
+            return True
+
+        except Exception as e:
+            logger.error(f"프로필 템플릿 생성 오류: {e}")
+            return False
+
+        finally:
+            if driver:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+
+    def _store_locale(self, driver) -> None:
+        """사이트 로케일 설정(locale.local_storage/cookies)을 템플릿 프로필에 저장"""
+        locale_config = ConfigManager.get_value(self.config, 'locale', {}) or {}
+        if not locale_config.get('enabled', False):
+            return
+        try:
+            for key, value in (locale_config.get('local_storage', {}) or {}).items():
+                driver.execute_script("localStorage.setItem(arguments[0], arguments[1]);", key, str(value))
+            for name, value in (locale_config.get('cookies', {}) or {}).items():
+                driver.add_cookie({'name': name, 'value': str(value)})
+        except Exception as e:
+            logger.warning(f"템플릿 로케일 저장 실패: {e}")
+
+    def _write_preferences(self) -> None:
+        """Chrome 종료 후 Preferences 파일에 언어/사이트 권한 기본값 기록"""
+        preferences_path = self.template_dir / 'Default' / 'Preferences'
+        try:
+            preferences = {}
+            if preferences_path.exists():
+                with open(preferences_path, 'r', encoding='utf-8') as f:
+                    preferences = json.load(f)
+
+            language = self.settings.get('language')
+            if language:
+                preferences.setdefault('intl', {})['accept_languages'] = language
+
+            content_settings = self.settings.get('content_settings', {}) or {}
+            if content_settings:
+                profile = preferences.setdefault('profile', {})
+                profile.setdefault('default_content_setting_values', {}).update(content_settings)
+
+            # 다음 실행에서 "Chrome이 제대로 종료되지 않았습니다" 복원 안내가 뜨지 않도록 정상 종료로 표시
+            preferences.setdefault('profile', {})['exit_type'] = 'Normal'
+            preferences['profile']['exited_cleanly'] = True
+
+            preferences_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(preferences_path, 'w', encoding='utf-8') as f:
+                json.dump(preferences, f, ensure_ascii=False)
+
+        except Exception as e:
+            logger.warning(f"템플릿 Preferences 기록 실패: {e}")
+
+    @staticmethod
+    def _remove_runtime_files(profile_dir: Path) -> None:
+        for name in LOCK_FILES:
+            path = profile_dir / name
+            if path.is_symlink() or path.exists():
+                try:
+                    path.unlink()
+                except Exception:
+                    pass
+        for name in CACHE_DIRS:
+            shutil.rmtree(profile_dir / name, ignore_errors=True)
+
+    def _copy_tree(self, source: Path, target: Path) -> str:
+        """가능하면 copy-on-write(reflink/clonefile) 복제, 지원하지 않는 파일 시스템이면 일반 복사
+
+        Chrome 은 SQLite/LevelDB 파일을 제자리에서 수정하므로 하드링크는 템플릿을 오염시켜 사용하지 않는다.
+        """
+        system = platform.system()
+        command = None
+        if system == 'Linux':
+            command = ['cp', '-a', '--reflink=auto', f"{source}/.", str(target)]
+        elif system == 'Darwin':
+            command = ['cp', '-cR', f"{source}/", str(target)]
+
+        if command:
+            try:
+                subprocess.run(command, check=True, capture_output=True, timeout=120)
+                return ' '.join(command[:3])
+            except Exception as e:
+                logger.debug(f"copy-on-write 복제 실패, 일반 복사로 전환: {e}")
+                shutil.rmtree(target, ignore_errors=True)
+                target.mkdir(parents=True, exist_ok=True)
+
+        shutil.copytree(source, target, dirs_exist_ok=True)
+        return 'copy'
+
+    def clone(self, worker_name: str = 'worker') -> Optional[str]:
+        """템플릿 복제본을 임시 폴더에 만들어 경로 반환 (템플릿 생성 실패 시 None)"""
+        if not self.ensure():
+            return None
+        with self._build_lock:
+            if not ProfileTemplate._clones_reaped:
+                ProfileTemplate._clones_reaped = True
+                self.reap_stale_clones()
+        try:
+            started = time.time()
+            if self.clone_root:
+                Path(self.clone_root).mkdir(parents=True, exist_ok=True)
+            safe_name = re.sub(r'[^A-Za-z0-9_-]', '_', worker_name)
+            clone_dir = Path(tempfile.mkdtemp(prefix=f"{self.CLONE_PREFIX}{safe_name}_", dir=self.clone_root))
+            method = self._copy_tree(self.template_dir, clone_dir)
+            self._remove_runtime_files(clone_dir)
+            (clone_dir / self.MARKER_FILE).unlink(missing_ok=True)
+            self.mark_clone(str(clone_dir))
+            logger.info(f"프로필 복제 완료: {clone_dir} ({method}, {time.time() - started:.2f}초)")
+            return str(clone_dir)
+
+        except Exception as e:
+            logger.error(f"프로필 복제 오류: {e}")
+            return None
+
+    @classmethod
+    def mark_clone(cls, clone_dir: Optional[str], browser_pid: Optional[int] = None) -> None:
+        """복제본 소유 정보 기록 (브라우저를 띄운 뒤 browser_pid 를 다시 기록)"""
+        if not clone_dir:
+            return
+        try:
+            with open(Path(clone_dir) / cls.CLONE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'owner_pid': os.getpid(), 'browser_pid': browser_pid, 'created_at': time.time()}, f)
+        except Exception as e:
+            logger.debug(f"복제본 소유 정보 기록 실패: {e}")
+
+    @staticmethod
+    def _is_clone_in_use(clone_dir: Path, info: Dict[str, Any]) -> bool:
+        """복제본을 쓰는 브라우저(없으면 복제한 Python 프로세스)가 아직 실행 중인지 확인"""
+        # 실행 중인 Chrome 이 잡고 있는 잠금 파일 (Linux/macOS: host-PID 심볼릭 링크, Windows: 열린 lockfile)
+        singleton = clone_dir / 'SingletonLock'
+        if singleton.is_symlink():
+            lock_pid = os.readlink(singleton).rsplit('-', 1)[-1]
+            if lock_pid.isdigit():
+                try:
+                    os.kill(int(lock_pid), 0)
+                    return True
+                except OSError:
+                    pass
+        lock_file = clone_dir / 'lockfile'
+        if lock_file.exists():
+            try:
+                lock_file.unlink()
+            except OSError:
+                return True
+
+        browser_pid = info.get('browser_pid')
+        pid = browser_pid or info.get('owner_pid')
+        if not pid:
+            return False
+        try:
+            import psutil
+            process = psutil.Process(int(pid))
+            if browser_pid:
+                # PID 재사용 대비: 해당 복제본을 user-data-dir 로 쓰는 프로세스인지 확인
+                return any(arg == f"--user-data-dir={clone_dir}" for arg in process.cmdline())
+            return True
+        except ImportError:
+            try:
+                os.kill(int(pid), 0)
+                return True
+            except OSError:
+                return False
+        except Exception:
+            return False
+
+    def reap_stale_clones(self) -> int:
+        """브라우저가 이미 종료된 복제본 삭제 (유지 모드로 남겨 둔 브라우저가 닫힌 뒤 남은 폴더 등)"""
+        root = Path(self.clone_root or tempfile.gettempdir())
+        removed = 0
+        try:
+            for clone_dir in root.glob(f"{self.CLONE_PREFIX}*"):
+                info_path = clone_dir / self.CLONE_FILE
+                if not clone_dir.is_dir() or not info_path.exists():
+                    continue
+                try:
+                    with open(info_path, 'r', encoding='utf-8') as f:
+                        info = json.load(f)
+                except Exception:
+                    continue
+                if self._is_clone_in_use(clone_dir, info):
+                    continue
+                shutil.rmtree(clone_dir, ignore_errors=True)
+                removed += 1
+        except Exception as e:
+            logger.warning(f"프로필 복제본 정리 중 경고: {e}")
+        if removed:
+            logger.info(f"종료된 브라우저의 프로필 복제본 {removed}개 삭제: {root}")
+        return removed
+
+    @staticmethod
+    def release(clone_dir: Optional[str]) -> None:
+        """복제본 삭제"""
+        if not clone_dir:
+            return
+        shutil.rmtree(clone_dir, ignore_errors=True)
+        logger.info(f"프로필 복제본 삭제: {clone_dir}")
@@ -0,0 +1,166 @@
+"""
+비동기 스크린샷 파이프라인
+CDP Page.captureScreenshot 으로 촬영하고 파일 저장은 백그라운드 스레드에서 처리
+"""
+
+import base64
+import queue
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Any, Optional
+from loguru import logger
+
+
+class ScreenshotPipeline:
+    """비블로킹 스크린샷 파이프라인
+
+    촬영 정책(policy):
+    - always: 모든 촬영 요청 처리
+    - on_failure: 실패 시점(failed=True) 요청만 처리 (일반 경로 비용 0)
+    - sampled: sample_every 번째 요청마다 처리 + 실패 요청은 항상 처리
+    - off: 촬영하지 않음
+    """
+
+    POLICIES = ('always', 'on_failure', 'sampled', 'off')
+
+    def __init__(self, driver, output_dir: str = "logs/screenshots", policy: str = "on_failure",
+                 image_format: str = "jpeg", quality: int = 60, clip: Optional[Dict[str, Any]] = None,
+                 sample_every: int = 10, max_files: int = 200, queue_size: int = 50, prefix: str = "rpa"):
+        if policy not in self.POLICIES:
+            logger.warning(f"알 수 없는 스크린샷 정책 '{policy}', on_failure 로 대체합니다")
+            policy = 'on_failure'
+
+        self.driver = driver
+        self.output_dir = Path(output_dir)
+        self.policy = policy
+        self.image_format = image_format if image_format in ('jpeg', 'png', 'webp') else 'jpeg'
+        self.quality = quality
+        self.clip = clip
+        self.sample_every = max(int(sample_every), 1)
+        self.max_files = max(int(max_files), 1)
+        self.prefix = prefix
+        self._request_count = 0
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=queue_size)
+        self._written: deque = deque()
+        self._writer: Optional[threading.Thread] = None
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # 이전 실행에서 남은 파일도 링 버퍼 대상에 포함
+        existing = sorted(self.output_dir.glob(f"{self.prefix}_*"), key=lambda p: p.stat().st_mtime)
+        self._written.extend(existing)
+        self._enforce_ring_buffer()
+
+    @classmethod
+    def from_config(cls, driver, config: Dict[str, Any], prefix: str = "rpa") -> "ScreenshotPipeline":
+        """screenshots 설정 섹션으로 파이프라인 생성"""
+        return cls(
+            driver,
+            output_dir=config.get('output_dir', 'logs/screenshots'),
+            policy=config.get('policy', 'on_failure'),
+            image_format=config.get('format', 'jpeg'),
+            quality=config.get('quality', 60),
+            clip=config.get('clip'),
+            sample_every=config.get('sample_every', 10),
+            max_files=config.get('max_files', 200),
+            queue_size=config.get('queue_size', 50),
+            prefix=prefix
+        )
+
+    def _should_capture(self, failed: bool) -> bool:
+        if self.policy == 'off':
+            return False
+        if failed or self.policy == 'always':
+            return True
+        if self.policy == 'sampled':
+            self._request_count += 1
+            return self._request_count % self.sample_every == 0
+        return False
+
+    def capture(self, label: str, failed: bool = False) -> Optional[str]:
+        """촬영 요청 - 정책에 따라 촬영 후 저장 경로(예정)를 반환, 건너뛰면 None"""
+        if not self._should_capture(failed):
+            return None
+
+        try:
+            params: Dict[str, Any] = {'format': self.image_format, 'fromSurface': True}
+            if self.image_format != 'png':
+                params['quality'] = self.quality
+            if self.clip:
+                params['clip'] = {
+                    'x': self.clip.get('x', 0),
+                    'y': self.clip.get('y', 0),
+                    'width': self.clip.get('width', 1280),
+                    'height': self.clip.get('height', 720),
+                    'scale': self.clip.get('scale', 1)
+                }
+
+            result = self.driver.execute_cdp_cmd('Page.captureScreenshot', params)
+            extension = 'jpg' if self.image_format == 'jpeg' else self.image_format
+            timestamp = time.strftime("%Y%m%d_%H%M%S") + f"_{int(time.time() * 1000) % 1000:03d}"
+            suffix = "_FAILED" if failed else ""
+            path = self.output_dir / f"{self.prefix}_{timestamp}_{label}{suffix}.{extension}"
+
+            self._ensure_writer()
+            try:
+                self._queue.put_nowait((path, result.get('data', '')))
+            except queue.Full:
+                logger.warning(f"스크린샷 저장 대기열이 가득 차 건너뜁니다: {label}")
+                return None
+
+            return str(path)
+
+        except Exception as e:
+            logger.warning(f"스크린샷 촬영 실패 ({label}): {e}")
+            return None
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._write_loop, name="screenshot-writer", daemon=True)
+            self._writer.start()
+
+    def _write_loop(self) -> None:
+        """백그라운드 저장 루프 (base64 디코딩 및 디스크 쓰기)"""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                path, data = item
+                with open(path, 'wb') as f:
+                    f.write(base64.b64decode(data))
+                self._written.append(path)
+                self._enforce_ring_buffer()
+                logger.debug(f"스크린샷 저장: {path}")
+            except Exception as e:
+                logger.warning(f"스크린샷 저장 오류: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _enforce_ring_buffer(self) -> None:
+        """최대 파일 수를 넘으면 가장 오래된 파일부터 삭제"""
+        while len(self._written) > self.max_files:
+            oldest = self._written.popleft()
+            try:
+                Path(oldest).unlink()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.debug(f"오래된 스크린샷 삭제 실패: {e}")
+
+    def flush(self, timeout: float = 10.0) -> None:
+        """대기 중인 저장 작업 완료까지 대기"""
+        if self._writer is None or not self._writer.is_alive():
+            return
+        deadline = time.time() + timeout
+        while self._queue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.05)
+
+    def close(self) -> None:
+        """저장 작업 마무리 후 writer 스레드 종료"""
+        self.flush()
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=5)
+        self._writer = None
@@ -0,0 +1,195 @@
+"""
+사이트별 영속 캐시
+실행 간에 유지되어야 하는 선택자/전략 정보를 사이트 단위 JSON 파일로 보관하며
+사이트 빌드 ID가 바뀌면(재배포) 모든 항목을 무효화
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable
+from loguru import logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class SiteCache:
+    """사이트별 JSON 캐시 (빌드 ID 단위로 유효)
+
+    같은 사이트 캐시를 여러 인스턴스(브라우저 워커, 다른 프로세스)가 동시에 쓰므로
+    저장 시 파일 잠금 아래에서 파일을 다시 읽고 이 인스턴스가 바꾼 키만 반영한다.
+    """
+
+    _thread_lock = threading.Lock()
+
+    def __init__(self, site_id: str, cache_dir: str = "data/cache"):
+        self.site_id = site_id
+        self.cache_path = Path(cache_dir) / f"{site_id}.json"
+        self._data: Dict[str, Any] = {}
+        # 저장 전 변경된 키 -> 항목 (삭제는 None)
+        self._changes: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._rebound = False
+        self._cleared = False
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        """캐시 파일 로드 (없거나 손상된 경우 빈 캐시)"""
+        self._data = self._read()
+        if self._data:
+            logger.debug(f"사이트 캐시 로드: {self.cache_path}")
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            if self.cache_path.exists():
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning(f"사이트 캐시 로드 실패, 새로 시작합니다: {e}")
+        return {}
+
+    @contextmanager
+    def _locked(self):
+        """캐시 파일 잠금 (같은 프로세스의 스레드 + 다른 프로세스)"""
+        with self._thread_lock:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path.with_suffix('.lock'), 'w') as lock_file:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _merge(self, stored: Dict[str, Any]) -> Dict[str, Any]:
+        """파일의 현재 내용에 이 인스턴스의 변경분만 반영 (self._lock 보유 상태에서 호출)
+
+        파일이 다른 빌드에 연결되어 있으면 이 인스턴스가 새 빌드를 연결한 경우에만 덮어쓰고,
+        아니면 다른 워커가 연결한 빌드를 따르며 이전 빌드 기준의 변경분은 버린다.
+        """
+        if stored.get('build_id') == self._data.get('build_id'):
+            merged = dict(stored)
+            entries = {} if self._cleared else dict(stored.get('entries', {}))
+        elif self._rebound or not stored:
+            merged = {key: value for key, value in self._data.items() if key != 'entries'}
+            entries = {}
+        else:
+            if self._changes:
+                logger.debug(f"사이트 캐시가 다른 빌드({stored.get('build_id')})로 갱신되어 변경 {len(self._changes)}건을 버립니다")
+            return stored
+
+        for key, entry in self._changes.items():
+            if entry is None:
+                entries.pop(key, None)
+            else:
+                entries[key] = entry
+        merged['entries'] = entries
+        return merged
+
+    def _sync(self, key: Optional[str] = None, merge: Optional[Callable[[Any], Any]] = None) -> Any:
+        """잠금 아래에서 파일을 다시 읽어 변경분(과 key 의 merge 결과)을 병합해 저장하고 메모리 내용도 갱신"""
+        with self._locked():
+            stored = self._read()
+            with self._lock:
+                merged = self._merge(stored)
+                value = None
+                if key is not None:
+                    current = merged.get('entries', {}).get(key)
+                    value = merge(current['value'] if current else None)
+                    merged.setdefault('entries', {})[key] = {
+                        'value': value,
+                        'updated_at': datetime.now().isoformat()
+                    }
+                # 임시 파일명은 프로세스/스레드별로 구분
+                temp_path = self.cache_path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(merged, f, ensure_ascii=False, indent=2, default=str)
+                temp_path.replace(self.cache_path)
+                self._data = merged
+                self._changes = {}
+                self._rebound = self._cleared = False
+                return value
+
+    def save(self) -> None:
+        """캐시 파일 저장 (다른 워커의 변경을 유지하며 이 인스턴스가 바꾼 키만 반영, 임시 파일 작성 후 교체)"""
+        try:
+            self._sync()
+        except Exception as e:
+            logger.error(f"사이트 캐시 저장 오류: {e}")
+
+    def update(self, key: str, merge: Callable[[Any], Any]) -> Any:
+        """파일의 최신 값에 merge 를 적용하여 저장하고 결과 반환 (여러 워커가 한 키를 나눠 쓰는 경우)"""
+        try:
+            return self._sync(key, merge)
+        except Exception as e:
+            logger.error(f"사이트 캐시 저장 오류: {e}")
+            return None
+
+    @property
+    def build_id(self) -> Optional[str]:
+        return self._data.get('build_id')
+
+    def bind_build(self, build_id: Optional[str], assets: Optional[list] = None) -> bool:
+        """현재 사이트 빌드에 캐시를 연결 - 빌드가 바뀌었으면 모든 항목 삭제 후 True 반환"""
+        if not build_id:
+            return False
+
+        previous = self._data.get('build_id')
+        if previous == build_id:
+            return False
+
+        with self._lock:
+            invalidated = len(self._data.get('entries', {}))
+            self._data = {
+                'build_id': build_id,
+                'build_assets': assets or [],
+                'bound_at': datetime.now().isoformat(),
+                'entries': {}
+            }
+            self._changes = {}
+            self._rebound = True
+        self.save()
+
+        if previous:
+            logger.info(f"사이트 빌드 변경 감지 ({previous} → {build_id}): 캐시 {invalidated}건 무효화")
+        else:
+            logger.info(f"사이트 빌드 ID 등록: {build_id}")
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._data.get('entries', {}).get(key)
+        return entry['value'] if entry else default
+
+    def set(self, key: str, value: Any, persist: bool = True) -> None:
+        with self._lock:
+            entry = {
+                'value': value,
+                'updated_at': datetime.now().isoformat()
+            }
+            self._data.setdefault('entries', {})[key] = entry
+            self._changes[key] = entry
+        if persist:
+            self.save()
+
+    def delete(self, key: str, persist: bool = True) -> None:
+        with self._lock:
+            removed = self._data.get('entries', {}).pop(key, None)
+            if removed is not None:
+                self._changes[key] = None
+        if removed is not None and persist:
+            self.save()
+
+    def clear(self, persist: bool = True) -> None:
+        with self._lock:
+            self._data['entries'] = {}
+            self._changes = {}
+            self._cleared = True
+        if persist:
+            self.save()
@@ -0,0 +1,51 @@
+"""
+사이트 빌드 핑거프린트
+로드된 스크립트/스타일시트 URL(콘텐츠 해시 번들명)로 사이트 빌드 ID를 계산하여
+재배포 시 사이트 캐시를 자동으로 무효화
+"""
+
+import hashlib
+from typing import Dict, Any, Optional, List
+from urllib.parse import urlparse
+from loguru import logger
+
+
+FINGERPRINT_SCRIPT = """
+    var urls = [];
+    document.querySelectorAll('script[src]').forEach(function(script) { urls.push(script.src); });
+    document.querySelectorAll('link[rel="stylesheet"][href], link[rel="modulepreload"][href], link[rel="preload"][as="script"][href]')
+        .forEach(function(link) { urls.push(link.href); });
+    return { origin: window.location.origin, urls: urls };
+"""
+
+
+class SiteFingerprint:
+    """사이트 빌드 ID 계산"""
+
+    @staticmethod
+    def _normalize(urls: List[str], origin: str) -> List[str]:
+        """같은 오리진의 번들 경로만 사용 (외부 CDN/분석 스크립트는 제외), 중복 제거 후 정렬"""
+        normalized = set()
+        for url in urls:
+            parsed = urlparse(url)
+            if f"{parsed.scheme}://{parsed.netloc}" != origin:
+                continue
+            normalized.add(parsed.path + (f"?{parsed.query}" if parsed.query else ""))
+        return sorted(normalized)
+
+    @staticmethod
+    def compute(driver) -> Optional[Dict[str, Any]]:
+        """현재 페이지의 빌드 ID 계산 (스크립트 호출 1회)"""
+        try:
+            page = driver.execute_script(FINGERPRINT_SCRIPT)
+            assets = SiteFingerprint._normalize(page.get('urls', []), page.get('origin', ''))
+            if not assets:
+                logger.debug("빌드 핑거프린트용 번들 URL이 없습니다")
+                return None
+
+            digest = hashlib.sha1('\n'.join(assets).encode('utf-8')).hexdigest()[:16]
+            return {'build_id': digest, 'origin': page.get('origin'), 'assets': assets}
+
+        except Exception as e:
+            logger.warning(f"사이트 빌드 핑거프린트 계산 실패: {e}")
+            return None
@@ -0,0 +1,124 @@
+"""
+전략 메모 (다중 방법 fallback 최적화)
+(사이트 빌드, 요소 종류)별로 마지막에 성공한 방법을 기억하여 다음에는 그 방법부터 시도하고
+방법별 성공/실패 횟수를 지표로 집계
+"""
+
+import copy
+import threading
+from typing import Dict, Any, Optional, List, Callable
+from loguru import logger
+
+from src.core.site_cache import SiteCache
+
+
+class StrategyMemo:
+    """사이트 캐시에 저장되는 전략 메모
+
+    사이트 캐시는 빌드 ID에 연결되어 있으므로 재배포 시 메모도 함께 초기화된다.
+    """
+
+    CACHE_KEY = 'strategy_memo'
+
+    def __init__(self, cache: SiteCache):
+        self.cache = cache
+        self._lock = threading.Lock()
+        stored = cache.get(self.CACHE_KEY, {}) or {}
+        self._winners: Dict[str, str] = dict(stored.get('winners', {}))
+        self._metrics: Dict[str, Dict[str, Dict[str, int]]] = stored.get('metrics', {})
+        # 마지막 저장 이후 변경분 (다른 워커의 메모와 병합하여 저장)
+        self._changed_winners: Dict[str, str] = {}
+        self._metric_deltas: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self._dirty = False
+
+    def order(self, kind: str, methods: List[str]) -> List[str]:
+        """마지막 성공 방법을 맨 앞으로 옮긴 시도 순서"""
+        winner = self._winners.get(kind)
+        if winner in methods:
+            return [winner] + [method for method in methods if method != winner]
+        return list(methods)
+
+    def record(self, kind: str, method: str, success: bool) -> None:
+        """시도 결과 기록 - 성공 방법이 바뀌면 즉시 저장"""
+        with self._lock:
+            outcome = 'wins' if success else 'failures'
+            self._metrics.setdefault(kind, {}).setdefault(method, {'wins': 0, 'failures': 0})[outcome] += 1
+            self._metric_deltas.setdefault(kind, {}).setdefault(method, {'wins': 0, 'failures': 0})[outcome] += 1
+            winner_changed = success and self._winners.get(kind) != method
+            if winner_changed:
+                self._winners[kind] = method
+                self._changed_winners[kind] = method
+            self._dirty = True
+
+        if winner_changed:
+            logger.info(f"전략 메모 갱신: {kind} → {method}")
+            self.flush()
+
+    def run(self, kind: str, candidates: Dict[str, Callable[[], bool]]) -> Optional[str]:
+        """메모 순서대로 방법을 시도하여 처음 성공한 방법 이름 반환 (모두 실패 시 None)"""
+        for method in self.order(kind, list(candidates.keys())):
+            try:
+                success = bool(candidates[method]())
+            except Exception as e:
+                logger.warning(f"전략 {kind}/{method} 실행 오류: {e}")
+                success = False
+            self.record(kind, method, success)
+            if success:
+                return method
+        return None
+
+    def metrics(self) -> Dict[str, Any]:
+        """요소 종류별 방법 통계와 평균 시도 횟수"""
+        summary = {}
+        for kind, methods in self._metrics.items():
+            wins = sum(stats['wins'] for stats in methods.values())
+            attempts = sum(stats['wins'] + stats['failures'] for stats in methods.values())
+            summary[kind] = {
+                'winner': self._winners.get(kind),
+                'methods': methods,
+                'avg_attempts_per_success': round(attempts / wins, 2) if wins else None
+            }
+        return summary
+
+    @staticmethod
+    def _add_counts(metrics: Dict[str, Dict[str, Dict[str, int]]],
+                    deltas: Dict[str, Dict[str, Dict[str, int]]]) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """요소 종류/방법별 성공·실패 횟수 합산 (metrics 를 갱신하여 반환)"""
+        for kind, methods in deltas.items():
+            for method, delta in methods.items():
+                stats = metrics.setdefault(kind, {}).setdefault(method, {'wins': 0, 'failures': 0})
+                stats['wins'] += delta['wins']
+                stats['failures'] += delta['failures']
+        return metrics
+
+    def flush(self) -> None:
+        """메모와 지표를 사이트 캐시에 저장
+
+        같은 사이트의 다른 워커도 메모를 저장하므로 캐시의 최신 메모에 이 메모가 바꾼 성공 방법과
+        지표 증가분만 반영하고, 병합 결과(다른 워커의 성공 방법 포함)를 다시 읽어 온다.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            changed_winners, deltas = self._changed_winners, self._metric_deltas
+            self._changed_winners, self._metric_deltas = {}, {}
+            self._dirty = False
+
+        def merge(stored: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            stored = stored or {}
+            return {
+                'winners': {**stored.get('winners', {}), **changed_winners},
+                'metrics': self._add_counts(copy.deepcopy(stored.get('metrics', {}) or {}), deltas)
+            }
+
+        payload = self.cache.update(self.CACHE_KEY, merge)
+        with self._lock:
+            if not payload:
+                # 저장 실패 - 변경분을 되돌려 다음 저장에서 다시 시도
+                self._changed_winners = {**changed_winners, **self._changed_winners}
+                self._metric_deltas = self._add_counts(deltas, self._metric_deltas)
+                self._dirty = True
+                return
+            # 저장 중에 기록된 변경분은 다음 저장 대상이므로 병합 결과 위에 다시 적용
+            self._winners = {**payload['winners'], **self._changed_winners}
+            self._metrics = self._add_counts(copy.deepcopy(payload['metrics']), self._metric_deltas)
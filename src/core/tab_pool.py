@@ -0,0 +1,137 @@
+"""
+탭 풀 실행 모듈
+하나의 (로그인된) 브라우저에서 여러 탭을 열고 작업을 번갈아 실행하여
+한 탭의 네트워크 대기 시간 동안 다른 탭의 입력을 진행
+"""
+
+import time
+from typing import Dict, Any, Optional, List, Callable, Iterable, Generator
+from loguru import logger
+
+
+class TabWait:
+    """탭 작업이 yield 하는 대기 조건
+
+    condition 은 driver 를 받아 참 값을 반환하면 대기 종료로 간주한다.
+    조건 확인 시점에는 해당 탭으로 전환된 상태가 보장된다.
+    """
+
+    def __init__(self, condition: Callable[[Any], Any], timeout: float = 15.0, description: str = ""):
+        self.condition = condition
+        self.timeout = timeout
+        self.description = description
+        self.deadline = 0.0
+
+
+class TabPool:
+    """탭 풀 스케줄러
+
+    각 작업(task)은 제너레이터이며 대기가 필요한 지점에서 TabWait 를 yield 한다.
+    스케줄러는 탭을 순회하면서 조건이 충족된 작업만 다음 단계로 진행시키고,
+    작업이 끝난 탭에는 다음 작업을 배정한다. 제너레이터의 반환값이 작업 결과가 된다.
+    """
+
+    def __init__(self, driver, size: int = 3, poll_interval: float = 0.2,
+                 on_new_tab: Optional[Callable[[Any], Any]] = None):
+        self.driver = driver
+        self.size = max(int(size), 1)
+        self.poll_interval = poll_interval
+        # 새 탭으로 전환된 직후 호출 (탭 단위 CDP 설정 재적용 등)
+        self.on_new_tab = on_new_tab
+        self.handles: List[str] = []
+
+    def open(self) -> List[str]:
+        """현재 탭 + 추가 탭 생성"""
+        self.handles = [self.driver.current_window_handle]
+        while len(self.handles) < self.size:
+            self.driver.switch_to.new_window('tab')
+            self.handles.append(self.driver.current_window_handle)
+            if self.on_new_tab:
+                self.on_new_tab(self.driver)
+        self.driver.switch_to.window(self.handles[0])
+        logger.info(f"탭 풀 생성 완료: {len(self.handles)}개 탭")
+        return self.handles
+
+    def close(self) -> None:
+        """첫 번째 탭만 남기고 나머지 탭 닫기"""
+        try:
+            for handle in self.handles[1:]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            if self.handles:
+                self.driver.switch_to.window(self.handles[0])
+        except Exception as e:
+            logger.warning(f"탭 풀 정리 중 경고: {e}")
+        finally:
+            self.handles = self.handles[:1]
+
+    def run(self, tasks: Iterable[Callable[[], Generator]]) -> List[Any]:
+        """작업 목록 실행 - 입력 순서대로 결과 리스트 반환
+
+        tasks: 인자 없는 호출로 제너레이터를 만드는 팩토리 목록
+        작업 중 예외가 발생하면 해당 작업 결과는 {'success': False, 'reason': ...} 가 된다.
+        """
+        if not self.handles:
+            self.open()
+
+        pending = list(enumerate(tasks))
+        pending.reverse()
+        results: Dict[int, Any] = {}
+        # 탭 핸들 -> {'index', 'gen', 'wait'}
+        active: Dict[str, Dict[str, Any]] = {}
+        current_handle: Optional[str] = None
+
+        def switch_to(handle: str) -> None:
+            nonlocal current_handle
+            if current_handle != handle:
+                self.driver.switch_to.window(handle)
+                current_handle = handle
+
+        def advance(handle: str, value: Any = None) -> None:
+            slot = active[handle]
+            try:
+                wait = slot['gen'].send(value)
+                if not isinstance(wait, TabWait):
+                    wait = TabWait(lambda d: True, 0)
+                wait.deadline = time.time() + wait.timeout
+                slot['wait'] = wait
+            except StopIteration as stop:
+                results[slot['index']] = stop.value
+                del active[handle]
+            except Exception as e:
+                logger.error(f"탭 작업 {slot['index'] + 1} 실행 오류: {e}")
+                results[slot['index']] = {'success': False, 'reason': f'탭 작업 오류: {e}'}
+                del active[handle]
+
+        while pending or active:
+            # 빈 탭에 새 작업 배정
+            for handle in self.handles:
+                if handle not in active and pending:
+                    index, factory = pending.pop()
+                    switch_to(handle)
+                    active[handle] = {'index': index, 'gen': factory(), 'wait': None}
+                    advance(handle)
+
+            progressed = False
+            for handle in list(active.keys()):
+                wait: TabWait = active[handle]['wait']
+                switch_to(handle)
+                try:
+                    satisfied = wait.condition(self.driver)
+                except Exception:
+                    satisfied = False
+
+                if satisfied:
+                    advance(handle, satisfied)
+                    progressed = True
+                elif time.time() > wait.deadline:
+                    logger.warning(f"탭 작업 {active[handle]['index'] + 1} 대기 시간 초과: {wait.description}")
+                    slot = active.pop(handle)
+                    slot['gen'].close()
+                    results[slot['index']] = {'success': False, 'reason': f'대기 시간 초과: {wait.description}'}
+                    progressed = True
+
+            if active and not progressed:
+                time.sleep(self.poll_interval)
+
+        return [results.get(index) for index in range(len(results))]
@@ -0,0 +1,244 @@
+"""
+단계별 트레이싱 모듈
+단계(step) / 행(row) / 필드(field) 단위의 중첩 스팬을 기록하고
+JSON 트레이스 파일과 정적 HTML 타임라인으로 내보냄
+"""
+
+import html
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+from loguru import logger
+
+
+class Tracer:
+    """중첩 스팬 트레이서
+
+    - 단계 스팬은 별도 레인(lane)으로 순차 기록된다 (start_step 호출 시 이전 단계 종료)
+    - 일반 스팬(span)은 스레드별 스택으로 중첩되며, 열린 스팬이 없으면 현재 단계 스팬의 자식이 된다
+    - 드라이버에 연결하면 각 스팬에서 WebDriver 명령에 쓴 시간이 기록되어
+      나머지 시간(대기/sleep)이 타임라인에 구분되어 표시된다
+    """
+
+    def __init__(self, name: str = "run", trace_dir: str = "logs/traces",
+                 slow_threshold_ms: float = 3000):
+        self.name = name
+        self.trace_dir = Path(trace_dir)
+        self.slow_threshold_ms = slow_threshold_ms
+        self.started_at = datetime.now()
+        self._origin = time.perf_counter()
+        self._spans: List[Dict[str, Any]] = []
+        self._current_step: Optional[Dict[str, Any]] = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._next_id = 1
+
+    def _now_ms(self) -> float:
+        return (time.perf_counter() - self._origin) * 1000
+
+    def _stack(self) -> List[Dict[str, Any]]:
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def _new_span(self, name: str, kind: str, parent: Optional[Dict[str, Any]],
+                  attributes: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            span = {
+                'id': self._next_id,
+                'parent_id': parent['id'] if parent else None,
+                'name': name,
+                'kind': kind,
+                'thread': threading.current_thread().name,
+                'start_ms': self._now_ms(),
+                'end_ms': None,
+                'webdriver_ms': 0.0,
+                'webdriver_commands': 0,
+                'status': 'ok',
+                'attributes': dict(attributes)
+            }
+            self._next_id += 1
+            self._spans.append(span)
+        return span
+
+    def start_step(self, step: Optional[str]) -> None:
+        """현재 단계 스팬을 종료하고 새 단계 스팬 시작 (None 이면 종료만)"""
+        if self._current_step and self._current_step['end_ms'] is None:
+            self._current_step['end_ms'] = self._now_ms()
+        self._current_step = self._new_span(step, 'step', None, {}) if step else None
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """중첩 스팬 컨텍스트 매니저"""
+        stack = self._stack()
+        parent = stack[-1] if stack else self._current_step
+        span = self._new_span(name, 'span', parent, attributes)
+        if self._current_step:
+            span['attributes'].setdefault('step', self._current_step['name'])
+        stack.append(span)
+        try:
+            yield span
+        except Exception as e:
+            span['status'] = 'error'
+            span['attributes']['error'] = str(e)
+            raise
+        finally:
+            span['end_ms'] = self._now_ms()
+            if stack and stack[-1] is span:
+                stack.pop()
+
+    def annotate(self, **attributes) -> None:
+        """현재 열린 스팬(없으면 현재 단계 스팬)에 속성 추가"""
+        stack = self._stack()
+        target = stack[-1] if stack else self._current_step
+        if target is not None:
+            target['attributes'].update(attributes)
+
+    def attach(self, driver) -> None:
+        """드라이버 명령 시간을 현재 스팬에 누적하도록 execute 래핑"""
+        if getattr(driver, '_rpa_tracer', None) is self:
+            return
+
+        original_execute = driver.execute
+        tracer = self
+
+        def traced_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                stack = tracer._stack()
+                target = stack[-1] if stack else tracer._current_step
+                if target is not None:
+                    target['webdriver_ms'] += (time.perf_counter() - start) * 1000
+                    target['webdriver_commands'] += 1
+
+        driver.execute = traced_execute
+        driver._rpa_tracer = self
+
+    def _finalized_spans(self) -> List[Dict[str, Any]]:
+        """종료 시각 보정 및 자체 시간/대기 시간 계산"""
+        now = self._now_ms()
+        with self._lock:
+            spans = [dict(span, attributes=dict(span['attributes'])) for span in self._spans]
+
+        children_ms: Dict[int, float] = {}
+        for span in spans:
+            if span['end_ms'] is None:
+                span['end_ms'] = now
+                span['status'] = 'unfinished' if span['status'] == 'ok' else span['status']
+            span['duration_ms'] = round(span['end_ms'] - span['start_ms'], 1)
+            if span['parent_id'] is not None:
+                children_ms[span['parent_id']] = children_ms.get(span['parent_id'], 0.0) + span['duration_ms']
+
+        for span in spans:
+            self_ms = max(span['duration_ms'] - children_ms.get(span['id'], 0.0), 0.0)
+            span['idle_ms'] = round(max(self_ms - span['webdriver_ms'], 0.0), 1)
+            span['webdriver_ms'] = round(span['webdriver_ms'], 1)
+            span['start_ms'] = round(span['start_ms'], 1)
+            span['end_ms'] = round(span['end_ms'], 1)
+        return spans
+
+    def export(self) -> Optional[Dict[str, str]]:
+        """JSON 트레이스 파일과 HTML 타임라인 저장"""
+        try:
+            self.start_step(None)
+            spans = self._finalized_spans()
+            self.trace_dir.mkdir(parents=True, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            json_path = self.trace_dir / f"{self.name}_trace_{timestamp}.json"
+            html_path = self.trace_dir / f"{self.name}_timeline_{timestamp}.html"
+
+            trace = {
+                'name': self.name,
+                'started_at': self.started_at.isoformat(),
+                'slow_threshold_ms': self.slow_threshold_ms,
+                'spans': spans
+            }
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(trace, f, ensure_ascii=False, indent=2, default=str)
+            with open(html_path, 'w', encoding='utf-8') as f:
+                f.write(self._render_html(spans))
+
+            logger.info(f"트레이스 저장 완료: {json_path}")
+            logger.info(f"타임라인 저장 완료: {html_path}")
+            return {'json': str(json_path), 'html': str(html_path)}
+
+        except Exception as e:
+            logger.error(f"트레이스 저장 오류: {e}")
+            return None
+
+    def _render_html(self, spans: List[Dict[str, Any]]) -> str:
+        """정적 HTML 타임라인 생성 (외부 의존성 없음)"""
+        total_ms = max([span['end_ms'] for span in spans] + [1.0])
+        by_parent: Dict[Optional[int], List[Dict[str, Any]]] = {}
+        for span in spans:
+            by_parent.setdefault(span['parent_id'], []).append(span)
+
+        rows = []
+
+        def render(span: Dict[str, Any], depth: int) -> None:
+            left = span['start_ms'] / total_ms * 100
+            width = max(span['duration_ms'] / total_ms * 100, 0.05)
+            idle_ratio = span['idle_ms'] / span['duration_ms'] * 100 if span['duration_ms'] else 0
+            classes = [span['kind'], span['status']]
+            if span['duration_ms'] >= self.slow_threshold_ms:
+                classes.append('slow')
+            attrs = ', '.join(f"{k}={v}" for k, v in span['attributes'].items())
+            tooltip = html.escape(
+                f"{span['name']} {span['duration_ms']}ms "
+                f"(webdriver {span['webdriver_ms']}ms / {span['webdriver_commands']}건, 대기 {span['idle_ms']}ms) {attrs}"
+            )
+            rows.append(
+                f'<div class="row"><div class="label" style="padding-left:{depth * 14}px" title="{tooltip}">'
+                f'{html.escape(span["name"])} <small>{html.escape(attrs)}</small></div>'
+                f'<div class="track"><div class="bar {" ".join(classes)}" title="{tooltip}" '
+                f'style="left:{left:.3f}%;width:{width:.3f}%;--idle:{idle_ratio:.1f}%">'
+                f'</div></div><div class="dur">{span["duration_ms"]:.0f}ms</div></div>'
+            )
+            for child in sorted(by_parent.get(span['id'], []), key=lambda s: s['start_ms']):
+                render(child, depth + 1)
+
+        for root in sorted(by_parent.get(None, []), key=lambda s: s['start_ms']):
+            render(root, 0)
+
+        summary: Dict[str, List[float]] = {}
+        for span in spans:
+            entry = summary.setdefault(span['name'], [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += span['duration_ms']
+            entry[2] += span['idle_ms']
+        summary_rows = ''.join(
+            f"<tr><td>{html.escape(name)}</td><td>{int(count)}</td><td>{total:.0f}</td>"
+            f"<td>{total / count:.0f}</td><td>{idle:.0f}</td></tr>"
+            for name, (count, total, idle) in sorted(summary.items(), key=lambda x: x[1][1], reverse=True)
+        )
+
+        return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{html.escape(self.name)} 타임라인</title>
+<style>
+body {{ font-family: sans-serif; font-size: 12px; margin: 16px; }}
+.row {{ display: flex; align-items: center; height: 18px; border-bottom: 1px solid #f0f0f0; }}
+.label {{ width: 320px; overflow: hidden; white-space: nowrap; text-overflow: ellipsis; }}
+.label small {{ color: #888; }}
+.track {{ position: relative; flex: 1; height: 12px; background: #fafafa; }}
+.bar {{ position: absolute; height: 12px; border-radius: 2px;
+        background: linear-gradient(to right, #4a90d9 calc(100% - var(--idle)), #f5c26b calc(100% - var(--idle))); }}
+.bar.step {{ background: linear-gradient(to right, #2e6da4 calc(100% - var(--idle)), #e0a030 calc(100% - var(--idle))); }}
+.bar.slow {{ outline: 2px solid #d9534f; }}
+.bar.error {{ background: #d9534f; }}
+.dur {{ width: 80px; text-align: right; color: #555; }}
+table {{ border-collapse: collapse; margin-bottom: 16px; }}
+td, th {{ border: 1px solid #ddd; padding: 2px 8px; text-align: right; }}
+td:first-child {{ text-align: left; }}
+</style></head><body>
+<h2>{html.escape(self.name)} 실행 타임라인 ({self.started_at:%Y-%m-%d %H:%M:%S}, 총 {total_ms / 1000:.1f}s)</h2>
+<p>파란색: WebDriver 명령/하위 작업, 주황색: 대기(sleep 등) 시간, 빨간 테두리: {self.slow_threshold_ms:.0f}ms 이상</p>
+<table><tr><th>스팬</th><th>횟수</th><th>합계(ms)</th><th>평균(ms)</th><th>대기(ms)</th></tr>{summary_rows}</table>
+{''.join(rows)}
+</body></html>
+"""
@@ -5,6 +5,10 @@ Chrome 웹드라이버 설정 및 관리를 담당
 
 import os
 import platform
+import threading
+import time
+from fnmatch import fnmatch
+from typing import List, Optional
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -12,89 +16,333 @@ from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 from loguru import logger
 
+from src.core.config_manager import ConfigManager
+from src.core.profile_template import ProfileTemplate
+from src.core.browser_registry import BrowserRegistry
+from src.core.browser_supervisor import BrowserSupervisor
+
 
 class WebDriverManager:
     """웹드라이버 관리 클래스"""
     
     @staticmethod
-    def create_driver(config: dict) -> webdriver.Chrome:
-        """웹드라이버 생성"""
+    def get_launch_profile(config: dict) -> dict:
+        """browser.launch_profile 이름에 해당하는 실행 프로파일 (없으면 빈 프로파일)"""
+        name = ConfigManager.get_value(config, 'browser.launch_profile', 'default') or 'default'
+        profiles = ConfigManager.get_value(config, 'launch_profiles', {}) or {}
+        if name not in profiles:
+            if name != 'default':
+                logger.warning(f"실행 프로파일을 찾을 수 없습니다: {name} (기본 설정 사용)")
+            return {'name': 'default'}
+        return dict(profiles[name] or {}, name=name)
+    
+    @staticmethod
+    def build_options(config: dict, user_data_dir: Optional[str] = None, debug_port: Optional[int] = None) -> Options:
+        """설정과 실행 프로파일로 Chrome 옵션 생성"""
+        profile = WebDriverManager.get_launch_profile(config)
+        chrome_options = Options()
+        
+        def add_argument(argument: str) -> None:
+            if argument not in chrome_options.arguments:
+                chrome_options.add_argument(argument)
+        
+        # 프로필 폴더 (템플릿 복제본 또는 browser.user_data_dir)
+        user_data_dir = user_data_dir or ConfigManager.get_value(config, 'browser.user_data_dir')
+        if user_data_dir:
+            add_argument(f'--user-data-dir={user_data_dir}')
+        
+        if debug_port:
+            add_argument(f'--remote-debugging-port={debug_port}')
+        
+        # 페이지 로드 전략 (eager: DOMContentLoaded 시점에 반환, 이미지/폰트 로딩을 기다리지 않음)
+        chrome_options.page_load_strategy = profile.get('page_load_strategy', 'normal')
+        
+        # 헤드리스 모드 설정 (새 헤드리스 모드: 일반 Chrome 과 같은 렌더링 엔진 사용)
+        if WebDriverManager.is_headless(config):
+            add_argument('--headless=new')
+        
+        # 브라우저 창 크기 설정 (헤드리스에서는 창 크기가 곧 뷰포트 크기)
+        window_size = ConfigManager.get_value(config, 'browser.window_size', '1920x1080')
+        if isinstance(window_size, (list, tuple)):
+            window_size = ','.join(str(value) for value in window_size)
+        add_argument(f"--window-size={str(window_size).replace('x', ',')}")
+        
+        # User-Agent 설정
+        user_agent = ConfigManager.get_value(config, 'browser.user_agent',
+            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
+        add_argument(f'--user-agent={user_agent}')
+        
+        # HTTP 사이트 접속을 위한 보안 설정
+        add_argument('--ignore-certificate-errors')
+        add_argument('--ignore-ssl-errors')
+        add_argument('--ignore-certificate-errors-spki-list')
+        add_argument('--allow-running-insecure-content')
+        add_argument('--disable-web-security')
+        add_argument('--allow-cross-origin-auth-prompt')
+        
+        # 추가 옵션
+        add_argument('--no-sandbox')
+        add_argument('--disable-dev-shm-usage')
+        add_argument('--disable-gpu')
+        
+        # 탭 풀 모드: 백그라운드 탭의 타이머/렌더러 스로틀링 해제
+        if ConfigManager.get_value(config, 'tab_pool.enabled', False):
+            add_argument('--disable-background-timer-throttling')
+            add_argument('--disable-renderer-backgrounding')
+            add_argument('--disable-backgrounding-occluded-windows')
+        
+        # 실행 프로파일별 추가 플래그
+        for argument in profile.get('arguments', []) or []:
+            add_argument(argument)
+        
+        # 자동화 표시 제거 (ARM64 Mac 호환성 포함)
+        add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        
+        # 브라우저 유지를 위한 옵션 (Python 프로세스 종료 후에도 브라우저 유지)
+        if profile.get('detach', True):
+            chrome_options.add_experimental_option("detach", True)
+        
+        # 고아 프로세스 정리용 소유자 표시
+        for argument in BrowserSupervisor.owner_arguments(profile.get('detach', True)):
+            add_argument(argument)
+        
+        return chrome_options
+    
+    @staticmethod
+    def _start_chrome(chrome_options: Options) -> webdriver.Chrome:
+        """ChromeDriver 실행 (webdriver-manager 자동 설치 → ARM64 Mac 수동 경로 순)"""
         try:
-            chrome_options = Options()
+            # webdriver-manager로 자동 설치 시도
+            service = Service(ChromeDriverManager().install())
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            
+            # 브라우저 유지를 위한 추가 설정
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            return driver
+            
+        except Exception as e:
+            logger.warning(f"webdriver-manager 자동 설치 실패: {str(e)}")
             
-            # 헤드리스 모드 설정
-            if config.get('browser.headless', False):
-                chrome_options.add_argument('--headless')
+            # 수동으로 ChromeDriver 경로 지정
+            if platform.machine() == 'arm64':
+                # M1/M2 Mac용 ChromeDriver 경로
+                chromedriver_path = "/usr/local/bin/chromedriver"
+                if not os.path.exists(chromedriver_path):
+                    chromedriver_path = "/opt/homebrew/bin/chromedriver"
+                
+                if os.path.exists(chromedriver_path):
+                    service = Service(chromedriver_path)
+                    driver = webdriver.Chrome(service=service, options=chrome_options)
+                    
+                    # 브라우저 유지를 위한 추가 설정
+                    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+                    return driver
+                else:
+                    raise Exception("ChromeDriver를 찾을 수 없습니다. 수동으로 설치해주세요.")
+            else:
+                raise e
+    
+    @staticmethod
+    def attach_registered(config: dict, registry: BrowserRegistry, owner: str) -> Optional[webdriver.Chrome]:
+        """레지스트리에 등록된 유휴 브라우저에 debuggerAddress 로 연결 (없거나 실패하면 None)"""
+        entry = registry.acquire(owner)
+        if not entry:
+            return None
+        
+        try:
+            started = time.time()
+            chrome_options = Options()
+            chrome_options.page_load_strategy = WebDriverManager.get_launch_profile(config).get('page_load_strategy', 'normal')
+            chrome_options.add_experimental_option('debuggerAddress', f"{registry.host}:{entry['port']}")
+            driver = WebDriverManager._start_chrome(chrome_options)
             
-            # 브라우저 창 크기 설정
-            window_size = config.get('browser.window_size', '1920x1080')
-            chrome_options.add_argument(f'--window-size={window_size}')
+            driver.rpa_profile_dir = entry.get('profile_dir')
+            driver.rpa_session_port = entry['port']
+            driver.rpa_registry = registry
+            # 이전 실행의 로그인 세션/페이지 상태가 남아 있을 수 있음 (사이트별로 로그인 생략 판단)
+            driver.rpa_attached = True
+            WebDriverManager.apply_resource_blocking(driver, config)
             
-            # User-Agent 설정
-            user_agent = config.get('browser.user_agent', 
-                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-            chrome_options.add_argument(f'--user-agent={user_agent}')
+            logger.info(f"기존 브라우저에 연결 완료 (포트 {entry['port']}, {time.time() - started:.2f}초)")
+            return driver
             
-            # HTTP 사이트 접속을 위한 보안 설정
-            chrome_options.add_argument('--ignore-certificate-errors')
-            chrome_options.add_argument('--ignore-ssl-errors')
-            chrome_options.add_argument('--ignore-certificate-errors-spki-list')
-            chrome_options.add_argument('--allow-running-insecure-content')
-            chrome_options.add_argument('--disable-web-security')
-            chrome_options.add_argument('--allow-cross-origin-auth-prompt')
+        except Exception as e:
+            logger.warning(f"기존 브라우저 연결 실패, 새 브라우저를 실행합니다 (포트 {entry['port']}): {e}")
+            registry.unregister(entry['port'])
+            return None
+    
+    @staticmethod
+    def create_driver(config: dict, owner: Optional[str] = None) -> webdriver.Chrome:
+        """웹드라이버 생성
+        
+        owner 를 지정하고 browser_registry 가 켜져 있으면 같은 소유자의 유휴 브라우저에 먼저 연결하고,
+        새로 띄우는 유지(detach) 브라우저는 원격 디버깅 포트와 함께 레지스트리에 등록한다.
+        """
+        profile_dir = None
+        try:
+            registry = BrowserRegistry(config) if owner and BrowserRegistry.is_enabled(config) else None
+            if registry:
+                driver = WebDriverManager.attach_registered(config, registry, owner)
+                if driver:
+                    return driver
             
-            # 추가 옵션
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
+            started = time.time()
+            profile = WebDriverManager.get_launch_profile(config)
+            headless = WebDriverManager.is_headless(config)
             
-            # ARM64 Mac 호환성을 위한 추가 옵션
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
+            # 프로필 템플릿 복제본으로 시작 (워커마다 격리된 프로필)
+            if ProfileTemplate.is_enabled(config) and not ConfigManager.get_value(config, 'browser.user_data_dir'):
+                profile_dir = ProfileTemplate(config).clone(threading.current_thread().name)
             
-            # 브라우저 유지를 위한 옵션
-            chrome_options.add_experimental_option("detach", True)  # Python 프로세스 종료 후에도 브라우저 유지
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
+            # 유지 브라우저는 다음 실행에서 연결할 수 있도록 원격 디버깅 포트를 열어 둠
+            debug_port = registry.find_free_port() if registry and profile.get('detach', True) else None
+            chrome_options = WebDriverManager.build_options(config, profile_dir, debug_port)
+            driver = WebDriverManager._start_chrome(chrome_options)
             
-            try:
-                # webdriver-manager로 자동 설치 시도
-                service = Service(ChromeDriverManager().install())
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-                
-                # 브라우저 유지를 위한 추가 설정
-                driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                
-            except Exception as e:
-                logger.warning(f"webdriver-manager 자동 설치 실패: {str(e)}")
-                
-                # 수동으로 ChromeDriver 경로 지정
-                if platform.machine() == 'arm64':
-                    # M1/M2 Mac용 ChromeDriver 경로
-                    chromedriver_path = "/usr/local/bin/chromedriver"
-                    if not os.path.exists(chromedriver_path):
-                        chromedriver_path = "/opt/homebrew/bin/chromedriver"
-                    
-                    if os.path.exists(chromedriver_path):
-                        service = Service(chromedriver_path)
-                        driver = webdriver.Chrome(service=service, options=chrome_options)
-                        
-                        # 브라우저 유지를 위한 추가 설정
-                        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                    else:
-                        raise Exception("ChromeDriver를 찾을 수 없습니다. 수동으로 설치해주세요.")
-                else:
-                    raise e
+            driver.rpa_profile_dir = profile_dir
+            driver.rpa_session_port = debug_port
+            driver.rpa_registry = registry if debug_port else None
+            driver.rpa_attached = False
+            browser_pid = WebDriverManager.get_browser_pid(driver) if profile_dir or debug_port else None
+            # 유지 브라우저가 닫힌 뒤 남은 복제본은 다음 실행의 첫 복제 때 정리
+            ProfileTemplate.mark_clone(profile_dir, browser_pid)
+            if debug_port:
+                registry.register(owner, debug_port, browser_pid, profile_dir)
+            WebDriverManager.apply_resource_blocking(driver, config)
             
-            logger.info("웹드라이버 생성 완료 (브라우저 유지 모드)")
+            mode = "헤드리스 모드" if headless else "브라우저 유지 모드"
+            logger.info(f"웹드라이버 생성 완료 ({mode}, 프로파일 {profile['name']}, {time.time() - started:.2f}초)")
             return driver
             
         except Exception as e:
             logger.error(f"웹드라이버 생성 오류: {str(e)}")
+            ProfileTemplate.release(profile_dir)
             raise
     
+    @staticmethod
+    def quit_driver(driver: webdriver.Chrome) -> None:
+        """브라우저 종료 후 프로필 템플릿 복제본 삭제 및 레지스트리에서 제거"""
+        try:
+            driver.quit()
+        finally:
+            registry = getattr(driver, 'rpa_registry', None)
+            if registry:
+                registry.unregister(driver.rpa_session_port)
+            ProfileTemplate.release(getattr(driver, 'rpa_profile_dir', None))
+    
+    @staticmethod
+    def release_driver(driver: webdriver.Chrome) -> None:
+        """브라우저를 열어 둔 채 사용 완료 - 레지스트리에 유휴 상태로 반환하여 다음 실행에서 재사용"""
+        registry = getattr(driver, 'rpa_registry', None)
+        if registry:
+            registry.release(driver.rpa_session_port)
+            logger.info(f"브라우저 세션 반환: 포트 {driver.rpa_session_port}")
+    
+    @staticmethod
+    def is_headless(config: dict) -> bool:
+        """헤드리스 실행 여부 (실행 프로파일의 headless 가 있으면 browser.headless 보다 우선)"""
+        profile = WebDriverManager.get_launch_profile(config)
+        if 'headless' in profile:
+            return bool(profile['headless'])
+        return bool(ConfigManager.get_value(config, 'browser.headless', False))
+    
+    @staticmethod
+    def get_blocked_urls(config: dict) -> List[str]:
+        """차단할 URL 패턴 목록 계산
+        
+        전역 blocked_urls 에 사이트별 extra_blocked_urls 를 더하고,
+        사이트별 allowed_urls 패턴과 일치하는 차단 패턴은 제외한다.
+        """
+        settings = ConfigManager.get_value(config, 'resource_blocking', {}) or {}
+        patterns = list(settings.get('blocked_urls', []) or []) + list(settings.get('extra_blocked_urls', []) or [])
+        allowed = list(settings.get('allowed_urls', []) or [])
+        
+        blocked = []
+        for pattern in patterns:
+            if pattern in blocked:
+                continue
+            if any(pattern == allow or fnmatch(pattern, allow) for allow in allowed):
+                continue
+            blocked.append(pattern)
+        return blocked
+    
+    @staticmethod
+    def is_resource_blocking_enabled(config: dict) -> bool:
+        """리소스 차단 사용 여부 (enabled: true | false | "headless")"""
+        enabled = ConfigManager.get_value(config, 'resource_blocking.enabled', False)
+        if enabled == 'headless':
+            return WebDriverManager.is_headless(config)
+        return bool(enabled)
+    
+    @staticmethod
+    def apply_resource_blocking(driver: webdriver.Chrome, config: dict) -> bool:
+        """CDP Network.setBlockedURLs 로 이미지/폰트/외부 스크립트 요청 차단
+        
+        차단 목록은 CDP 세션(탭) 단위로 적용되므로 새 탭을 연 뒤에도 다시 호출해야 한다.
+        """
+        if not WebDriverManager.is_resource_blocking_enabled(config):
+            return False
+        
+        try:
+            blocked_urls = WebDriverManager.get_blocked_urls(config)
+            if not blocked_urls:
+                return False
+            
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_urls})
+            logger.info(f"리소스 차단 적용: 패턴 {len(blocked_urls)}개")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"리소스 차단 적용 실패: {e}")
+            return False
+    
+    @staticmethod
+    def get_browser_processes(driver: webdriver.Chrome) -> list:
+        """드라이버가 띄운 chromedriver 하위의 브라우저 프로세스 목록 (psutil 필요)"""
+        try:
+            import psutil
+        except ImportError:
+            logger.warning("psutil 이 설치되어 있지 않아 브라우저 프로세스를 조회할 수 없습니다")
+            return []
+        
+        try:
+            service_pid = driver.service.process.pid
+            return psutil.Process(service_pid).children(recursive=True)
+        except Exception as e:
+            logger.warning(f"브라우저 프로세스 조회 실패: {e}")
+            return []
+    
+    @staticmethod
+    def get_browser_pid(driver: webdriver.Chrome) -> Optional[int]:
+        """chromedriver 가 직접 띄운 브라우저 메인 프로세스 PID"""
+        processes = WebDriverManager.get_browser_processes(driver)
+        try:
+            service_pid = driver.service.process.pid
+            for process in processes:
+                if process.ppid() == service_pid:
+                    return process.pid
+        except Exception:
+            pass
+        return processes[0].pid if processes else None
+    
+    @staticmethod
+    def get_browser_memory_mb(driver: webdriver.Chrome) -> Optional[float]:
+        """브라우저 프로세스 트리의 RSS 합계 (MB)"""
+        processes = WebDriverManager.get_browser_processes(driver)
+        if not processes:
+            return None
+        
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except Exception:
+                continue
+        return round(total / (1024 * 1024), 1)
+    
     @staticmethod
     def create_wait(driver: webdriver.Chrome, timeout: int = 10) -> WebDriverWait:
         """명시적 대기 객체 생성"""
@@ -4,6 +4,7 @@
 
 import sys
 import argparse
+from datetime import datetime
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
@@ -55,6 +56,11 @@ def test_iljin_holdings_automation(input_file=None, keep_browser=True):
         if not visitor_data:
             logger.warning("방문객 정보를 읽을 수 없습니다. 신청자 정보만 입력합니다.")
         
+        # 사이트 한도를 넘는 방문객은 방문신청 여러 건으로 나누어 동시에 실행
+        max_visitors = ConfigManager.get_value(website_config, 'visit_request.max_visitors', 20)
+        if visitor_data and len(visitor_data) > max_visitors:
+            return run_split_iljin_requests(website_config, excel_data[0], visitor_data, keep_browser)
+        
         # 일진홀딩스 자동화 인스턴스 생성
         from websites.iljin_holdings.automation import IljinHoldingsAutomation
         automation = IljinHoldingsAutomation(website_config)
@@ -80,6 +86,11 @@ def test_iljin_holdings_automation(input_file=None, keep_browser=True):
             else:
                 logger.warning("⚠️ 방문객 정보 입력에 실패했습니다.")
         
+        # WebDriver 명령 프로파일 / 트레이스 리포트 (설정에서 활성화된 경우)
+        automation.write_profile_report(website_id)
+        automation.write_trace()
+        automation.flush_strategy_memo()
+        
         if success:
             logger.info("✅ 일진홀딩스 자동화 테스트 성공!")
         else:
@@ -100,6 +111,84 @@ def test_iljin_holdings_automation(input_file=None, keep_browser=True):
         return False
 
 
+def run_split_iljin_requests(website_config, applicant_data, visitor_data, keep_browser=True):
+    """방문객 한도 초과 시 분할된 일진홀딩스 방문신청 동시 실행"""
+    from websites.iljin_holdings.batch_runner import run_split_visit_requests
+    
+    result = run_split_visit_requests(website_config, applicant_data, visitor_data, keep_browser)
+    
+    logger.info(f"방문신청 {result['total_requests']}건 (방문객 {result['total_visitors']}명) 중 "
+                f"성공: {result['success_count']}건, 실패: {result['failed_count']}건")
+    for request_result in result['results']:
+        status = "✅ 성공" if request_result['success'] else f"❌ 실패 ({request_result['message']})"
+        logger.info(f"방문신청 {request_result['request_no']} (방문객 {request_result['visitor_count']}명): {status}")
+    
+    if result['success']:
+        logger.info("✅ 일진홀딩스 분할 방문신청 성공!")
+    else:
+        logger.error("❌ 일진홀딩스 분할 방문신청 중 실패한 건이 있습니다")
+    
+    if not keep_browser:
+        logger.info("브라우저가 열린 상태로 유지됩니다. 확인 후 수동으로 닫아주세요.")
+        input("엔터 키를 누르면 모든 브라우저가 닫힙니다...")
+        for request_result in result['results']:
+            request_result['automation'].cleanup()
+    
+    return result['success']
+
+
+def run_iljin_batch(input_file=None, keep_browser=False, workers=1, headless=False, launch_profile=None):
+    """일진홀딩스 일괄 처리 - 엑셀의 모든 신청자 행(방문객정보 블록 포함)을 처리하고 결과 표 저장
+
+    headless=True 이면 새 헤드리스 모드로 실행하고 리소스 차단(resource_blocking)을 적용한다.
+    launch_profile 을 지정하면 browser.launch_profile 대신 해당 Chrome 실행 프로파일을 사용한다.
+    """
+    try:
+        logger.info("=== 일진홀딩스 일괄 처리 시작 ===")
+        
+        config_manager = ConfigManager()
+        website_id = "iljin_holdings"
+        website_config = config_manager.get_website_config(website_id)
+        
+        if not website_config:
+            logger.error(f"웹사이트 설정을 찾을 수 없습니다: {website_id}")
+            return False
+        
+        if headless:
+            website_config.setdefault('browser', {})['headless'] = True
+            website_config.setdefault('resource_blocking', {})['enabled'] = True
+            logger.info("헤드리스 + 리소스 차단 모드로 실행합니다")
+        
+        if launch_profile:
+            website_config.setdefault('browser', {})['launch_profile'] = launch_profile
+        
+        excel_processor = ExcelProcessor(config_manager.get_global_config())
+        excel_filename = input_file if input_file else "sample_data.xlsx"
+        visit_requests = excel_processor.read_visit_requests(excel_filename)
+        
+        if not visit_requests:
+            logger.error(f"방문신청 데이터를 읽을 수 없습니다: {excel_filename}")
+            return False
+        
+        from websites.iljin_holdings.batch_runner import run_batch
+        result = run_batch(website_config, visit_requests, workers=workers, keep_browser=keep_browser)
+        
+        for row in result['results']:
+            status = "✅" if row['결과'] == '성공' else "❌"
+            logger.info(f"{status} 방문신청 {row['신청번호']} | {row['신청자']} | 방문객 {row['방문객수']}명 | "
+                        f"{row['메시지']} | {row['소요시간(초)']}초")
+        logger.info(f"방문신청 {result['total_requests']}건 중 성공: {result['success_count']}건, 실패: {result['failed_count']}건")
+        
+        result_filename = f"iljin_batch_result_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        excel_processor.save_result(result['results'], result_filename)
+        
+        return result['success']
+        
+    except Exception as e:
+        logger.error(f"일진홀딩스 일괄 처리 오류: {e}")
+        return False
+
+
 def test_ip168_itsm_name_field(input_file=None, keep_browser=True):
     """IP 168 ITSM 웹사이트 성명 필드 테스트"""
     try:
@@ -217,6 +306,11 @@ def test_ip168_itsm_name_field(input_file=None, keep_browser=True):
         
         logger.info("=== 전체 회원가입 자동화 테스트 완료 ===")
         
+        # WebDriver 명령 프로파일 / 트레이스 리포트 (설정에서 활성화된 경우)
+        automation.write_profile_report(website_id)
+        automation.write_trace()
+        automation.flush_strategy_memo()
+        
         # 웹에서 호출된 경우 브라우저 유지, 콘솔에서 호출된 경우 사용자 입력 대기
         if keep_browser:
             logger.info("🎉 IP 168 ITSM 자동화가 성공적으로 완료되었습니다!")
@@ -236,12 +330,36 @@ def test_ip168_itsm_name_field(input_file=None, keep_browser=True):
         return False
 
 
-def run_website_automation(website_id, input_file=None, keep_browser=True):
+def run_launch_benchmark(website_id, runs=3, profiles=None):
+    """Chrome 실행 프로파일별 시작 시간/페이지 로드/메모리 측정 리포트 생성"""
+    try:
+        logger.info("=== Chrome 실행 프로파일 벤치마크 시작 ===")
+        
+        config_manager = ConfigManager()
+        website_config = config_manager.get_website_config(website_id) if website_id else None
+        config = website_config or config_manager.get_global_config()
+        url = ConfigManager.get_value(config, 'website.url')
+        
+        from core.launch_benchmark import LaunchBenchmark
+        benchmark = LaunchBenchmark(config, ConfigManager.get_value(config, 'profiling.report_dir', 'logs/profiling'))
+        report = benchmark.run(profiles=profiles, url=url, runs=runs)
+        return benchmark.write_report(report) is not None
+        
+    except Exception as e:
+        logger.error(f"실행 프로파일 벤치마크 오류: {e}")
+        return False
+
+
+def run_website_automation(website_id, input_file=None, keep_browser=True, batch=False, workers=1, headless=False,
+                           launch_profile=None):
     """웹에서 호출할 때 사용하는 통합 자동화 함수"""
     try:
         logger.info(f"=== {website_id} 자동화 시작 ===")
         
-        if website_id == "iljin_holdings":
+        if website_id == "iljin_holdings" and batch:
+            return run_iljin_batch(input_file, keep_browser=False, workers=workers, headless=headless,
+                                   launch_profile=launch_profile)
+        elif website_id == "iljin_holdings":
             return test_iljin_holdings_automation(input_file, keep_browser)
         elif website_id == "ip_168_itsm":
             return test_ip168_itsm_name_field(input_file, keep_browser)
@@ -261,22 +379,44 @@ def main():
         logger = setup_logger()
         logger.info("=== 다중 웹사이트 RPA 시스템 시작 ===")
         
+        # 이전 실행이 남긴 고아 chrome/chromedriver 정리
+        global_config = ConfigManager().get_global_config()
+        if ConfigManager.get_value(global_config, 'supervisor.reap_orphans_on_startup', False):
+            from core.browser_supervisor import BrowserSupervisor
+            BrowserSupervisor.reap_orphans(global_config)
+        
         # 명령행 인수 파싱
         parser = argparse.ArgumentParser(description='다중 웹사이트 RPA 시스템')
         parser.add_argument('--website', type=str, help='실행할 웹사이트 ID')
         parser.add_argument('--test', action='store_true', help='테스트 모드')
         parser.add_argument('--input-file', type=str, help='입력 엑셀 파일 경로')
         parser.add_argument('--web-mode', action='store_true', help='웹 모드 (브라우저 유지)')
+        parser.add_argument('--batch', action='store_true', help='일괄 처리 모드 (엑셀의 모든 방문신청 처리)')
+        parser.add_argument('--workers', type=int, default=1, help='일괄 처리 시 동시에 실행할 브라우저 수')
+        parser.add_argument('--headless', action='store_true', help='일괄 처리 시 헤드리스 + 리소스 차단 모드로 실행')
+        parser.add_argument('--launch-profile', type=str, help='일괄 처리 시 사용할 Chrome 실행 프로파일 (fast, lowmem, debug 등)')
+        parser.add_argument('--benchmark-profiles', action='store_true', help='Chrome 실행 프로파일별 시작 시간/메모리 측정')
+        parser.add_argument('--runs', type=int, default=3, help='벤치마크 시 프로파일별 실행 횟수')
         
         args = parser.parse_args()
         
+        # 실행 프로파일 벤치마크
+        if args.benchmark_profiles:
+            profiles = [args.launch_profile] if args.launch_profile else None
+            run_launch_benchmark(args.website, runs=args.runs, profiles=profiles)
+            return
+        
         # 웹에서 호출된 경우 (--website 인수가 있는 경우)
         if args.website:
             logger.info(f"웹에서 선택된 웹사이트: {args.website}")
             success = run_website_automation(
                 args.website, 
                 args.input_file, 
-                keep_browser=args.web_mode or True
+                keep_browser=args.web_mode or True,
+                batch=args.batch,
+                workers=args.workers,
+                headless=args.headless,
+                launch_profile=args.launch_profile
             )
             
             if success:
@@ -4,32 +4,54 @@
 
 import time
 import os
+from urllib.parse import urlparse
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.remote.webelement import WebElement
 
 from src.core.base_automation import BaseAutomation
+from src.core.config_manager import ConfigManager
 from src.core.web_driver_manager import WebDriverManager
+from src.core.option_index import OptionIndex
+from src.core.dom_observers import DomObservers
 from .selectors import IljinSelectors
 from loguru import logger
 
 
+# 차량정보 입력 팝업 (position: fixed 모달은 offsetParent 가 null 이므로 렌더링 박스로 표시 여부 판단)
+VEHICLE_POPUP_SELECTOR = '.modal-card, .modal, .popup, [role="dialog"]'
+VEHICLE_POPUP_OPEN_SCRIPT = """
+    return Array.from(document.querySelectorAll(arguments[0])).some(function(popup) {
+        return popup.getClientRects().length > 0 && popup.querySelectorAll('input[type="text"]').length >= 2;
+    });
+"""
+
+
 class IljinHoldingsAutomation(BaseAutomation):
     """일진홀딩스 웹사이트 자동화 클래스"""
     
+    SITE_ID = "iljin_holdings"
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.selectors = IljinSelectors()
+        self._location_index: Optional[Dict[str, Any]] = None  # 페이지 로드 단위 방문사업장 옵션 인덱스
+        self._current_visitor_ul: Optional[WebElement] = None  # 방문객추가 직후 옵저버가 돌려준 새 방문객 ul
+        self._contact_watch_active = False  # 피방문자 연락처 페이지 내 감시기 설치 여부
+        self._visitor_row_watch_active = False  # 방문객 ul 추가 감시기 설치 여부 (방문객 입력 1회 단위)
+        self._visit_consent_given = False  # 현재 브라우저 세션에서 약관 동의를 마쳤는지 여부 (딥링크 재사용)
         
     def setup_driver(self) -> None:
         """웹드라이버 설정"""
         try:
-            self.driver = WebDriverManager.create_driver(self.config)
+            self.driver = WebDriverManager.create_driver(self.config, owner=self.SITE_ID)
             self.wait = WebDriverManager.create_wait(self.driver, self.config.get('browser.timeout', 10))
+            self.attach_driver_instrumentation()
             logger.info("일진홀딩스 웹드라이버 설정 완료")
         except Exception as e:
             logger.error(f"웹드라이버 설정 오류: {e}")
@@ -44,6 +66,9 @@ class IljinHoldingsAutomation(BaseAutomation):
             self.driver.get(url)
             time.sleep(3)
             
+            # 사이트 빌드 핑거프린트 (재배포 시 사이트 캐시 무효화)
+            self.fingerprint_site()
+            
             logger.info("일진홀딩스 웹사이트 접속 완료")
             return True
             
@@ -51,6 +76,67 @@ class IljinHoldingsAutomation(BaseAutomation):
             logger.error(f"웹사이트 접속 오류: {e}")
             return False
             
+    def _wait_for_page_condition(self, script: str, timeout: float, *args) -> bool:
+        """페이지 조건 스크립트가 참이 될 때까지 대기 (고정 sleep 대체)"""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
+                lambda driver: driver.execute_script(script, *args)
+            )
+            return True
+        except TimeoutException:
+            return False
+            
+    def _wait_for_terms_ready(self, timeout: float = 10) -> bool:
+        """약관 페이지 준비 대기 (경로 일치 + 동의 체크박스 렌더링)"""
+        return self._wait_for_page_condition("""
+            return location.pathname.indexOf(arguments[0]) !== -1 && !!document.getElementById(arguments[1]);
+        """, timeout, urlparse(self.selectors.TERMS_PAGE).path, self.selectors.AGREE_CHECKBOX_1)
+            
+    def _wait_for_visit_form_ready(self, timeout: float = 10) -> bool:
+        """방문신청 폼 준비 대기 (경로 일치 + 방문사업장 옵션/입력 필드 렌더링)"""
+        return self._wait_for_page_condition("""
+            return location.pathname.indexOf(arguments[0]) !== -1 &&
+                Array.from(document.querySelectorAll('select')).some(function(select) { return select.options.length > 1; }) &&
+                document.querySelectorAll('input[type="text"]').length > 0;
+        """, timeout, urlparse(self.selectors.VISIT_FORM_PAGE).path)
+            
+    def navigate_direct_to_visit_form(self, timeout: float = 10) -> bool:
+        """딥링크 빠른 이동 - 메인/메뉴 클릭 없이 약관 URL(동의 이력이 있으면 폼 URL)로 바로 이동
+
+        리다이렉트 등으로 대상 페이지가 아니면 False 를 반환하여 기존 클릭 경로로 진행
+        """
+        try:
+            # 같은 브라우저 세션에서 이미 동의했다면 폼 URL로 바로 이동
+            if self._visit_consent_given:
+                self.driver.get(self.selectors.VISIT_FORM_PAGE)
+                if self._wait_for_visit_form_ready(timeout):
+                    logger.info("방문신청 폼 딥링크 이동 완료 (기존 약관 동의 세션)")
+                    return True
+                logger.info("폼 딥링크가 약관 단계로 돌아갔습니다. 약관 페이지로 이동합니다")
+                self._visit_consent_given = False
+            
+            self.driver.get(self.selectors.TERMS_PAGE)
+            if not self._wait_for_terms_ready(timeout):
+                logger.warning(f"약관 딥링크 이동 실패 (현재 URL: {self.driver.current_url})")
+                return False
+            self.fingerprint_site()
+            
+            self.check_vue_checkboxes()
+            if not self.click_agree_button():
+                return False
+            
+            if not self._wait_for_visit_form_ready(timeout):
+                logger.warning(f"약관 동의 후 방문신청 폼을 확인하지 못했습니다 (현재 URL: {self.driver.current_url})")
+                return False
+            
+            self._visit_consent_given = True
+            logger.info("딥링크로 방문신청 폼 이동 완료")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"딥링크 이동 오류: {e}")
+            return False
+            
     def login(self, credentials: Dict[str, str]) -> bool:
         """로그인 (일진홀딩스는 로그인이 필요하지 않음)"""
         logger.info("일진홀딩스는 로그인이 필요하지 않습니다")
@@ -185,9 +271,6 @@ class IljinHoldingsAutomation(BaseAutomation):
             }
             """
             
-            result_1 = self.driver.execute_script(js_code_1)
-            logger.info(f"Vue.js 앱 처리 결과: {result_1}")
-            
             # 방법 2: DOM 요소 직접 조작 (성공한 방법)
             js_code_2 = """
             try {
@@ -238,9 +321,6 @@ class IljinHoldingsAutomation(BaseAutomation):
             }
             """
             
-            result_2 = self.driver.execute_script(js_code_2)
-            logger.info(f"DOM 요소 처리 결과: {result_2}")
-            
             # 방법 3: MutationObserver를 사용한 강제 업데이트 (성공한 방법)
             js_code_3 = """
             try {
@@ -295,8 +375,23 @@ class IljinHoldingsAutomation(BaseAutomation):
             }
             """
             
-            result_3 = self.driver.execute_script(js_code_3)
-            logger.info(f"MutationObserver 처리 결과: {result_3}")
+            # 지난번에 성공한 방법부터 시도하고, 두 체크박스가 체크되면 나머지 방법은 생략
+            def attempt(label, script):
+                def run():
+                    result = self.driver.execute_script(script)
+                    logger.info(f"{label} 처리 결과: {result}")
+                    return self._are_agree_checkboxes_checked()
+                return run
+            
+            winner = self.get_strategy_memo().run('agree_checkbox', {
+                'vue_instance': attempt("Vue.js 앱", js_code_1),
+                'dom_events': attempt("DOM 요소", js_code_2),
+                'mutation_observer': attempt("MutationObserver", js_code_3)
+            })
+            if winner:
+                logger.info(f"체크박스 체크 성공 방법: {winner}")
+            else:
+                logger.warning("모든 방법으로 체크박스를 체크하지 못했습니다")
             
             # 체크박스 상태 확인
             self.verify_checkbox_status()
@@ -304,6 +399,41 @@ class IljinHoldingsAutomation(BaseAutomation):
         except Exception as e:
             logger.error(f"Vue.js 체크박스 체크 오류: {e}")
             
+    def _are_agree_checkboxes_checked(self) -> bool:
+        """약관 동의가 앱 상태에 반영되었는지 확인 (스크립트 호출 1회)
+        
+        DOM checked 만으로는 Vue 모델이 갱신되지 않았을 수 있으므로, 체크박스를 소유한 Vue 인스턴스의
+        agreeChk 값을 확인하고 모델을 찾을 수 없으면 "동의합니다" 버튼 활성화 여부로 판단한다.
+        """
+        return bool(self.driver.execute_script("""
+            var ids = ['agreeChk_1', 'agreeChk_2'];
+            var checkboxes = ids.map(function(id) { return document.getElementById(id); });
+            if (!checkboxes.every(function(checkbox) { return checkbox && checkbox.checked; })) return false;
+            
+            // 1) Vue 모델: 체크박스 조상 요소의 Vue 인스턴스(및 부모 인스턴스)에서 agreeChk 값 확인
+            var modelFound = false;
+            for (var i = 0; i < ids.length; i++) {
+                var node = checkboxes[i];
+                while (node && !node.__vue__) node = node.parentElement;
+                for (var vm = node && node.__vue__; vm; vm = vm.$parent) {
+                    if (vm[ids[i]] !== undefined) {
+                        modelFound = true;
+                        if (!vm[ids[i]]) return false;
+                        break;
+                    }
+                }
+            }
+            if (modelFound) return true;
+            
+            // 2) "동의합니다" 버튼 활성화 여부
+            var buttons = Array.from(document.querySelectorAll('button, input[type="button"], input[type="submit"], a'));
+            var agree = buttons.find(function(button) {
+                return ((button.innerText || button.value || '').trim()).indexOf('동의합니다') !== -1;
+            });
+            if (agree) return !agree.disabled && !agree.classList.contains('disabled') && agree.getAttribute('aria-disabled') !== 'true';
+            return true;
+        """))
+            
     def verify_checkbox_status(self):
         """체크박스 상태 확인"""
         try:
@@ -375,10 +505,12 @@ class IljinHoldingsAutomation(BaseAutomation):
             
             # 현재 신청자 데이터 저장 (피방문자 연락처 복원용)
             self.current_applicant_data = data.copy()
+            self._contact_watch_active = False
             logger.info(f"현재 신청자 데이터 저장 완료: {self.current_applicant_data}")
             
-            # 페이지 로딩 대기 (더 긴 시간)
-            time.sleep(5)
+            # 페이지 로딩 대기 (폼 렌더링 조건 충족 시 즉시 진행)
+            if not self._wait_for_visit_form_ready(10):
+                logger.warning("방문신청 폼 준비 상태를 확인하지 못했습니다. 계속 진행합니다")
             
             # 현재 URL 확인
             current_url = self.driver.current_url
@@ -426,6 +558,9 @@ class IljinHoldingsAutomation(BaseAutomation):
                 return False
             time.sleep(2)  # 정보 확인 페이지 로딩 대기
             
+            # 피방문자 정보 입력이 끝났으므로 연락처 변경 감시기 설치 (이후 단계별 크롤링 검사 대체)
+            self._install_applicant_contact_watcher()
+            
             # 5단계: 신청자 입력
             if '신청자' in data and data['신청자']:
                 logger.info(f"신청자 데이터 확인: {data['신청자']}")
@@ -489,11 +624,103 @@ class IljinHoldingsAutomation(BaseAutomation):
             logger.error(f"방문신청 폼 작성 중 오류: {e}")
             return False
             
+    def _build_location_index(self) -> Optional[Dict[str, Any]]:
+        """페이지의 모든 select 옵션을 한 번의 스크립트로 읽어 방문사업장 인덱스 생성"""
+        try:
+            page = self.driver.execute_script("""
+                return {
+                    timeOrigin: performance.timeOrigin,
+                    selects: Array.from(document.querySelectorAll('select')).map(function(select, position) {
+                        return {
+                            position: position,
+                            name: select.name || '',
+                            id: select.id || '',
+                            options: Array.from(select.options).map(function(option, index) {
+                                return { text: option.text.trim(), value: option.value, index: index };
+                            })
+                        };
+                    })
+                };
+            """)
+            
+            value_mapping = self.config.get('form_fields', {}).get('visit_location', {}).get('value_mapping', {}) or {}
+            mapped_values = set(str(v) for v in value_mapping.values())
+            mapped_texts = set(value_mapping.keys())
+            
+            # value_mapping 의 값/텍스트를 가장 많이 포함하는 select 를 방문사업장 select 로 선택
+            best, best_score = None, 0
+            for select in page.get('selects', []):
+                score = sum(1 for o in select['options'] if o['value'] in mapped_values or o['text'] in mapped_texts)
+                if score > best_score:
+                    best, best_score = select, score
+            
+            if best is None:
+                logger.warning("방문사업장 select 를 인덱스에서 찾을 수 없습니다")
+                return None
+            
+            self._location_index = {
+                'time_origin': page.get('timeOrigin'),
+                'position': best['position'],
+                'options': OptionIndex(best['options']),
+                'values': {o['value']: o for o in best['options']},
+                'value_mapping': value_mapping
+            }
+            logger.info(f"방문사업장 인덱스 생성: select {best['position']} ({len(best['options'])}개 옵션)")
+            return self._location_index
+            
+        except Exception as e:
+            logger.error(f"방문사업장 인덱스 생성 오류: {e}")
+            return None
+    
+    def _select_visit_location_indexed(self, location_name: str) -> bool:
+        """인덱스로 값을 결정한 뒤 한 번의 호출로 선택 (change 이벤트 발생)"""
+        for attempt in range(2):
+            index = self._location_index if attempt == 0 and self._location_index else self._build_location_index()
+            if not index:
+                return False
+            
+            # 1) 설정의 value_mapping 2) 옵션 텍스트 정규화/유사도 매칭
+            value = index['value_mapping'].get(location_name)
+            option = index['values'].get(str(value)) if value is not None else None
+            if not option:
+                candidates = index['options'].candidates(location_name)
+                if len(candidates) > 1:
+                    logger.warning(f"방문사업장 옵션 후보가 여럿이라 선택하지 않습니다: {location_name} → {[c['text'] for c in candidates]}")
+                    return False
+                option = candidates[0] if candidates else None
+            if not option:
+                logger.warning(f"방문사업장 옵션을 찾을 수 없습니다: {location_name}")
+                return False
+            
+            result = self.driver.execute_script("""
+                var select = document.querySelectorAll('select')[arguments[0]];
+                if (!select || performance.timeOrigin !== arguments[2]) return null;
+                select.value = arguments[1];
+                if (select.value !== arguments[1]) return null;
+                select.dispatchEvent(new Event('input', { bubbles: true }));
+                select.dispatchEvent(new Event('change', { bubbles: true }));
+                return select.options[select.selectedIndex].text.trim();
+            """, index['position'], option['value'], index['time_origin'])
+            
+            if result is not None:
+                logger.info(f"방문사업장 '{location_name}' → '{result}' (value '{option['value']}') 선택 완료")
+                return True
+            
+            # 페이지가 다시 로드되었거나 select 구조가 바뀐 경우 인덱스 재생성 후 1회 재시도
+            self._location_index = None
+        
+        return False
+    
     def select_visit_location(self, location_name: str) -> bool:
         """방문사업장 선택"""
         try:
             logger.info(f"방문사업장 선택 중: {location_name}")
             
+            # 빠른 경로: 옵션 인덱스 기반 단일 호출 선택
+            if self._select_visit_location_indexed(location_name):
+                return True
+            logger.warning("인덱스 기반 방문사업장 선택 실패, 기존 방식으로 재시도")
+            
             # 여러 방법으로 select 요소 찾기
             select_selectors = [
                 "select_0",  # 기존 방법
@@ -680,7 +907,8 @@ class IljinHoldingsAutomation(BaseAutomation):
                 logger.info(f"네 번째 텍스트 박스에 신청자 '{applicant_name}' 입력 완료")
                 
                 # 신청자 입력 후 피방문자 연락처 상태 확인
-                time.sleep(0.5)
+                if not self._contact_watch_active:
+                    time.sleep(0.5)
                 logger.info("신청자 입력 후 피방문자 연락처 상태 확인...")
                 self._monitor_applicant_contact_changes("신청자 입력 후")
                 self._log_applicant_contact_status("신청자 입력 후")
@@ -733,7 +961,8 @@ class IljinHoldingsAutomation(BaseAutomation):
                 logger.info(f"다섯 번째 텍스트 박스에 '{second_part}' 입력 완료")
                 
                 # 첫 번째 연락처 입력 후 피방문자 연락처 상태 확인
-                time.sleep(0.5)
+                if not self._contact_watch_active:
+                    time.sleep(0.5)
                 logger.info("첫 번째 신청자 연락처 입력 후 피방문자 연락처 상태 확인...")
                 self._monitor_applicant_contact_changes("첫 번째 신청자 연락처 입력 후")
                 self._log_applicant_contact_status("첫 번째 신청자 연락처 입력 후")
@@ -750,7 +979,8 @@ class IljinHoldingsAutomation(BaseAutomation):
                 logger.info(f"여섯 번째 텍스트 박스에 '{third_part}' 입력 완료")
                 
                 # 두 번째 연락처 입력 후 피방문자 연락처 상태 확인
-                time.sleep(0.5)
+                if not self._contact_watch_active:
+                    time.sleep(0.5)
                 logger.info("두 번째 신청자 연락처 입력 후 피방문자 연락처 상태 확인...")
                 self._monitor_applicant_contact_changes("두 번째 신청자 연락처 입력 후")
                 self._log_applicant_contact_status("두 번째 신청자 연락처 입력 후")
@@ -1014,9 +1244,8 @@ class IljinHoldingsAutomation(BaseAutomation):
     def _input_to_element(self, element, value: str, field_name: str) -> bool:
         """특정 요소에 입력"""
         try:
-            # 요소가 보이도록 스크롤
+            # 요소가 보이도록 스크롤 (뷰포트 진입까지 대기하므로 추가 sleep 불필요)
             self._ensure_element_visible(element)
-            time.sleep(1)
             
             # 요소를 클릭 가능한 상태로 만들기
             self._make_element_interactable(element)
@@ -1064,9 +1293,8 @@ class IljinHoldingsAutomation(BaseAutomation):
                         continue
                     return False
                 
-                # 강화된 스크롤 처리
+                # 강화된 스크롤 처리 (뷰포트 진입까지 대기하므로 추가 sleep 불필요)
                 self._ensure_element_visible(element)
-                time.sleep(1)
                 
                 # 요소를 클릭 가능한 상태로 만들기
                 self._make_element_interactable(element)
@@ -1212,38 +1440,49 @@ class IljinHoldingsAutomation(BaseAutomation):
     def fill_visitor_information(self, visitor_data: List[Dict[str, Any]], applicant_data: Dict[str, Any]) -> bool:
         """방문객 정보 입력 (단순화된 버전)"""
         try:
+            self.set_step('fill_visitor_information')
             logger.info(f"방문객 정보 입력 시작: {len(visitor_data)}명")
+            self._current_visitor_ul = None
+            # 방문객 ul 추가 감시기는 여기서 한 번만 설치하고 방문객추가 클릭마다 새 행만 받음
+            self._visitor_row_watch_active = len(visitor_data) > 1 and self._install_visitor_row_watcher()
             
             # 방문객 정보 입력 전에 페이지 구조 디버깅
             logger.info("방문객 정보 입력 전 페이지 구조 분석...")
             self._debug_page_structure()
             
-            # 방문객 정보 순서대로 입력
-            for i, visitor in enumerate(visitor_data):
-                logger.info(f"방문객 {i+1} 입력 중: {visitor.get('성명', '')}")
-                
-                if i == 0:
-                    # 첫 번째 방문객: 기존 빈 ul에 직접 입력
-                    logger.info("첫 번째 방문객입니다. 기존 빈 ul에 직접 입력합니다.")
-                    if not self._fill_visitor_basic_info(visitor, is_first_visitor=True):
-                        logger.error(f"방문객 {i+1} 추가 실패")
-                        return False
+            # 일괄 입력: 방문객추가를 먼저 모두 클릭한 뒤 모든 행을 스크립트 한 번으로 입력
+            bulk = ConfigManager.get_value(self.config, 'visitor_bulk', {}) or {}
+            if bulk.get('enabled', True) and len(visitor_data) >= bulk.get('min_visitors', 2):
+                if not self._fill_visitors_bulk(visitor_data, bulk.get('add_timeout', 5)):
+                    return False
+            else:
+                # 방문객 정보 순서대로 입력
+                for i, visitor in enumerate(visitor_data):
+                    with self.span('visitor', visitor_index=i, has_vehicle=bool(visitor.get('차종'))):
+                        logger.info(f"방문객 {i+1} 입력 중: {visitor.get('성명', '')}")
+                
+                        if i == 0:
+                            # 첫 번째 방문객: 기존 빈 ul에 직접 입력
+                            logger.info("첫 번째 방문객입니다. 기존 빈 ul에 직접 입력합니다.")
+                            if not self._fill_visitor_basic_info(visitor, is_first_visitor=True):
+                                logger.error(f"방문객 {i+1} 추가 실패")
+                                return False
                     
-                    # 첫 번째 방문객의 차량정보 입력 (있는 경우)
-                    if visitor.get('차종') and visitor.get('차종') != '':
-                        if not self._fill_vehicle_info(visitor):
-                            logger.warning("첫 번째 방문객 차량정보 입력 실패")
+                            # 첫 번째 방문객의 차량정보 입력 (있는 경우)
+                            if visitor.get('차종') and visitor.get('차종') != '':
+                                if not self._fill_vehicle_info(visitor):
+                                    logger.warning("첫 번째 방문객 차량정보 입력 실패")
                     
-                    # 첫 번째 방문객의 개인정보 동의 체크박스 클릭
-                    if not self._check_privacy_consent():
-                        logger.error(f"첫 번째 방문객 개인정보 동의 체크 실패")
-                        return False
-                else:
-                    # 두 번째 방문객부터: 방문객추가 버튼 클릭 후 새 ul에 입력
-                    logger.info(f"방문객 {i+1}입니다. 방문객추가 버튼을 클릭합니다.")
-                    if not self._add_new_visitor(visitor):
-                        logger.error(f"방문객 {i+1} 추가 실패")
-                        return False
+                            # 첫 번째 방문객의 개인정보 동의 체크박스 클릭
+                            if not self._check_privacy_consent():
+                                logger.error(f"첫 번째 방문객 개인정보 동의 체크 실패")
+                                return False
+                        else:
+                            # 두 번째 방문객부터: 방문객추가 버튼 클릭 후 새 ul에 입력
+                            logger.info(f"방문객 {i+1}입니다. 방문객추가 버튼을 클릭합니다.")
+                            if not self._add_new_visitor(visitor):
+                                logger.error(f"방문객 {i+1} 추가 실패")
+                                return False
             
             logger.info("방문객 정보 입력 완료")
             
@@ -1261,6 +1500,139 @@ class IljinHoldingsAutomation(BaseAutomation):
             logger.error(f"방문객 정보 입력 중 오류: {e}")
             return False
             
+    def _snapshot_visitor_rows(self) -> List[WebElement]:
+        """방문객 정보 ul(연락처 input 2개) 전체를 DOM 순서대로 한 번에 조회"""
+        return self.driver.execute_script("""
+            return Array.from(document.querySelectorAll('ul')).filter(function(ul) {
+                var phone = ul.querySelector('li.list_3');
+                return ul.querySelector('li.list_1') && phone && phone.querySelectorAll('input').length === 2;
+            });
+        """) or []
+            
+    def _fill_visitors_bulk(self, visitor_data: List[Dict[str, Any]], add_timeout: float = 5.0) -> bool:
+        """방문객 일괄 입력 - 방문객추가 N-1회 후 성명/연락처/개인정보 동의를 스크립트 한 번으로 입력하고
+        검증에 실패한 행만 기존 행 단위 입력으로 재시도"""
+        try:
+            base_rows = self._snapshot_visitor_rows()
+            if not base_rows:
+                logger.error("방문객 정보 ul을 찾을 수 없습니다")
+                return False
+            
+            # 첫 번째 방문객은 기존 빈 ul (_get_current_visitor_ul 의 첫 방문객 규칙과 동일)
+            first_index = 1 if len(base_rows) >= 2 else len(base_rows) - 1
+            
+            with self.span('visitor_rows_add', count=len(visitor_data) - 1):
+                for i in range(1, len(visitor_data)):
+                    if not self._click_add_visitor_button(timeout=add_timeout):
+                        logger.error(f"방문객 {i+1} 행 추가 실패")
+                        return False
+            
+            rows = self._snapshot_visitor_rows()
+            targets = [rows[first_index]] + rows[len(base_rows):]
+            if len(targets) < len(visitor_data):
+                logger.error(f"방문객 행 수 부족: 필요 {len(visitor_data)}개, 발견 {len(targets)}개")
+                return False
+            
+            payload = []
+            for ul, visitor in zip(targets, visitor_data):
+                phone_parts = str(visitor.get('휴대폰번호', '') or '').split('-')
+                payload.append({
+                    'ul': ul,
+                    'name': visitor.get('성명', '') or '',
+                    'phone': phone_parts[1:3] if len(phone_parts) >= 3 else []
+                })
+            
+            with self.span('visitor_rows_fill', count=len(payload)):
+                results = self.driver.execute_async_script("""
+                    var rows = arguments[0];
+                    var done = arguments[arguments.length - 1];
+                    var setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+                    
+                    function setValue(input, value) {
+                        input.removeAttribute('disabled');
+                        setter.call(input, value);
+                        input.dispatchEvent(new Event('input', { bubbles: true }));
+                        input.dispatchEvent(new Event('change', { bubbles: true }));
+                    }
+                    
+                    function consentBoxes(ul) {
+                        return ['li.list_6', 'li.list_7'].map(function(selector) {
+                            return ul.querySelector(selector + ' input[type="checkbox"]');
+                        }).filter(Boolean);
+                    }
+                    
+                    rows.forEach(function(row) {
+                        var nameInput = row.ul.querySelector('li.list_1 input');
+                        if (nameInput && row.name) setValue(nameInput, row.name);
+                        var phoneInputs = row.ul.querySelectorAll('li.list_3 input');
+                        if (phoneInputs.length >= 2 && row.phone.length === 2) {
+                            setValue(phoneInputs[0], row.phone[0]);
+                            setValue(phoneInputs[1], row.phone[1]);
+                        }
+                        // 이미 체크된 항목은 클릭하지 않음 (토글 방지)
+                        consentBoxes(row.ul).forEach(function(checkbox) {
+                            if (!checkbox.checked) checkbox.click();
+                        });
+                    });
+                    
+                    // Vue 반영 후 한 번에 검증
+                    setTimeout(function() {
+                        done(rows.map(function(row) {
+                            var nameInput = row.ul.querySelector('li.list_1 input');
+                            var phoneInputs = row.ul.querySelectorAll('li.list_3 input');
+                            var boxes = consentBoxes(row.ul);
+                            return {
+                                name: !row.name || (nameInput && nameInput.value === row.name),
+                                phone: row.phone.length !== 2 || (phoneInputs.length >= 2 &&
+                                    phoneInputs[0].value === row.phone[0] && phoneInputs[1].value === row.phone[1]),
+                                consent: boxes.length === 2 && boxes.every(function(checkbox) { return checkbox.checked; })
+                            };
+                        }));
+                    }, 50);
+                """, payload) or []
+            
+            failed_rows = 0
+            for i, (ul, visitor) in enumerate(zip(targets, visitor_data)):
+                result = results[i] if i < len(results) else {}
+                self._current_visitor_ul = ul
+                
+                if not (result.get('name') and result.get('phone')):
+                    failed_rows += 1
+                    logger.warning(f"방문객 {i+1} 일괄 입력 검증 실패 ({result}), 행 단위로 재입력합니다")
+                    if not self._fill_visitor_basic_info(visitor, is_first_visitor=False):
+                        logger.error(f"방문객 {i+1} 입력 실패")
+                        return False
+                
+                # 차량정보는 팝업을 거쳐야 하므로 행 단위로 입력
+                if visitor.get('차종') and visitor.get('차종') != '':
+                    with self.span('visitor', visitor_index=i, has_vehicle=True):
+                        if not self._fill_vehicle_info(visitor):
+                            logger.warning(f"방문객 {i+1} 차량정보 입력 실패")
+                
+                if not result.get('consent') and not self._ensure_privacy_consent(ul):
+                    logger.error(f"방문객 {i+1} 개인정보 동의 체크 실패")
+                    return False
+            
+            self._current_visitor_ul = None
+            logger.info(f"방문객 {len(visitor_data)}명 일괄 입력 완료 (행 단위 재입력 {failed_rows}건)")
+            return True
+            
+        except Exception as e:
+            logger.error(f"방문객 일괄 입력 중 오류: {e}")
+            return False
+            
+    def _ensure_privacy_consent(self, ul: WebElement) -> bool:
+        """방문객 ul의 개인정보 동의 체크박스 중 체크되지 않은 것만 클릭"""
+        try:
+            for selector in ["li.list_6 input[type='checkbox']", "li.list_7 input[type='checkbox']"]:
+                checkbox = ul.find_element(By.CSS_SELECTOR, selector)
+                if not checkbox.is_selected():
+                    self.driver.execute_script("arguments[0].click();", checkbox)
+            return True
+        except Exception as e:
+            logger.warning(f"개인정보 동의 체크박스 처리 실패: {e}")
+            return False
+            
     def _verify_applicant_in_visitor_table(self, applicant_data: Dict[str, Any]) -> bool:
         """신청자 정보가 방문객 테이블에 자동 입력되었는지 확인"""
         try:
@@ -1355,6 +1727,15 @@ class IljinHoldingsAutomation(BaseAutomation):
     def _get_current_visitor_ul(self, is_first_visitor: bool = False) -> Optional[WebElement]:
         """현재 방문객 정보를 입력할 ul 요소 찾기"""
         try:
+            # 방문객추가 시 옵저버가 돌려준 ul이 아직 DOM에 붙어 있으면 전체 탐색 없이 사용
+            if not is_first_visitor and self._current_visitor_ul is not None:
+                try:
+                    if self.driver.execute_script("return arguments[0].isConnected;", self._current_visitor_ul):
+                        return self._current_visitor_ul
+                except Exception as e:
+                    logger.debug(f"방문객 ul 핸들 확인 실패: {e}")
+                self._current_visitor_ul = None
+            
             # 방문객 정보 ul 찾기 (list_1 클래스를 가진 li가 있는 ul만 필터링)
             all_uls = self.driver.find_elements(By.CSS_SELECTOR, "ul")
             visitor_uls = []
@@ -1470,12 +1851,47 @@ class IljinHoldingsAutomation(BaseAutomation):
             logger.error(f"신청자 ul 인덱스 찾기 중 오류: {e}")
             return None
             
-    def _click_add_visitor_button(self) -> bool:
+    def _install_visitor_row_watcher(self) -> bool:
+        """방문객 테이블에 새 방문객 ul 감시용 MutationObserver 설치 (fill_visitor_information 당 한 번)"""
+        container = self.driver.execute_script("""
+            // 방문객 ul(연락처 input 2개)을 찾아 방문객추가 버튼까지 포함하는 가장 가까운 조상을 감시 대상으로 사용
+            var uls = Array.from(document.querySelectorAll('ul')).filter(function(ul) {
+                var phone = ul.querySelector('li.list_3');
+                return ul.querySelector('li.list_1') && phone && phone.querySelectorAll('input').length === 2;
+            });
+            if (!uls.length) return null;
+            var node = uls[uls.length - 1].parentElement;
+            while (node && !node.querySelector('button.button-add')) node = node.parentElement;
+            return node || document.body;
+        """)
+        if container is None:
+            return False
+        return DomObservers.watch_added(self.driver, 'visitor_rows', container, 'ul:has(li.list_1)')
+            
+    def _click_add_visitor_button(self, timeout: float = 5.0) -> bool:
         """방문객추가 버튼 클릭"""
         try:
             # 방문객추가 버튼 찾기 (class="button-add")
             add_button = self.driver.find_element(By.CSS_SELECTOR, "button.button-add")
             
+            # 옵저버 대기: 클릭 후 새 방문객 ul이 붙는 즉시 해당 ul 핸들을 반환
+            self._current_visitor_ul = None
+            if self._visitor_row_watch_active:
+                result = DomObservers.click_and_wait_added(self.driver, 'visitor_rows', add_button, timeout=timeout)
+                if not result.get('clicked') and self._install_visitor_row_watcher():
+                    # 재렌더링으로 감시 대상이 문서에서 떨어진 경우에만 다시 설치
+                    result = DomObservers.click_and_wait_added(self.driver, 'visitor_rows', add_button, timeout=timeout)
+                self._visitor_row_watch_active = bool(result.get('clicked'))
+                if result.get('node') is not None:
+                    self._current_visitor_ul = result['node']
+                    logger.info("방문객추가 버튼 클릭 완료 (새 방문객 ul 감지)")
+                    return True
+                if result.get('clicked'):
+                    # 클릭은 되었으나 새 ul을 감지하지 못함 - 기존 ul 탐색으로 처리
+                    logger.warning("방문객추가 후 새 방문객 ul을 감지하지 못했습니다. 전체 탐색으로 진행합니다")
+                    time.sleep(1)
+                    return True
+            
             # 버튼이 화면에 보이도록 스크롤
             self.driver.execute_script("arguments[0].scrollIntoView(true);", add_button)
             time.sleep(1)
@@ -1535,7 +1951,8 @@ class IljinHoldingsAutomation(BaseAutomation):
                 logger.info(f"방문자명 입력: {visitor_name}")
                 
                 # 방문자명 입력 후 피방문자 연락처 상태 확인
-                time.sleep(0.5)
+                if not self._contact_watch_active:
+                    time.sleep(0.5)
                 self._monitor_applicant_contact_changes("방문자명 입력 후")
                 self._log_applicant_contact_status("방문자명 입력 후")
                 self._log_all_inputs_status("방문자명 입력 후")
@@ -1557,7 +1974,8 @@ class IljinHoldingsAutomation(BaseAutomation):
                         logger.info(f"첫 번째 연락처 input 입력: {phone_parts[1]}")
                         
                         # 첫 번째 연락처 입력 후 피방문자 연락처 상태 확인
-                        time.sleep(0.5)
+                        if not self._contact_watch_active:
+                            time.sleep(0.5)
                         self._monitor_applicant_contact_changes("첫 번째 연락처 입력 후")
                         self._log_applicant_contact_status("첫 번째 연락처 입력 후")
                         self._log_all_inputs_status("첫 번째 연락처 입력 후")
@@ -1569,7 +1987,8 @@ class IljinHoldingsAutomation(BaseAutomation):
                         logger.info(f"두 번째 연락처 input 입력: {phone_parts[2]}")
                         
                         # 두 번째 연락처 입력 후 피방문자 연락처 상태 확인
-                        time.sleep(0.5)
+                        if not self._contact_watch_active:
+                            time.sleep(0.5)
                         self._monitor_applicant_contact_changes("두 번째 연락처 입력 후")
                         self._log_applicant_contact_status("두 번째 연락처 입력 후")
                         self._log_all_inputs_status("두 번째 연락처 입력 후")
@@ -1614,8 +2033,28 @@ class IljinHoldingsAutomation(BaseAutomation):
             
             vehicle_li = current_ul.find_element(By.CSS_SELECTOR, "li.list_5")
             vehicle_button = vehicle_li.find_element(By.CSS_SELECTOR, "button.button-itemadd")
-            vehicle_button.click()
-            time.sleep(1)
+            
+            # 빠른 경로: 팝업 범위 안에서 입력/등록/닫힘 대기를 스크립트 한 번으로 처리
+            fast = self._fill_vehicle_popup_fast(vehicle_button, vehicle_type, vehicle_number)
+            if fast.get('closed'):
+                logger.info(f"=== 차량정보 입력 완료 (빠른 경로): {visitor.get('성명', 'Unknown')} ===")
+                return True
+            
+            if fast.get('alert'):
+                # 등록 후 알림창은 대부분 입력값 검증 오류
+                logger.error(f"차량정보 등록 실패 (알림창): {fast['alert']}")
+                self._dismiss_vehicle_popups()
+                return False
+            
+            if fast.get('registered'):
+                # 등록은 눌렸으나 팝업이 닫히지 않음
+                logger.warning(f"차량정보 등록 후 팝업이 닫히지 않았습니다: {fast.get('message', '')}")
+                self._dismiss_vehicle_popups()
+                return True
+            
+            if fast.get('opened'):
+                logger.info(f"차량정보 빠른 경로 실패 ({fast.get('message', '')}), 기존 방법으로 입력합니다")
+            self._open_vehicle_popup_after_fast(vehicle_button, fast)
             
             # 차량정보 팝업 열린 후 피방문자 연락처 상태 확인
             logger.info("차량정보 팝업 열린 후 피방문자 연락처 상태 확인...")
@@ -1634,7 +2073,8 @@ class IljinHoldingsAutomation(BaseAutomation):
             self._log_all_inputs_status("차량정보 팝업 닫힌 후")
             
             # 추가로 3초 후 한 번 더 확인
-            time.sleep(3)
+            if not self._contact_watch_active:
+                time.sleep(3)
             logger.info("차량정보 팝업 닫힌 후 3초 후 피방문자 연락처 상태 확인...")
             self._monitor_applicant_contact_changes("차량정보 팝업 닫힌 후 3초 후")
             self._log_applicant_contact_status("차량정보 팝업 닫힌 후 3초 후")
@@ -1792,40 +2232,42 @@ class IljinHoldingsAutomation(BaseAutomation):
                             logger.error(f"모든 차량번호 입력 방법 실패: {e3}")
                             return False
                 
-                # 차량번호 입력 후 피방문자 연락처 상태 단계별 모니터링
-                logger.info("=== 차량번호 입력 후 피방문자 연락처 상태 단계별 모니터링 시작 ===")
+                # 차량번호 입력 후 피방문자 연락처 상태 단계별 모니터링 (감시기가 있으면 변경 기록으로 대체)
+                if not self._contact_watch_active:
+                    logger.info("=== 차량번호 입력 후 피방문자 연락처 상태 단계별 모니터링 시작 ===")
                 
-                # 차량번호 입력 직후 피방문자 연락처 상태 확인 (즉시)
-                logger.info("차량번호 입력 직후 피방문자 연락처 상태 확인 (즉시)...")
-                self._monitor_applicant_contact_changes("차량번호 입력 직후 (즉시)")
-                self._log_applicant_contact_status("차량번호 입력 직후 (즉시)")
+                    # 차량번호 입력 직후 피방문자 연락처 상태 확인 (즉시)
+                    logger.info("차량번호 입력 직후 피방문자 연락처 상태 확인 (즉시)...")
+                    self._monitor_applicant_contact_changes("차량번호 입력 직후 (즉시)")
+                    self._log_applicant_contact_status("차량번호 입력 직후 (즉시)")
                 
-                # 차량번호 입력 후 1초 대기 후 피방문자 연락처 상태 확인
-                time.sleep(1)
-                logger.info("차량번호 입력 후 1초 대기 후 피방문자 연락처 상태 확인...")
-                self._monitor_applicant_contact_changes("차량번호 입력 후 1초")
-                self._log_applicant_contact_status("차량번호 입력 후 1초")
+                    # 차량번호 입력 후 1초 대기 후 피방문자 연락처 상태 확인
+                    time.sleep(1)
+                    logger.info("차량번호 입력 후 1초 대기 후 피방문자 연락처 상태 확인...")
+                    self._monitor_applicant_contact_changes("차량번호 입력 후 1초")
+                    self._log_applicant_contact_status("차량번호 입력 후 1초")
                 
-                # 차량번호 입력 후 2초 대기 후 피방문자 연락처 상태 확인
-                time.sleep(1)
-                logger.info("차량번호 입력 후 2초 대기 후 피방문자 연락처 상태 확인...")
-                self._monitor_applicant_contact_changes("차량번호 입력 후 2초")
-                self._log_applicant_contact_status("차량번호 입력 후 2초")
+                    # 차량번호 입력 후 2초 대기 후 피방문자 연락처 상태 확인
+                    time.sleep(1)
+                    logger.info("차량번호 입력 후 2초 대기 후 피방문자 연락처 상태 확인...")
+                    self._monitor_applicant_contact_changes("차량번호 입력 후 2초")
+                    self._log_applicant_contact_status("차량번호 입력 후 2초")
                 
-                # 차량번호 입력 후 3초 대기 후 피방문자 연락처 상태 확인
-                time.sleep(1)
-                logger.info("차량번호 입력 후 3초 대기 후 피방문자 연락처 상태 확인...")
-                self._monitor_applicant_contact_changes("차량번호 입력 후 3초")
-                self._log_applicant_contact_status("차량번호 입력 후 3초")
+                    # 차량번호 입력 후 3초 대기 후 피방문자 연락처 상태 확인
+                    time.sleep(1)
+                    logger.info("차량번호 입력 후 3초 대기 후 피방문자 연락처 상태 확인...")
+                    self._monitor_applicant_contact_changes("차량번호 입력 후 3초")
+                    self._log_applicant_contact_status("차량번호 입력 후 3초")
                 
-                logger.info("=== 차량번호 입력 후 피방문자 연락처 상태 단계별 모니터링 완료 ===")
+                    logger.info("=== 차량번호 입력 후 피방문자 연락처 상태 단계별 모니터링 완료 ===")
                 
                 # 차량번호 입력으로 인한 피방문자 연락처 변조 복원
                 logger.info("차량번호 입력으로 인한 피방문자 연락처 변조 복원 시작...")
                 self._restore_applicant_contact_after_vehicle_input()
                 
                 # 복원 후 피방문자 연락처 상태 확인
-                time.sleep(1)
+                if not self._contact_watch_active:
+                    time.sleep(1)
                 logger.info("피방문자 연락처 복원 후 상태 확인...")
                 self._monitor_applicant_contact_changes("피방문자 연락처 복원 후")
                 self._log_applicant_contact_status("피방문자 연락처 복원 후")
@@ -1884,46 +2326,8 @@ class IljinHoldingsAutomation(BaseAutomation):
                 time.sleep(3)
                 
                 # 팝업이 실제로 닫혔는지 확인 및 강제 닫기
-                try:
-                    time.sleep(2)  # 추가 대기
-                    
-                    # SweetAlert2 팝업 확인 및 닫기
-                    swal_popups = self.driver.find_elements(By.CSS_SELECTOR, ".swal2-popup, .swal2-modal")
-                    if swal_popups:
-                        logger.warning("SweetAlert2 팝업이 감지되었습니다. 닫기 시도...")
-                        # SweetAlert2 닫기 버튼 찾기
-                        try:
-                            close_button = self.driver.find_element(By.CSS_SELECTOR, ".swal2-confirm, .swal2-cancel, .swal2-close")
-                            self.driver.execute_script("arguments[0].click();", close_button)
-                            logger.info("SweetAlert2 팝업 닫기 버튼 클릭 완료")
-                        except:
-                            # ESC 키로 닫기 시도
-                            from selenium.webdriver.common.keys import Keys
-                            self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-                            logger.info("ESC 키로 SweetAlert2 팝업 닫기 시도")
-                        
-                        time.sleep(1)
-                    
-                    # 일반 팝업 요소 확인
-                    popup_elements = self.driver.find_elements(By.CSS_SELECTOR, ".modal, .popup, [role='dialog']")
-                    if not popup_elements:
-                        logger.info("모든 팝업이 성공적으로 닫혔습니다")
-                    else:
-                        logger.warning("일부 팝업이 아직 열려있습니다. 강제 닫기 시도...")
-                        # 강제로 ESC 키를 눌러 팝업 닫기 시도
-                        from selenium.webdriver.common.keys import Keys
-                        self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-                        time.sleep(1)
-                        
-                except Exception as e:
-                    logger.warning(f"팝업 상태 확인 중 오류: {e}")
-                    # 오류 발생 시에도 ESC 키로 닫기 시도
-                    try:
-                        from selenium.webdriver.common.keys import Keys
-                        self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-                        time.sleep(1)
-                    except:
-                        pass
+                time.sleep(2)  # 추가 대기
+                self._dismiss_vehicle_popups()
                 
             except Exception as e:
                 logger.error(f"등록 버튼 클릭 실패: {e}")
@@ -1935,6 +2339,164 @@ class IljinHoldingsAutomation(BaseAutomation):
             logger.error(f"차량정보 팝업 입력 중 오류: {e}")
             return False
             
+    def _fill_vehicle_popup_fast(self, vehicle_button: WebElement, vehicle_type: str, vehicle_number: str,
+                                 timeout: float = 5.0) -> Dict[str, Any]:
+        """차량정보 빠른 경로 - 팝업 열기, 팝업 내부 입력 필드 채우기, 등록 클릭, 닫힘 대기를 스크립트 한 번으로 처리
+
+        반환값: {'clicked': 차량정보 버튼 클릭, 'opened': 팝업 열림, 'registered': 등록 클릭, 'closed': 팝업 닫힘,
+                 'alert': 등록 후 표시된 알림창 문구, 'message': 실패 사유}
+        이미 팝업이 떠 있으면 버튼을 다시 누르지 않는다. 스크립트 오류 시에는 {} 를 반환한다.
+        """
+        try:
+            return self.driver.execute_async_script("""
+                var button = arguments[0];
+                var carNm = arguments[1];
+                var carNumber = arguments[2];
+                var timeoutMs = arguments[3];
+                var done = arguments[arguments.length - 1];
+                var popupSelector = arguments[4];
+                var setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+                var state = {clicked: false, opened: false, registered: false, closed: false, alert: '', message: ''};
+                var deadline = Date.now() + timeoutMs;
+                
+                function isShown(element) {
+                    // position: fixed 모달은 offsetParent 가 null 이므로 렌더링 박스로 판단
+                    return element.isConnected && element.getClientRects().length > 0;
+                }
+                
+                function visiblePopup() {
+                    return Array.from(document.querySelectorAll(popupSelector)).find(function(popup) {
+                        return isShown(popup) && popup.querySelectorAll('input[type="text"]').length >= 2;
+                    });
+                }
+                
+                function waitFor(check, next) {
+                    var found = check();
+                    if (found) { next(found); return; }
+                    if (Date.now() > deadline) { done(state); return; }
+                    requestAnimationFrame(function() { waitFor(check, next); });
+                }
+                
+                function setValue(input, value) {
+                    setter.call(input, value);
+                    input.dispatchEvent(new Event('input', { bubbles: true }));
+                    input.dispatchEvent(new Event('change', { bubbles: true }));
+                }
+                
+                if (!visiblePopup()) {
+                    button.click();
+                    state.clicked = true;
+                }
+                waitFor(visiblePopup, function(popup) {
+                    state.opened = true;
+                    
+                    // 팝업 범위 안의 입력 필드만 사용 (메인 폼 입력 필드 오염 방지)
+                    var inputs = popup.querySelectorAll('input[type="text"]');
+                    var vm = popup.__vue__;
+                    if (vm && 'carNm' in vm) vm.carNm = carNm;
+                    if (vm && 'carNumber' in vm) vm.carNumber = carNumber;
+                    setValue(inputs[0], carNm);
+                    setValue(inputs[1], carNumber);
+                    if (inputs[0].value !== carNm || inputs[1].value !== carNumber) {
+                        state.message = '입력값 확인 실패';
+                        done(state);
+                        return;
+                    }
+                    
+                    var register = popup.querySelector('button.button-request') ||
+                        Array.from(popup.querySelectorAll('button')).find(function(candidate) {
+                            var text = candidate.innerText.trim();
+                            return text.indexOf('등록') !== -1 && text.indexOf('신청') === -1;
+                        });
+                    if (!register) {
+                        state.message = '팝업 내 등록 버튼 없음';
+                        done(state);
+                        return;
+                    }
+                    
+                    register.click();
+                    state.registered = true;
+                    state.message = '팝업 닫힘 대기 시간 초과';
+                    waitFor(function() {
+                        var alert = document.querySelector('.swal2-popup, .swal2-modal');
+                        if (alert) {
+                            state.alert = (alert.innerText || '').trim();
+                            state.message = '알림창 표시됨';
+                            deadline = 0;
+                            return false;
+                        }
+                        return !isShown(popup);
+                    }, function() {
+                        state.closed = true;
+                        state.message = '';
+                        done(state);
+                    });
+                });
+            """, vehicle_button, vehicle_type, vehicle_number or '', int(timeout * 1000), VEHICLE_POPUP_SELECTOR) or {}
+            
+        except Exception as e:
+            logger.warning(f"차량정보 빠른 경로 오류: {e}")
+            return {}
+            
+    def _is_vehicle_popup_open(self) -> bool:
+        """차량정보 입력 팝업(입력 필드 2개 이상)이 화면에 떠 있는지 확인"""
+        return bool(self.driver.execute_script(VEHICLE_POPUP_OPEN_SCRIPT, VEHICLE_POPUP_SELECTOR))
+            
+    def _open_vehicle_popup_after_fast(self, vehicle_button: WebElement, fast: Dict[str, Any]) -> None:
+        """빠른 경로 실패 후 기존 방법용 팝업 열기 - 빠른 경로가 이미 눌렀거나 팝업이 떠 있으면 다시 누르지 않음"""
+        if fast.get('opened') or self._is_vehicle_popup_open():
+            return
+        if fast.get('clicked') is not False:
+            # 클릭했거나(스크립트 오류로) 클릭 여부를 모르는 경우 팝업이 늦게 뜨는지 먼저 확인
+            if self._wait_for_page_condition(VEHICLE_POPUP_OPEN_SCRIPT, 2, VEHICLE_POPUP_SELECTOR):
+                return
+            if fast.get('clicked'):
+                logger.warning("차량정보 버튼을 눌렀지만 팝업이 열리지 않았습니다")
+                return
+        vehicle_button.click()
+        time.sleep(1)
+            
+    def _dismiss_vehicle_popups(self) -> None:
+        """차량정보 등록 후 남아 있는 알림창/팝업 닫기"""
+        try:
+            # SweetAlert2 팝업 확인 및 닫기
+            swal_popups = self.driver.find_elements(By.CSS_SELECTOR, ".swal2-popup, .swal2-modal")
+            if swal_popups:
+                logger.warning("SweetAlert2 팝업이 감지되었습니다. 닫기 시도...")
+                # SweetAlert2 닫기 버튼 찾기
+                try:
+                    close_button = self.driver.find_element(By.CSS_SELECTOR, ".swal2-confirm, .swal2-cancel, .swal2-close")
+                    self.driver.execute_script("arguments[0].click();", close_button)
+                    logger.info("SweetAlert2 팝업 닫기 버튼 클릭 완료")
+                except:
+                    # ESC 키로 닫기 시도
+                    from selenium.webdriver.common.keys import Keys
+                    self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
+                    logger.info("ESC 키로 SweetAlert2 팝업 닫기 시도")
+                
+                time.sleep(1)
+            
+            # 일반 팝업 요소 확인
+            popup_elements = self.driver.find_elements(By.CSS_SELECTOR, ".modal, .popup, [role='dialog']")
+            if not popup_elements:
+                logger.info("모든 팝업이 성공적으로 닫혔습니다")
+            else:
+                logger.warning("일부 팝업이 아직 열려있습니다. 강제 닫기 시도...")
+                # 강제로 ESC 키를 눌러 팝업 닫기 시도
+                from selenium.webdriver.common.keys import Keys
+                self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
+                time.sleep(1)
+                
+        except Exception as e:
+            logger.warning(f"팝업 상태 확인 중 오류: {e}")
+            # 오류 발생 시에도 ESC 키로 닫기 시도
+            try:
+                from selenium.webdriver.common.keys import Keys
+                self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
+                time.sleep(1)
+            except:
+                pass
+            
     def _fill_vehicle_info_for_applicant(self, visitor: Dict[str, Any]) -> bool:
         """신청자와 동일한 방문객의 차량정보 입력"""
         try:
@@ -1959,8 +2521,18 @@ class IljinHoldingsAutomation(BaseAutomation):
                         # 해당 ul의 차량정보 등록 버튼 클릭 (list_5)
                         vehicle_li = ul.find_element(By.CSS_SELECTOR, "li.list_5")
                         vehicle_button = vehicle_li.find_element(By.CSS_SELECTOR, "button.button-itemadd")
-                        vehicle_button.click()
-                        time.sleep(1)
+                        
+                        fast = self._fill_vehicle_popup_fast(vehicle_button, vehicle_type, vehicle_number)
+                        if fast.get('alert'):
+                            logger.error(f"신청자 차량정보 등록 실패 (알림창): {fast['alert']}")
+                            self._dismiss_vehicle_popups()
+                            return False
+                        if fast.get('closed') or fast.get('registered'):
+                            if not fast.get('closed'):
+                                self._dismiss_vehicle_popups()
+                            logger.info("신청자 차량정보 입력 완료 (빠른 경로)")
+                            return True
+                        self._open_vehicle_popup_after_fast(vehicle_button, fast)
                         
                         # 팝업에서 차량정보 입력
                         if self._fill_vehicle_popup(vehicle_type, vehicle_number):
@@ -2078,27 +2650,33 @@ class IljinHoldingsAutomation(BaseAutomation):
     def _ensure_element_visible(self, element):
         """요소가 화면에 보이도록 강화된 스크롤 처리"""
         try:
-            # 여러 스크롤 방법 시도
-            scroll_methods = [
-                "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});",
-                "arguments[0].scrollIntoView({block: 'start'});",
-                "arguments[0].scrollIntoView({block: 'end'});",
-                "window.scrollTo(0, arguments[0].offsetTop - 100);",
-                "arguments[0].scrollIntoView();"
-            ]
+            # 한 번 스크롤 후 IntersectionObserver로 뷰포트 진입 대기
+            if DomObservers.scroll_into_view_and_wait(self.driver, element, timeout=2.0):
+                return True
             
-            for method in scroll_methods:
-                try:
-                    self.driver.execute_script(method, element)
+            logger.debug("IntersectionObserver 가시성 확인 실패, 기존 스크롤 방법으로 재시도")
+            
+            # 여러 스크롤 방법 시도 (지난번에 성공한 방법부터)
+            scroll_methods = {
+                'center_smooth': "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});",
+                'start': "arguments[0].scrollIntoView({block: 'start'});",
+                'end': "arguments[0].scrollIntoView({block: 'end'});",
+                'offset_top': "window.scrollTo(0, arguments[0].offsetTop - 100);",
+                'default': "arguments[0].scrollIntoView();"
+            }
+            
+            def attempt(script):
+                def run():
+                    self.driver.execute_script(script, element)
                     time.sleep(1)
-                    
                     # 요소가 실제로 보이는지 확인
-                    if self._is_element_visible(element):
-                        logger.info("요소가 성공적으로 화면에 표시됨")
-                        return True
-                except Exception as e:
-                    logger.warning(f"스크롤 방법 실패: {method}, 오류: {e}")
-                    continue
+                    return self._is_element_visible(element)
+                return run
+            
+            memo = self.get_strategy_memo()
+            if memo.run('scroll', {name: attempt(script) for name, script in scroll_methods.items()}):
+                logger.info("요소가 성공적으로 화면에 표시됨")
+                return True
             
             # 마지막 시도: 페이지 하단으로 스크롤
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
@@ -2142,23 +2720,23 @@ class IljinHoldingsAutomation(BaseAutomation):
             
             # 요소 타입에 따른 JavaScript 입력 방법
             if element_type == 'textarea':
-                js_methods = [
+                js_methods = {
                     # textarea 전용 방법들
-                    "arguments[0].value = arguments[1];",
-                    "arguments[0].innerHTML = arguments[1]; arguments[0].value = arguments[1];",
-                    "arguments[0].textContent = arguments[1]; arguments[0].value = arguments[1];",
-                    "arguments[0].innerText = arguments[1]; arguments[0].value = arguments[1];"
-                ]
+                    'value': "arguments[0].value = arguments[1];",
+                    'inner_html': "arguments[0].innerHTML = arguments[1]; arguments[0].value = arguments[1];",
+                    'text_content': "arguments[0].textContent = arguments[1]; arguments[0].value = arguments[1];",
+                    'inner_text': "arguments[0].innerText = arguments[1]; arguments[0].value = arguments[1];"
+                }
             else:
                 # input 전용 방법들
-                js_methods = [
-                    "arguments[0].value = arguments[1];",
-                    "arguments[0].setAttribute('value', arguments[1]);",
-                    "arguments[0].defaultValue = arguments[1]; arguments[0].value = arguments[1];"
-                ]
+                js_methods = {
+                    'value': "arguments[0].value = arguments[1];",
+                    'set_attribute': "arguments[0].setAttribute('value', arguments[1]);",
+                    'default_value': "arguments[0].defaultValue = arguments[1]; arguments[0].value = arguments[1];"
+                }
             
-            for method in js_methods:
-                try:
+            def attempt(name, method):
+                def run():
                     self.driver.execute_script(method, element, value)
                     
                     # 다양한 이벤트 발생
@@ -2189,17 +2767,16 @@ class IljinHoldingsAutomation(BaseAutomation):
                     # 값이 실제로 설정되었는지 확인
                     actual_value = element.get_attribute('value')
                     if actual_value == value:
-                        logger.info(f"JavaScript 입력 성공 ({element_type}, 방법 {js_methods.index(method) + 1}): {value}")
+                        logger.info(f"JavaScript 입력 성공 ({element_type}, 방법 {name}): {value}")
                         return True
-                    else:
-                        logger.warning(f"JavaScript 입력 실패 ({element_type}, 방법 {js_methods.index(method) + 1}). 예상값: {value}, 실제값: {actual_value}")
-                        continue
-                        
-                except Exception as e:
-                    logger.warning(f"JavaScript 입력 방법 {js_methods.index(method) + 1} 실패: {e}")
-                    continue
+                    logger.warning(f"JavaScript 입력 실패 ({element_type}, 방법 {name}). 예상값: {value}, 실제값: {actual_value}")
+                    return False
+                return run
             
-            return False
+            # 같은 요소 종류에서 지난번에 성공한 방법부터 시도
+            memo = self.get_strategy_memo()
+            winner = memo.run(f"js_input:{element_type}", {name: attempt(name, method) for name, method in js_methods.items()})
+            return winner is not None
                 
         except Exception as e:
             logger.error(f"JavaScript 입력 중 오류: {e}")
@@ -2339,24 +2916,40 @@ class IljinHoldingsAutomation(BaseAutomation):
             # 브라우저 유지 설정
             self.set_keep_browser(keep_browser)
             
-            # 1. 웹드라이버 설정
-            self.setup_driver()
-            
-            # 2. 웹사이트 접속
-            if not self.navigate_to_website():
-                return False
-                
-            # 3. 일진홀딩스 선택
-            if not self.select_iljin_holdings():
-                return False
-                
-            # 4. 방문신청하기 선택
-            if not self.select_visit_request():
-                return False
-                
-            # 5. 방문신청약관 동의
-            if not self.agree_to_terms():
-                return False
+            # 1. 웹드라이버 설정 (일괄 처리에서 같은 인스턴스로 다음 신청을 처리할 때는 기존 브라우저 재사용)
+            self.set_step('setup_driver')
+            if self.driver is None:
+                self.setup_driver()
+            else:
+                logger.info("기존 브라우저를 재사용합니다")
+            
+            # 2~5. 딥링크 빠른 이동 (실패 시 메인 → 일진홀딩스 → 방문신청 → 약관 동의 클릭 경로)
+            navigation = ConfigManager.get_value(self.config, 'navigation', {}) or {}
+            self.set_step('navigate_direct')
+            deep_linked = navigation.get('deep_link', True) and \
+                self.navigate_direct_to_visit_form(navigation.get('ready_timeout', 10))
+            
+            if not deep_linked:
+                # 2. 웹사이트 접속
+                self.set_step('navigate_to_website')
+                if not self.navigate_to_website():
+                    return False
+                    
+                # 3. 일진홀딩스 선택
+                self.set_step('select_iljin_holdings')
+                if not self.select_iljin_holdings():
+                    return False
+                    
+                # 4. 방문신청하기 선택
+                self.set_step('select_visit_request')
+                if not self.select_visit_request():
+                    return False
+                    
+                # 5. 방문신청약관 동의
+                self.set_step('agree_to_terms')
+                if not self.agree_to_terms():
+                    return False
+                self._visit_consent_given = True
                 
             # 5-1. 폼 작성 전 피방문자 연락처 상태 확인 (페이지 로딩 직후)
             logger.info("방문신청약관 동의 후 폼 작성 전 피방문자 연락처 상태 확인...")
@@ -2365,6 +2958,7 @@ class IljinHoldingsAutomation(BaseAutomation):
             self._log_all_inputs_status("방문신청약관 동의 후 폼 작성 전")
                 
             # 6. 폼 작성 (피방문자 정보 입력 → 확인 버튼 클릭 → 신청자 정보 입력)
+            self.set_step('fill_form')
             if not self.fill_form(data):
                 return False
                 
@@ -2373,6 +2967,7 @@ class IljinHoldingsAutomation(BaseAutomation):
             #     return False
                 
             # 8. 결과 검증
+            self.set_step('validate_result')
             if not self.validate_result():
                 return False
                 
@@ -2472,11 +3067,99 @@ class IljinHoldingsAutomation(BaseAutomation):
         except Exception as e:
             logger.error(f"페이지 구조 디버깅 중 오류: {e}")
 
+    def _install_applicant_contact_watcher(self) -> bool:
+        """피방문자 연락처(select + input 2개)와 피방문자 성명 필드에 값 변경 감시기 설치"""
+        try:
+            fields = self.driver.execute_script("""
+                var fields = {elements: [], labels: []};
+                var cells = Array.from(document.querySelectorAll('table.visit-info-table td'));
+                
+                var contactCell = cells.find(function(td) { return td.innerText.indexOf('피방문자 연락처') !== -1; });
+                var contactInputs = contactCell && contactCell.nextElementSibling;
+                if (!contactInputs) return fields;
+                var select = contactInputs.querySelector('select');
+                if (select) { fields.elements.push(select); fields.labels.push('contact_prefix'); }
+                contactInputs.querySelectorAll('input[type="text"]').forEach(function(input, index) {
+                    if (index < 2) { fields.elements.push(input); fields.labels.push('contact_' + (index + 1)); }
+                });
+                
+                var nameCell = cells.find(function(td) { return td.innerText.trim() === '피방문자'; });
+                var nameInput = nameCell && nameCell.nextElementSibling && nameCell.nextElementSibling.querySelector('input');
+                if (nameInput) { fields.elements.push(nameInput); fields.labels.push('visit_person'); }
+                return fields;
+            """)
+            
+            if not fields or len(fields.get('elements', [])) < 3:
+                logger.warning("피방문자 연락처 필드를 찾지 못해 감시기를 설치하지 않습니다")
+                return False
+            
+            initial = DomObservers.watch_fields(self.driver, 'applicant_contact', fields['elements'], fields['labels'])
+            self._contact_watch_active = initial is not None
+            if self._contact_watch_active:
+                logger.info(f"피방문자 연락처 감시기 설치 완료: {initial}")
+            return self._contact_watch_active
+            
+        except Exception as e:
+            logger.warning(f"피방문자 연락처 감시기 설치 실패: {e}")
+            return False
+            
+    def _expected_applicant_contact(self, applicant_data: Dict[str, Any]) -> Dict[str, str]:
+        """엑셀 데이터 기준 감시 필드 기대값"""
+        expected = {}
+        parts = str(applicant_data.get('피방문자 연락처', '') or '').split('-')
+        if len(parts) == 3:
+            expected.update({'contact_prefix': parts[0], 'contact_1': parts[1], 'contact_2': parts[2]})
+        if applicant_data.get('피방문자'):
+            expected['visit_person'] = applicant_data['피방문자']
+        return expected
+            
+    def _applicant_contact_matches(self) -> Optional[bool]:
+        """감시 필드 현재 값이 기대값과 같은지 확인 (기록은 유지, 확인 불가 시 None)"""
+        state = DomObservers.drain_field_changes(self.driver, 'applicant_contact', clear=False)
+        if not state or state.get('detached'):
+            return None
+        expected = self._expected_applicant_contact(getattr(self, 'current_applicant_data', None) or {})
+        return all(state['values'].get(label, value) == value for label, value in expected.items())
+            
+    def _verify_applicant_contact_from_watcher(self, applicant_data: Dict[str, Any]) -> Optional[bool]:
+        """감시기 변경 기록을 한 번에 가져와 피방문자 정보 무결성 검증 (확인 불가 시 None)"""
+        state = DomObservers.drain_field_changes(self.driver, 'applicant_contact')
+        if not state:
+            return None
+        if state.get('detached'):
+            logger.warning(f"감시 중인 필드가 DOM에서 분리되었습니다: {state['detached']}")
+            return None
+        
+        changes = state.get('changes', [])
+        logger.info(f"피방문자 정보 변경 기록 {len(changes)}건")
+        for change in changes:
+            logger.info(f"  [{change['time']}] {change['field']}: '{change['old']}' → '{change['new']}' ({change['trigger']})")
+        
+        mismatched = {
+            label: (value, state['values'].get(label))
+            for label, value in self._expected_applicant_contact(applicant_data).items()
+            if label in state['values'] and state['values'][label] != value
+        }
+        if mismatched:
+            logger.error("❌ 피방문자 정보가 변경되었습니다!")
+            for label, (expected, actual) in mismatched.items():
+                logger.error(f"  {label} 기대값: '{expected}', 실제값: '{actual}'")
+            return False
+        
+        logger.info("✅ 피방문자 정보가 변경되지 않았습니다")
+        return True
+            
     def _verify_applicant_info_unchanged(self, applicant_data: Dict[str, Any]) -> bool:
         """방문객 정보 입력 후 피방문자 정보가 변경되지 않았는지 확인"""
         try:
             logger.info("피방문자 정보 변경 여부 확인 중...")
             
+            # 감시기 기록을 한 번에 조회하여 검증 (실패 시 기존 크롤링 검증)
+            if self._contact_watch_active:
+                verified = self._verify_applicant_contact_from_watcher(applicant_data)
+                if verified is not None:
+                    return verified
+            
             # 피방문자 정보 ul 찾기 (연락처 input이 3개인 ul)
             all_uls = self.driver.find_elements(By.CSS_SELECTOR, "ul")
             applicant_ul = None
@@ -2561,6 +3244,10 @@ class IljinHoldingsAutomation(BaseAutomation):
 
     def _log_applicant_contact_status(self, stage: str):
         """피방문자 연락처 상태 상세 로깅 (파일 저장용)"""
+        if self._contact_watch_active:
+            # 페이지 내 감시기가 모든 변경을 기록하므로 단계별 크롤링 생략
+            return
+            
         try:
             timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
             log_message = f"\n[{timestamp}] === {stage} 피방문자 연락처 상태 ===\n"
@@ -2637,6 +3324,10 @@ class IljinHoldingsAutomation(BaseAutomation):
     
     def _log_all_inputs_status(self, stage: str):
         """모든 input 요소 상태 로깅 (파일 저장용)"""
+        if self._contact_watch_active:
+            # 페이지 내 감시기가 모든 변경을 기록하므로 단계별 크롤링 생략
+            return
+            
         try:
             timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
             log_message = f"\n[{timestamp}] === {stage} 모든 input 요소 상태 ===\n"
@@ -2689,6 +3380,11 @@ class IljinHoldingsAutomation(BaseAutomation):
         try:
             logger.info("차량번호 입력으로 인한 피방문자 연락처 변조 복원 시작...")
             
+            # 감시기가 있으면 현재 값만 확인하여 실제로 바뀐 경우에만 복원
+            if self._contact_watch_active and self._applicant_contact_matches() is True:
+                logger.info("피방문자 연락처가 변경되지 않아 복원을 생략합니다")
+                return True
+            
             # 현재 실행 중인 데이터에서 원래 피방문자 연락처 값 가져오기
             if hasattr(self, 'current_applicant_data') and self.current_applicant_data:
                 original_contact = self.current_applicant_data.get('피방문자 연락처', '')
@@ -2760,6 +3456,10 @@ class IljinHoldingsAutomation(BaseAutomation):
     
     def _monitor_applicant_contact_changes(self, stage: str):
         """피방문자 연락처 필드 상태 모니터링 및 로깅"""
+        if self._contact_watch_active:
+            # 페이지 내 감시기가 모든 변경을 기록하므로 단계별 크롤링 생략
+            return
+            
         try:
             logger.info(f"=== {stage} 피방문자 연락처 상태 모니터링 ===")
             
@@ -0,0 +1,283 @@
+"""
+일진홀딩스 방문신청 분할/일괄 실행기
+- 사이트 한도(방문객 20명)를 넘는 방문객 목록을 같은 신청자 정보의 여러 방문신청으로 나누어
+  각각 별도 브라우저에서 동시에 실행하고 결과를 하나로 합침
+- 엑셀의 모든 신청자 행(방문객정보 블록 포함)을 워커별 브라우저를 재사용하며 일괄 처리
+"""
+
+import copy
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, Any, List
+
+from loguru import logger
+
+from src.core.config_manager import ConfigManager
+from src.core.web_driver_manager import WebDriverManager
+from src.core.browser_supervisor import BrowserSupervisor
+from .automation import IljinHoldingsAutomation
+
+
+# 일진홀딩스 방문신청 한 건에 입력할 수 있는 최대 방문객 수
+DEFAULT_MAX_VISITORS = 20
+
+
+def split_visitors(visitor_data: List[Dict[str, Any]], max_visitors: int = DEFAULT_MAX_VISITORS) -> List[List[Dict[str, Any]]]:
+    """방문객 목록을 방문신청 한 건 단위로 분할"""
+    max_visitors = max(1, int(max_visitors))
+    return [visitor_data[i:i + max_visitors] for i in range(0, len(visitor_data), max_visitors)]
+
+
+def run_visit_request(config: Dict[str, Any], applicant_data: Dict[str, Any],
+                      visitors: List[Dict[str, Any]], request_no: int, keep_browser: bool = True) -> Dict[str, Any]:
+    """방문신청 한 건 실행 (브라우저 1개)"""
+    result = {
+        'request_no': request_no,
+        'visitor_count': len(visitors),
+        'visitors': [visitor.get('성명', '') for visitor in visitors],
+        'success': False,
+        'message': '',
+        'automation': None
+    }
+
+    automation = IljinHoldingsAutomation(config)
+    automation.set_keep_browser(keep_browser)
+    result['automation'] = automation
+
+    try:
+        logger.info(f"[방문신청 {request_no}] 시작: 방문객 {len(visitors)}명")
+
+        if not automation.run_automation(applicant_data, keep_browser):
+            result['message'] = '신청자 정보 입력 실패'
+            return result
+
+        if visitors and not automation.fill_visitor_information(visitors, applicant_data):
+            result['message'] = '방문객 정보 입력 실패'
+            return result
+
+        result['success'] = True
+        result['message'] = '완료'
+        return result
+
+    except Exception as e:
+        logger.error(f"[방문신청 {request_no}] 실행 오류: {e}")
+        result['message'] = str(e)
+        return result
+
+    finally:
+        automation.write_profile_report(f"{automation.SITE_ID}_request_{request_no}")
+        automation.write_trace()
+        automation.flush_strategy_memo()
+        status = "✅ 성공" if result['success'] else f"❌ 실패 ({result['message']})"
+        logger.info(f"[방문신청 {request_no}] {status}")
+
+
+def run_split_visit_requests(config: Dict[str, Any], applicant_data: Dict[str, Any],
+                             visitor_data: List[Dict[str, Any]], keep_browser: bool = True) -> Dict[str, Any]:
+    """방문객 목록을 분할하여 방문신청 여러 건을 동시에 실행하고 통합 결과 반환"""
+    settings = ConfigManager.get_value(config, 'visit_request', {}) or {}
+    max_visitors = settings.get('max_visitors', DEFAULT_MAX_VISITORS)
+    chunks = split_visitors(visitor_data, max_visitors)
+    max_workers = max(1, min(int(settings.get('parallel_requests', 3)), len(chunks)))
+
+    logger.info(f"방문객 {len(visitor_data)}명을 방문신청 {len(chunks)}건으로 분할 "
+                f"(건당 최대 {max_visitors}명, 동시 실행 {max_workers}개)")
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='iljin-request') as executor:
+        futures = [
+            executor.submit(run_visit_request, config, applicant_data, chunk, request_no, keep_browser)
+            for request_no, chunk in enumerate(chunks, start=1)
+        ]
+        for future in as_completed(futures):
+            results.append(future.result())
+
+    results.sort(key=lambda item: item['request_no'])
+    success_count = sum(1 for item in results if item['success'])
+
+    return {
+        'success': success_count == len(results),
+        'total_visitors': len(visitor_data),
+        'total_requests': len(results),
+        'success_count': success_count,
+        'failed_count': len(results) - success_count,
+        'results': results
+    }
+
+
+def expand_visit_requests(visit_requests: List[Dict[str, Any]], max_visitors: int = DEFAULT_MAX_VISITORS) -> List[Dict[str, Any]]:
+    """신청 블록을 실제 방문신청 단위로 전개 (방문객 한도 초과 블록은 분할, 번호는 '3' 또는 '3-2' 형식)"""
+    jobs = []
+    for request_no, request in enumerate(visit_requests, start=1):
+        chunks = split_visitors(request['visitors'], max_visitors) or [[]]
+        for part_no, chunk in enumerate(chunks, start=1):
+            jobs.append({
+                'request_no': f"{request_no}-{part_no}" if len(chunks) > 1 else str(request_no),
+                'applicant': request['applicant'],
+                'visitors': chunk
+            })
+    return jobs
+
+
+def _process_job(automation: IljinHoldingsAutomation, job: Dict[str, Any]) -> Dict[str, Any]:
+    """워커 브라우저에서 방문신청 한 건 처리 후 결과 표 행 반환"""
+    applicant = job['applicant']
+    started = time.time()
+    success = False
+    message = ''
+
+    try:
+        if not automation.run_automation(applicant, keep_browser=True):
+            message = '신청자 정보 입력 실패'
+        elif job['visitors'] and not automation.fill_visitor_information(job['visitors'], applicant):
+            message = '방문객 정보 입력 실패'
+        else:
+            success = True
+            message = '완료'
+    except Exception as e:
+        message = str(e)
+
+    return {
+        '신청번호': job['request_no'],
+        '방문사업장': applicant.get('방문사업장', ''),
+        '피방문자': applicant.get('피방문자', ''),
+        '신청자': applicant.get('신청자', ''),
+        '방문객수': len(job['visitors']),
+        '결과': '성공' if success else '실패',
+        '메시지': message,
+        '소요시간(초)': round(time.time() - started, 1),
+        '처리시각': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+
+def _is_driver_alive(automation: IljinHoldingsAutomation) -> bool:
+    try:
+        return automation.driver is not None and automation.driver.current_url is not None
+    except Exception:
+        return False
+
+
+def _batch_worker(config: Dict[str, Any], jobs: "queue.Queue", results: List[Dict[str, Any]],
+                  lock: threading.Lock, worker_no: int) -> IljinHoldingsAutomation:
+    """워커 하나가 브라우저 하나를 재사용하며 대기열의 방문신청을 순서대로 처리
+
+    건과 건 사이에 브라우저 메모리를 측정하여 기준을 넘으면 다음 건은 새 브라우저로 처리한다.
+    명령 감시기가 멈춘 명령 때문에 브라우저를 종료한 건은 watchdog.max_retries 회까지 대기열에 다시 넣는다.
+    """
+    automation = IljinHoldingsAutomation(config)
+    supervisor = BrowserSupervisor(config)
+    tracked_driver = None
+    max_retries = int(ConfigManager.get_value(config, 'watchdog.max_retries', 1))
+
+    while True:
+        try:
+            job = jobs.get_nowait()
+        except queue.Empty:
+            break
+
+        # 이전 건의 마지막 단계 예산이 다음 건의 상태 확인 명령에 적용되지 않도록 초기화
+        if automation.watchdog:
+            automation.watchdog.set_step('batch_idle')
+
+        # 이전 건에서 브라우저가 죽었으면 다음 건에서 새로 실행
+        if automation.driver is not None and not _is_driver_alive(automation):
+            logger.warning(f"[워커 {worker_no}] 브라우저 응답 없음, 새 브라우저로 재시작합니다")
+            try:
+                WebDriverManager.quit_driver(automation.driver)
+            except Exception:
+                pass
+            automation.driver = None
+
+        logger.info(f"[워커 {worker_no}] 방문신청 {job['request_no']} 처리 시작 (방문객 {len(job['visitors'])}명)")
+        row = _process_job(automation, job)
+
+        trip_reason = automation.watchdog.consume_trip() if automation.watchdog else None
+        if trip_reason:
+            # 감시기가 이미 브라우저를 종료했으므로 드라이버만 정리하고 다음 건은 새 브라우저로 처리
+            try:
+                WebDriverManager.quit_driver(automation.driver)
+            except Exception:
+                pass
+            supervisor.untrack(tracked_driver)
+            automation.driver = None
+            tracked_driver = None
+
+            attempt = job.get('attempt', 0)
+            if attempt < max_retries:
+                job['attempt'] = attempt + 1
+                logger.warning(f"[워커 {worker_no}] 방문신청 {job['request_no']} 재시도 예약 "
+                               f"({job['attempt']}/{max_retries}): {trip_reason}")
+                jobs.put(job)
+                continue
+            row['결과'] = '실패'
+            row['메시지'] = trip_reason
+
+        logger.info(f"[워커 {worker_no}] 방문신청 {job['request_no']} {row['결과']} ({row['메시지']}, {row['소요시간(초)']}초)")
+
+        with lock:
+            results.append(row)
+
+        if automation.driver is not tracked_driver:
+            supervisor.untrack(tracked_driver)
+            tracked_driver = automation.driver
+            supervisor.track(tracked_driver)
+        elif tracked_driver and supervisor.should_recycle(tracked_driver):
+            logger.info(f"[워커 {worker_no}] 메모리 기준 초과로 브라우저를 새로 시작합니다")
+            try:
+                WebDriverManager.quit_driver(tracked_driver)
+            except Exception:
+                pass
+            supervisor.untrack(tracked_driver)
+            automation.driver = None
+            tracked_driver = None
+
+    automation.write_profile_report(f"{automation.SITE_ID}_batch_worker_{worker_no}")
+    automation.write_trace()
+    automation.flush_strategy_memo()
+    return automation
+
+
+def run_batch(config: Dict[str, Any], visit_requests: List[Dict[str, Any]], workers: int = 1,
+              keep_browser: bool = False) -> Dict[str, Any]:
+    """엑셀의 모든 방문신청을 일괄 처리하고 신청별 결과 표 반환
+
+    workers 개의 브라우저가 각각 대기열에서 방문신청을 꺼내 처리하며 브라우저는 워커 안에서 재사용된다.
+    명령 감시기는 브라우저를 다시 띄우고 재시도하는 이 경로에서만 켠다.
+    """
+    config = copy.deepcopy(config)
+    config.setdefault('watchdog', {})['enabled'] = True
+    settings = ConfigManager.get_value(config, 'visit_request', {}) or {}
+    jobs_list = expand_visit_requests(visit_requests, settings.get('max_visitors', DEFAULT_MAX_VISITORS))
+    workers = max(1, min(int(workers), len(jobs_list) or 1))
+
+    logger.info(f"일진홀딩스 일괄 처리 시작: 신청 {len(visit_requests)}건 → 방문신청 {len(jobs_list)}건, 워커 {workers}개")
+
+    jobs: "queue.Queue" = queue.Queue()
+    for job in jobs_list:
+        jobs.put(job)
+
+    results: List[Dict[str, Any]] = []
+    lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='iljin-batch') as executor:
+        futures = [executor.submit(_batch_worker, config, jobs, results, lock, worker_no)
+                   for worker_no in range(1, workers + 1)]
+        automations = [future.result() for future in futures]
+
+    for automation in automations:
+        automation.set_keep_browser(keep_browser)
+        automation.cleanup()
+
+    order = {job['request_no']: index for index, job in enumerate(jobs_list)}
+    results.sort(key=lambda row: order.get(row['신청번호'], 0))
+    success_count = sum(1 for row in results if row['결과'] == '성공')
+
+    return {
+        'success': success_count == len(results),
+        'total_requests': len(results),
+        'success_count': success_count,
+        'failed_count': len(results) - success_count,
+        'results': results
+    }
@@ -2,8 +2,10 @@
 IP 168 ITSM 웹사이트 자동화 플러그인
 """
 
+import json
 import time
 from pathlib import Path
+from urllib.parse import urlparse
 from typing import Dict, Any, Optional, List
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -12,7 +14,11 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from src.core.base_automation import BaseAutomation
+from src.core.config_manager import ConfigManager
 from src.core.web_driver_manager import WebDriverManager
+from src.core.tab_pool import TabPool, TabWait
+from src.core.option_index import OptionIndex
+from src.core.form_schema import FormSchema
 from .element_selectors import IP168ITSMSelectors
 from .excel_reader import ITSMExcelReader
 from loguru import logger
@@ -21,6 +27,8 @@ from loguru import logger
 class IP168ITSMAutomation(BaseAutomation):
     """IP 168 ITSM 웹사이트 자동화 클래스"""
     
+    SITE_ID = "ip_168_itsm"
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.selectors = IP168ITSMSelectors()
@@ -28,13 +36,19 @@ class IP168ITSMAutomation(BaseAutomation):
         self.wait = None
         self.excel_reader = ITSMExcelReader(config)
         self.keep_browser = True  # 기본적으로 브라우저 유지
+        self.company_options: Optional[OptionIndex] = None  # 법인 옵션 목록 (세션 단위 캐시)
+        self.form_schema: Optional[FormSchema] = None  # 회원등록 폼 스키마 (빌드 단위 캐시)
+        self._last_language_strategy: Optional[Dict[str, Any]] = None
+        self._language_changed = False
         
     def setup_driver(self) -> None:
         """웹드라이버 설정"""
         try:
-            self.driver = WebDriverManager.create_driver(self.config)
+            self.driver = WebDriverManager.create_driver(self.config, owner=self.SITE_ID)
+            self.company_options = None
             timeout = self.config.get('website.timeout', 10)
             self.wait = WebDriverWait(self.driver, timeout)
+            self.attach_driver_instrumentation()
             logger.info("IP 168 ITSM 웹드라이버 설정 완료")
         except Exception as e:
             logger.error(f"웹드라이버 설정 오류: {e}")
@@ -56,6 +70,9 @@ class IP168ITSMAutomation(BaseAutomation):
             page_title = self.driver.title
             logger.info(f"페이지 제목: {page_title}")
             
+            # 사이트 빌드 핑거프린트 (재배포 시 사이트 캐시 무효화)
+            self.fingerprint_site()
+            
             logger.info("IP 168 ITSM 웹사이트 접속 완료")
             return True
             
@@ -213,34 +230,59 @@ class IP168ITSMAutomation(BaseAutomation):
             logger.error(f"로그인 성공 확인 오류: {e}")
             return True  # 확인 실패시 성공으로 처리
     
+    def is_logged_in(self) -> bool:
+        """로그인된 세션인지 확인 (로그인 페이지 경로가 아니고 비밀번호 입력 필드가 없음)"""
+        try:
+            login_path = urlparse(self.config.get('website.login_url', self.selectors.LOGIN_PAGE)).path
+            return bool(self.driver.execute_script("""
+                return document.readyState === 'complete' &&
+                    location.pathname.indexOf(arguments[0]) === -1 && !document.querySelector(arguments[1]);
+            """, login_path, self.selectors.PASSWORD_INPUT))
+        except Exception as e:
+            logger.warning(f"로그인 상태 확인 오류: {e}")
+            return False
+    
     def run_automation(self, data: Optional[Dict[str, Any]] = None, keep_browser: bool = True, select_language: bool = True, navigate_to_target: bool = True) -> bool:
         """전체 자동화 실행"""
         try:
             logger.info("IP 168 ITSM 자동화 시작")
             
             # 1. 웹드라이버 설정
+            self.set_step('setup_driver')
             self.setup_driver()
             
-            # 2. 웹사이트 접속
+            # 2. 웹사이트 접속 (첫 접속 전에 로케일 주입)
+            self.set_step('navigate_to_website')
+            self.inject_locale()
             if not self.navigate_to_website():
                 logger.error("웹사이트 접속 실패")
                 return False
             
+            # 재사용한(유지) 브라우저가 이미 로그인된 세션이면 언어 선택/로그인 생략
+            # (접속 단계에서 사이트 URL 로 다시 이동했으므로 이전 실행의 페이지 상태는 남지 않음)
+            already_logged_in = getattr(self.driver, 'rpa_attached', False) and self.is_logged_in()
+            if already_logged_in:
+                logger.info("기존 브라우저의 로그인 세션을 재사용합니다 (언어 선택/로그인 생략)")
+            
             # 3. 로그인 페이지에서 언어 선택 (옵션)
-            if select_language:
+            self.set_step('select_language')
+            if select_language and not already_logged_in:
                 logger.info("로그인 페이지에서 언어 선택 시도")
                 if self.select_language_on_login_page('한국어'):
                     logger.info("✅ 로그인 페이지에서 한국어 선택 성공")
-                    time.sleep(2)  # 언어 변경 후 페이지 로딩 대기
+                    if self._language_changed:
+                        time.sleep(2)  # 언어 변경 후 페이지 로딩 대기
                 else:
                     logger.warning("⚠️ 로그인 페이지에서 언어 선택 실패")
             
             # 4. 로그인
-            if not self.login(data):
+            self.set_step('login')
+            if not already_logged_in and not self.login(data):
                 logger.error("로그인 실패")
                 return False
             
             # 5. 목표 페이지로 이동 (옵션)
+            self.set_step('navigate_to_target_page')
             if navigate_to_target:
                 logger.info("목표 페이지로 이동 시도")
                 if self.navigate_to_target_page():
@@ -264,10 +306,17 @@ class IP168ITSMAutomation(BaseAutomation):
     
     def cleanup(self) -> None:
         """리소스 정리"""
+        if self.screenshots:
+            self.screenshots.flush()
+        self.flush_strategy_memo()
+        if self.watchdog:
+            self.watchdog.close()
         if self.driver and not self.keep_browser:
-            self.driver.quit()
+            WebDriverManager.quit_driver(self.driver)
             logger.info("IP 168 ITSM 웹드라이버 종료")
         elif self.keep_browser:
+            if self.driver:
+                WebDriverManager.release_driver(self.driver)
             logger.info("IP 168 ITSM 브라우저를 열린 상태로 유지합니다")
             
     def set_keep_browser(self, keep_browser: bool) -> None:
@@ -458,11 +507,12 @@ class IP168ITSMAutomation(BaseAutomation):
             logger.info("회원등록 페이지로 직접 이동 시도")
             
             # 직접 URL로 이동 (사용자가 제공한 정확한 경로)
-            registration_url = "http://4.144.198.168/ims/ImsMng001.R01.cmd?rootMenu=MNU180516000001"
+            registration_url = self.selectors.REGISTRATION_PAGE
             self.driver.get(registration_url)
             
-            # 페이지 로딩 대기
-            time.sleep(3)
+            # 페이지 로딩 대기 (고정 sleep 대신 폼 로딩 조건 대기)
+            if not self._wait_for_registration_form_ready():
+                logger.warning("회원등록 폼 로딩 확인 실패 (시간 초과)")
             
             # 페이지 제목 확인
             page_title = self.driver.title
@@ -483,6 +533,84 @@ class IP168ITSMAutomation(BaseAutomation):
             logger.error(f"회원등록 페이지 직접 이동 오류: {e}")
             return False
     
+    def _wait_for_registration_form_ready(self, require_empty: bool = False, timeout: Optional[float] = None) -> bool:
+        """회원등록 폼 준비 완료까지 조건 대기 (require_empty: 성명/사용자ID가 비어 있어야 함)"""
+        registration_config = self.config.get('registration', {}) or {}
+        timeout = timeout if timeout is not None else registration_config.get('ready_timeout', 10)
+        script = """
+            var ready = document.readyState === 'complete' && !window.__rpaNavigating;
+            var nameInput = document.querySelector(arguments[0]);
+            if (!ready || !nameInput) return false;
+            if (!arguments[1]) return true;
+            var idInput = document.querySelector(arguments[2]);
+            return nameInput.value === '' && (!idInput || idInput.value === '');
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script(script, self.selectors.REGISTRATION_FORM_READY, require_empty,
+                                           self.selectors.USER_ID_INPUT)
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def reset_registration_form(self) -> bool:
+        """전체 새로고침 없이 회원등록 폼 초기화 (앱 자체 초기화 버튼 → 클라이언트 라우트 변경)"""
+        try:
+            registration_config = self.config.get('registration', {}) or {}
+            # 명시적인 초기화 버튼만 사용 (취소 버튼은 화면을 벗어나거나 확인 다이얼로그를 띄울 수 있음)
+            reset_texts = registration_config.get('reset_button_texts', ['초기화', 'Reset'])
+            
+            # 1. 앱의 초기화 버튼 (다이얼로그 내부 버튼은 제외)
+            clicked = self.driver.execute_script("""
+                var texts = arguments[0];
+                var buttons = Array.from(document.querySelectorAll('button, input[type="reset"]'));
+                for (var t = 0; t < texts.length; t++) {
+                    for (var i = 0; i < buttons.length; i++) {
+                        var button = buttons[i];
+                        var label = (button.innerText || button.value || '').trim();
+                        if (label !== texts[t] || button.disabled || button.offsetParent === null) continue;
+                        if (button.closest('[role="dialog"]')) continue;
+                        button.click();
+                        return label;
+                    }
+                }
+                return null;
+            """, reset_texts)
+            
+            if clicked:
+                logger.info(f"폼 초기화 버튼 클릭: '{clicked}'")
+                if self._wait_for_registration_form_ready(require_empty=True, timeout=registration_config.get('reset_timeout', 3)):
+                    logger.info("✅ 앱 초기화 버튼으로 회원등록 폼 초기화 완료")
+                    return True
+            
+            # 2. 클라이언트 라우트 변경 (history API + popstate, 번들 재다운로드 없음)
+            self.driver.execute_script("""
+                var url = new URL(arguments[0], window.location.href);
+                url.searchParams.set('_rpa', Date.now());
+                window.history.pushState({}, '', url.pathname + url.search);
+                window.dispatchEvent(new PopStateEvent('popstate', { state: {} }));
+            """, self.selectors.REGISTRATION_PAGE)
+            if self._wait_for_registration_form_ready(require_empty=True, timeout=registration_config.get('reset_timeout', 3)):
+                logger.info("✅ 클라이언트 라우트 변경으로 회원등록 폼 초기화 완료")
+                return True
+            
+            logger.warning("⚠️ 앱 내 폼 초기화 실패")
+            return False
+            
+        except Exception as e:
+            logger.error(f"회원등록 폼 초기화 오류: {e}")
+            return False
+    
+    def prepare_next_registration(self) -> bool:
+        """다음 사용자 등록 준비 - 빠른 폼 초기화, 실패 시에만 전체 새로고침"""
+        registration_config = self.config.get('registration', {}) or {}
+        if registration_config.get('fast_reset', True) and self.reset_registration_form():
+            return True
+        
+        logger.info("전체 새로고침으로 회원등록 페이지 재진입 (fallback)")
+        return self.navigate_to_registration_page_direct()
+    
     def navigate_to_target_page(self) -> bool:
         """목표 페이지로 이동 (직접 URL 사용)"""
         try:
@@ -739,8 +867,115 @@ class IP168ITSMAutomation(BaseAutomation):
             logger.error(f"로그인 페이지 언어 선택 요소 분석 오류: {e}")
             return {}
     
+    def inject_locale(self) -> bool:
+        """첫 접속 전에 localStorage/쿠키로 로케일을 주입하여 처음부터 한국어로 로딩"""
+        try:
+            locale_config = self.config.get('locale', {}) or {}
+            if not locale_config.get('enabled', False):
+                return False
+            
+            site_url = ConfigManager.get_value(self.config, 'website.url', self.selectors.MAIN_PAGE)
+            parsed = urlparse(site_url)
+            origin = f"{parsed.scheme}://{parsed.netloc}"
+            
+            local_storage = locale_config.get('local_storage', {}) or {}
+            if local_storage:
+                script = (
+                    "(function() {"
+                    f"  if (window.location.origin !== {json.dumps(origin)}) return;"
+                    f"  var items = {json.dumps(local_storage, ensure_ascii=False)};"
+                    "  try { Object.keys(items).forEach(function(key) { localStorage.setItem(key, items[key]); }); }"
+                    "  catch (e) {}"
+                    "})();"
+                )
+                self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': script})
+            
+            for name, value in (locale_config.get('cookies', {}) or {}).items():
+                self.driver.execute_cdp_cmd('Network.setCookie', {
+                    'name': name, 'value': str(value), 'url': f"{origin}/"
+                })
+            
+            logger.info(f"로케일 사전 주입 완료: localStorage={list(local_storage.keys())}, "
+                        f"cookies={list((locale_config.get('cookies', {}) or {}).keys())}")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"로케일 사전 주입 실패: {e}")
+            return False
+    
+    def _is_language_active(self, language: str, strategy: Dict[str, Any]) -> bool:
+        """캐시된 언어 선택 요소의 현재 표시 값으로 언어 적용 여부 확인 (1회 호출)"""
+        try:
+            return bool(self.driver.execute_script("""
+                var element = document.querySelector(arguments[0]);
+                if (!element) return false;
+                var text = element.tagName === 'SELECT'
+                    ? (element.options[element.selectedIndex] || {}).text || ''
+                    : element.innerText || '';
+                return text.trim().indexOf(arguments[1]) !== -1;
+            """, strategy['selector'], language))
+        except Exception:
+            return False
+    
+    def _apply_language_strategy(self, language: str, strategy: Dict[str, Any]) -> bool:
+        """캐시된 언어 전환 전략을 분석 없이 바로 적용"""
+        try:
+            element = self.driver.find_element(By.CSS_SELECTOR, strategy['selector'])
+            tag_name = strategy.get('tag_name')
+            
+            if tag_name == 'select':
+                from selenium.webdriver.support.ui import Select
+                select = Select(element)
+                method, value = strategy.get('select_by', 'visible_text'), strategy.get('select_value', language)
+                if method == 'value':
+                    select.select_by_value(value)
+                elif method == 'index':
+                    select.select_by_index(int(value))
+                else:
+                    select.select_by_visible_text(value)
+                return True
+            
+            element.click()
+            if tag_name == 'div' and strategy.get('option_selector'):
+                option = WebDriverWait(self.driver, 3).until(
+                    EC.element_to_be_clickable((By.XPATH, strategy['option_selector']))
+                )
+                option.click()
+            return True
+            
+        except Exception as e:
+            logger.warning(f"캐시된 언어 전환 전략 적용 실패: {e}")
+            return False
+    
     def select_language_on_login_page(self, language: str = '한국어') -> bool:
-        """로그인 페이지에서 언어 선택"""
+        """로그인 페이지에서 언어 선택 (캐시된 전략 우선, 없으면 분석 후 전략 기록)"""
+        self._language_changed = False
+        cache = self.get_site_cache()
+        cache_key = f"language_strategy:{language}"
+        strategy = cache.get(cache_key)
+        
+        if strategy:
+            if self._is_language_active(language, strategy):
+                logger.info(f"✅ 이미 '{language}'로 표시되고 있어 언어 선택을 건너뜁니다")
+                return True
+            if self._apply_language_strategy(language, strategy):
+                logger.info(f"✅ 캐시된 전략으로 언어 '{language}' 선택 성공: {strategy['selector']}")
+                self._language_changed = True
+                return True
+            cache.delete(cache_key)
+        
+        self._last_language_strategy = None
+        if not self._select_language_by_analysis(language):
+            return False
+        
+        self._language_changed = True
+        if self._last_language_strategy:
+            cache.set(cache_key, self._last_language_strategy)
+            logger.info(f"언어 전환 전략 기록: {self._last_language_strategy}")
+        return True
+    
+    def _select_language_by_analysis(self, language: str = '한국어') -> bool:
+        """로그인 페이지 분석 후 언어 선택"""
         try:
             logger.info(f"로그인 페이지에서 언어 '{language}' 선택 시도")
             
@@ -759,6 +994,7 @@ class IP168ITSMAutomation(BaseAutomation):
             
             # 요소 찾기
             element = self.driver.find_element(By.CSS_SELECTOR, recommended_selector)
+            self._last_language_strategy = {'selector': recommended_selector, 'tag_name': element.tag_name}
             
             # 요소 타입에 따른 처리
             if element.tag_name == 'select':
@@ -770,21 +1006,25 @@ class IP168ITSMAutomation(BaseAutomation):
                 try:
                     select.select_by_visible_text(language)
                     logger.info(f"✅ 언어 '{language}' 선택 성공 (visible_text)")
+                    self._last_language_strategy.update(select_by='visible_text', select_value=language)
                     return True
                 except:
                     try:
                         select.select_by_value('ko')
                         logger.info(f"✅ 언어 '{language}' 선택 성공 (value='ko')")
+                        self._last_language_strategy.update(select_by='value', select_value='ko')
                         return True
                     except:
                         try:
                             select.select_by_value('ko-KR')
                             logger.info(f"✅ 언어 '{language}' 선택 성공 (value='ko-KR')")
+                            self._last_language_strategy.update(select_by='value', select_value='ko-KR')
                             return True
                         except:
                             try:
                                 select.select_by_index(0)  # 첫 번째 옵션 선택
                                 logger.info(f"✅ 첫 번째 언어 옵션 선택 성공")
+                                self._last_language_strategy.update(select_by='index', select_value=0)
                                 return True
                             except:
                                 logger.error("셀렉트 박스에서 언어 선택 실패")
@@ -835,6 +1075,7 @@ class IP168ITSMAutomation(BaseAutomation):
                         if korean_option.is_displayed():
                             korean_option.click()
                             logger.info(f"✅ 한국어 옵션 클릭 성공: {selector}")
+                            self._last_language_strategy['option_selector'] = selector
                             time.sleep(1)
                             return True
                     except:
@@ -905,37 +1146,23 @@ class IP168ITSMAutomation(BaseAutomation):
                 }
             }
             
-            # 일반적인 입력 필드들 찾기
-            input_selectors = [
-                "input[type='text']",
-                "input[type='email']",
-                "input[type='tel']",
-                "input[type='password']",
-                "input[type='number']",
-                "textarea",
-                "select"
-            ]
-            
-            for selector in input_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            field_info = {
-                                'selector': selector,
-                                'tag_name': element.tag_name,
-                                'type': element.get_attribute('type'),
-                                'name': element.get_attribute('name'),
-                                'id': element.get_attribute('id'),
-                                'placeholder': element.get_attribute('placeholder'),
-                                'value': element.get_attribute('value'),
-                                'class': element.get_attribute('class'),
-                                'label': self.get_field_label(element)
-                            }
-                            analysis_result['found_fields'].append(field_info)
-                            logger.info(f"입력 필드 발견: {field_info}")
-                except Exception as e:
-                    continue
+            # 입력 필드 (스키마 추출 1회로 name/id/라벨/타입/locator 수집)
+            schema = self.load_registration_form_schema(force=True)
+            if schema:
+                for field in schema.to_list():
+                    if not field.get('visible'):
+                        continue
+                    field_info = {
+                        'selector': field['locator'],
+                        'tag_name': field['tag'],
+                        'type': field['type'],
+                        'name': field['name'],
+                        'id': field['id'],
+                        'placeholder': field['placeholder'],
+                        'label': field['label']
+                    }
+                    analysis_result['found_fields'].append(field_info)
+                    logger.info(f"입력 필드 발견: {field_info}")
             
             # 버튼들 찾기
             button_selectors = [
@@ -970,6 +1197,33 @@ class IP168ITSMAutomation(BaseAutomation):
             logger.error(f"회원등록 폼 분석 오류: {e}")
             return {}
     
+    def load_registration_form_schema(self, force: bool = False) -> Optional[FormSchema]:
+        """회원등록 폼 스키마 로드 (사이트 빌드 캐시 → 없으면 1회 스크립트 추출 후 저장)"""
+        if self.form_schema is not None and not force:
+            return self.form_schema
+        
+        cache = self.get_site_cache()
+        if not force and cache.build_id:
+            cached_fields = cache.get('registration_form_schema')
+            if cached_fields:
+                self.form_schema = FormSchema(cached_fields)
+                return self.form_schema
+        
+        schema = FormSchema.extract(self.driver)
+        if schema and schema.field('perNm'):
+            self.form_schema = schema
+            if cache.build_id:
+                cache.set('registration_form_schema', schema.to_list())
+        return schema
+    
+    def _schema_selectors(self, field_name: str, fallback_selectors: List[str]) -> List[str]:
+        """스키마의 locator 를 우선 사용하고 기존 선택자 목록은 대체 경로로 유지"""
+        schema = self.load_registration_form_schema()
+        locator = schema.locator(field_name) if schema else None
+        if not locator:
+            return fallback_selectors
+        return [locator] + [selector for selector in fallback_selectors if selector != locator]
+    
     def get_field_label(self, element) -> str:
         """필드의 라벨 텍스트 찾기"""
         try:
@@ -1085,14 +1339,7 @@ class IP168ITSMAutomation(BaseAutomation):
             logger.info(f"엑셀 데이터: {user_data}")
             
             # 1단계: 성명 필드 먼저 입력 (중복확인 전에 필요)
-            if 'per_nm' in user_data and user_data['per_nm']:
-                value = str(user_data['per_nm'])
-                logger.info(f"1단계 - 성명 필드 입력: {value}")
-                if self.fill_name_field_specific(value):
-                    logger.info(f"✅ 성명 필드에 값 '{value}' 입력 성공")
-                    success_count += 1
-                else:
-                    logger.warning(f"⚠️ 성명 필드 입력 실패")
+            success_count += self._fill_name_step(user_data)
             
             # 2단계: email 필드 특별 처리 (사용자ID와 메일 두 곳에 입력)
             email_value = user_data.get('email')
@@ -1100,71 +1347,14 @@ class IP168ITSMAutomation(BaseAutomation):
                 logger.info(f"2단계 - email 필드 특별 처리: {email_value} -> 사용자ID 및 메일")
                 
                 # 2-1. 사용자 ID 필드에 입력 (중복확인 포함)
-                if self.fill_user_id_field_specific(str(email_value)):
+                if self.traced('field', self.fill_user_id_field_specific, str(email_value), attributes={'field': 'user_id'}):
                     logger.info(f"✅ 사용자 ID 필드에 email 값 '{email_value}' 입력 성공 (중복확인 포함)")
                     success_count += 1
                 else:
                     logger.warning(f"⚠️ 사용자 ID 필드 입력 실패 (중복확인 포함)")
-                
-                # 2-2. 메일 필드에 입력
-                if self.fill_email_field_specific(str(email_value)):
-                    logger.info(f"✅ 메일 필드에 email 값 '{email_value}' 입력 성공")
-                    success_count += 1
-                else:
-                    logger.warning(f"⚠️ 메일 필드 입력 실패")
-            
-            # 3단계: 나머지 필드들 처리 (성명과 email은 이미 처리했으므로 제외)
-            logger.info("3단계 - 나머지 필드들 처리")
             
-            # 법인 필드 처리 (계열사 값을 compCd 필드에 선택)
-            if '계열사' in user_data and user_data['계열사']:
-                value = str(user_data['계열사'])
-                logger.info(f"3-1. 법인 필드 처리: {value}")
-                if self.fill_company_field_specific(value):
-                    logger.info(f"✅ 법인 필드에 계열사 값 '{value}' 선택 성공")
-                    success_count += 1
-                else:
-                    logger.warning(f"⚠️ 법인 필드 선택 실패")
-            
-            # 직위 필드 처리
-            if 'per_work' in user_data and user_data['per_work']:
-                value = str(user_data['per_work'])
-                logger.info(f"3-2. 직위 필드 처리: {value}")
-                if self.fill_position_field_specific(value):
-                    logger.info(f"✅ 직위 필드에 값 '{value}' 입력 성공")
-                    success_count += 1
-                else:
-                    logger.warning(f"⚠️ 직위 필드 입력 실패")
-            
-            # 내선번호 필드 처리
-            if 'phone' in user_data and user_data['phone']:
-                value = str(user_data['phone'])
-                logger.info(f"3-3. 내선번호 필드 처리: {value}")
-                if self.fill_phone_field_specific(value):
-                    logger.info(f"✅ 내선번호 필드에 값 '{value}' 입력 성공")
-                    success_count += 1
-                else:
-                    logger.warning(f"⚠️ 내선번호 필드 입력 실패")
-            
-            # 휴대폰 필드 처리
-            if 'mobile' in user_data and user_data['mobile']:
-                value = str(user_data['mobile'])
-                logger.info(f"3-4. 휴대폰 필드 처리: {value}")
-                if self.fill_mobile_field_specific(value):
-                    logger.info(f"✅ 휴대폰 필드에 값 '{value}' 입력 성공")
-                    success_count += 1
-                else:
-                    logger.warning(f"⚠️ 휴대폰 필드 입력 실패")
-            
-            # 영문이름 필드 처리
-            if 'per_nm_en' in user_data and user_data['per_nm_en']:
-                value = str(user_data['per_nm_en'])
-                logger.info(f"3-5. 영문이름 필드 처리: {value}")
-                if self.fill_english_name_field_specific(value):
-                    logger.info(f"✅ 영문이름 필드에 값 '{value}' 입력 성공")
-                    success_count += 1
-                else:
-                    logger.warning(f"⚠️ 영문이름 필드 입력 실패")
+            # 2-2 메일 필드 및 3단계 나머지 필드
+            success_count += self._fill_detail_fields(user_data)
             
             logger.info(f"회원등록 폼 입력 완료: {success_count}/{total_fields} 필드 성공")
             return success_count > 0
@@ -1173,6 +1363,84 @@ class IP168ITSMAutomation(BaseAutomation):
             logger.error(f"회원등록 폼 자동 입력 오류: {e}")
             return False
     
+    def _fill_name_step(self, user_data: Dict[str, Any]) -> int:
+        """1단계: 성명 필드 입력 (성공한 필드 수 반환)"""
+        if 'per_nm' in user_data and user_data['per_nm']:
+            value = str(user_data['per_nm'])
+            logger.info(f"1단계 - 성명 필드 입력: {value}")
+            if self.traced('field', self.fill_name_field_specific, value, attributes={'field': 'per_nm'}):
+                logger.info(f"✅ 성명 필드에 값 '{value}' 입력 성공")
+                return 1
+            logger.warning(f"⚠️ 성명 필드 입력 실패")
+        return 0
+    
+    def _fill_detail_fields(self, user_data: Dict[str, Any]) -> int:
+        """2-2단계(메일)와 3단계(법인/직위/내선번호/휴대폰/영문이름) 입력 (성공한 필드 수 반환)"""
+        success_count = 0
+        email_value = user_data.get('email')
+        if email_value:
+            # 2-2. 메일 필드에 입력
+            if self.traced('field', self.fill_email_field_specific, str(email_value), attributes={'field': 'email'}):
+                logger.info(f"✅ 메일 필드에 email 값 '{email_value}' 입력 성공")
+                success_count += 1
+            else:
+                logger.warning(f"⚠️ 메일 필드 입력 실패")
+        
+        # 3단계: 나머지 필드들 처리 (성명과 email은 이미 처리했으므로 제외)
+        logger.info("3단계 - 나머지 필드들 처리")
+        
+        # 법인 필드 처리 (계열사 값을 compCd 필드에 선택)
+        if '계열사' in user_data and user_data['계열사']:
+            value = str(user_data['계열사'])
+            logger.info(f"3-1. 법인 필드 처리: {value}")
+            if self.traced('field', self.fill_company_field_specific, value, attributes={'field': '계열사'}):
+                logger.info(f"✅ 법인 필드에 계열사 값 '{value}' 선택 성공")
+                success_count += 1
+            else:
+                logger.warning(f"⚠️ 법인 필드 선택 실패")
+        
+        # 직위 필드 처리
+        if 'per_work' in user_data and user_data['per_work']:
+            value = str(user_data['per_work'])
+            logger.info(f"3-2. 직위 필드 처리: {value}")
+            if self.traced('field', self.fill_position_field_specific, value, attributes={'field': 'per_work'}):
+                logger.info(f"✅ 직위 필드에 값 '{value}' 입력 성공")
+                success_count += 1
+            else:
+                logger.warning(f"⚠️ 직위 필드 입력 실패")
+        
+        # 내선번호 필드 처리
+        if 'phone' in user_data and user_data['phone']:
+            value = str(user_data['phone'])
+            logger.info(f"3-3. 내선번호 필드 처리: {value}")
+            if self.traced('field', self.fill_phone_field_specific, value, attributes={'field': 'phone'}):
+                logger.info(f"✅ 내선번호 필드에 값 '{value}' 입력 성공")
+                success_count += 1
+            else:
+                logger.warning(f"⚠️ 내선번호 필드 입력 실패")
+        
+        # 휴대폰 필드 처리
+        if 'mobile' in user_data and user_data['mobile']:
+            value = str(user_data['mobile'])
+            logger.info(f"3-4. 휴대폰 필드 처리: {value}")
+            if self.traced('field', self.fill_mobile_field_specific, value, attributes={'field': 'mobile'}):
+                logger.info(f"✅ 휴대폰 필드에 값 '{value}' 입력 성공")
+                success_count += 1
+            else:
+                logger.warning(f"⚠️ 휴대폰 필드 입력 실패")
+        
+        # 영문이름 필드 처리
+        if 'per_nm_en' in user_data and user_data['per_nm_en']:
+            value = str(user_data['per_nm_en'])
+            logger.info(f"3-5. 영문이름 필드 처리: {value}")
+            if self.traced('field', self.fill_english_name_field_specific, value, attributes={'field': 'per_nm_en'}):
+                logger.info(f"✅ 영문이름 필드에 값 '{value}' 입력 성공")
+                success_count += 1
+            else:
+                logger.warning(f"⚠️ 영문이름 필드 입력 실패")
+        
+        return success_count
+    
     def fill_field_by_name(self, field_name: str, value: str) -> bool:
         """필드명으로 필드 찾아서 값 입력"""
         try:
@@ -1232,6 +1500,9 @@ class IP168ITSMAutomation(BaseAutomation):
                 "//input[@id='mui-26']"
             ]
             
+            # 폼 스키마 locator 우선 (O(1) 조회), 기존 선택자는 대체 경로
+            name_selectors = self._schema_selectors('perNm', name_selectors)
+            
             for selector in name_selectors:
                 try:
                     if selector.startswith('//'):
@@ -1241,6 +1512,7 @@ class IP168ITSMAutomation(BaseAutomation):
                     
                     if element.is_displayed():
                         logger.info(f"성명 필드 발견: {selector}")
+                        self.annotate_span(selector=selector)
                         
                         # 기존 값 확인
                         current_value = element.get_attribute('value')
@@ -1333,8 +1605,11 @@ class IP168ITSMAutomation(BaseAutomation):
             logger.error(f"정확한 선택자로 성명 필드 테스트 오류: {e}")
             return False
     
-    def fill_user_id_field_specific(self, value: str) -> bool:
-        """사용자 ID 필드 특별 처리 (정확한 필드 정보 사용)"""
+    def fill_user_id_field_specific(self, value: str, check_duplicate: bool = True) -> bool:
+        """사용자 ID 필드 특별 처리 (정확한 필드 정보 사용)
+        
+        check_duplicate 가 False 이면 값 입력만 하고 중복확인은 호출 측(탭 풀 작업)에서 진행
+        """
         try:
             logger.info(f"사용자 ID 필드 특별 처리 시작: {value}")
             
@@ -1346,6 +1621,9 @@ class IP168ITSMAutomation(BaseAutomation):
                 "//input[@id='mui-2']"
             ]
             
+            # 폼 스키마 locator 우선 (O(1) 조회), 기존 선택자는 대체 경로
+            user_id_selectors = self._schema_selectors('perId', user_id_selectors)
+            
             for selector in user_id_selectors:
                 try:
                     if selector.startswith('//'):
@@ -1355,6 +1633,7 @@ class IP168ITSMAutomation(BaseAutomation):
                     
                     if element.is_displayed():
                         logger.info(f"사용자 ID 필드 발견: {selector}")
+                        self.annotate_span(selector=selector)
                         
                         # 기존 값 확인
                         current_value = element.get_attribute('value')
@@ -1379,6 +1658,8 @@ class IP168ITSMAutomation(BaseAutomation):
                         
                         if new_value == value:
                             logger.info("✅ 사용자 ID 필드 입력 성공")
+                            if not check_duplicate:
+                                return True
                             
                             # 중복확인 버튼 클릭
                             if self.click_duplicate_check_button():
@@ -1481,8 +1762,8 @@ class IP168ITSMAutomation(BaseAutomation):
             logger.error(f"정확한 선택자로 사용자 ID 필드 테스트 오류: {e}")
             return False
     
-    def click_duplicate_check_button(self) -> bool:
-        """중복확인 버튼 클릭"""
+    def click_duplicate_check_button(self, wait_for_popup: bool = True) -> bool:
+        """중복확인 버튼 클릭 (wait_for_popup 이 False 이면 클릭 직후 반환)"""
         try:
             logger.info("중복확인 버튼 클릭 시도")
             
@@ -1522,18 +1803,20 @@ class IP168ITSMAutomation(BaseAutomation):
                         logger.info(f"버튼 클래스: '{element.get_attribute('class')}'")
                         
                         # 버튼 클릭 전 스크린샷
-                        self.take_screenshot("before_duplicate_check_click")
+                        self.capture_screenshot("before_duplicate_check_click")
                         
                         # 버튼 클릭
                         element.click()
                         logger.info("✅ 중복확인 버튼 클릭 성공")
+                        if not wait_for_popup:
+                            return True
                         
                         # 클릭 후 더 긴 대기 시간 (팝업이 나타날 때까지)
                         logger.info("중복확인 버튼 클릭 후 팝업 대기 중...")
                         time.sleep(0.5)  # 5초 대기
                         
                         # 클릭 후 스크린샷
-                        self.take_screenshot("after_duplicate_check_click")
+                        self.capture_screenshot("after_duplicate_check_click")
                         
                         # 팝업이 나타났는지 빠르게 확인 (더 다양한 방법)
                         popup_detected = False
@@ -1604,6 +1887,7 @@ class IP168ITSMAutomation(BaseAutomation):
                             
                             if not popup_detected:
                                 logger.warning("⚠️ 모든 재시도 후에도 팝업이 감지되지 않았습니다")
+                                self.capture_screenshot("duplicate_check_popup_missing", failed=True)
                                 logger.info("페이지 소스를 확인하여 응답을 분석합니다...")
                                 
                                 # 페이지 소스에서 관련 메시지 확인
@@ -1624,6 +1908,7 @@ class IP168ITSMAutomation(BaseAutomation):
                     continue
             
             logger.warning("⚠️ 중복확인 버튼을 찾을 수 없습니다")
+            self.capture_screenshot("duplicate_check_button_missing", failed=True)
             return False
             
         except Exception as e:
@@ -1798,7 +2083,7 @@ class IP168ITSMAutomation(BaseAutomation):
                                 # 버튼이 실제로 "예" 버튼인지 확인 (정확한 매칭)
                                 if button_text.strip() == '예':
                                     # 버튼 클릭 전 스크린샷
-                                    self.take_screenshot("before_yes_button_click")
+                                    self.capture_screenshot("before_yes_button_click")
                                     
                                     # 버튼 클릭
                                     element.click()
@@ -1808,7 +2093,7 @@ class IP168ITSMAutomation(BaseAutomation):
                                     time.sleep(0.5)
                                     
                                     # 버튼 클릭 후 스크린샷
-                                    self.take_screenshot("after_yes_button_click")
+                                    self.capture_screenshot("after_yes_button_click")
                                     
                                     # 팝업이 실제로 닫혔는지 확인
                                     try:
@@ -1859,6 +2144,9 @@ class IP168ITSMAutomation(BaseAutomation):
                 "//input[@id='mui-9']"
             ]
             
+            # 폼 스키마 locator 우선 (O(1) 조회), 기존 선택자는 대체 경로
+            position_selectors = self._schema_selectors('position', position_selectors)
+            
             for selector in position_selectors:
                 try:
                     if selector.startswith('//'):
@@ -1868,6 +2156,7 @@ class IP168ITSMAutomation(BaseAutomation):
                     
                     if element.is_displayed():
                         logger.info(f"직위 필드 발견: {selector}")
+                        self.annotate_span(selector=selector)
                         
                         # 기존 값 확인
                         current_value = element.get_attribute('value')
@@ -1920,6 +2209,9 @@ class IP168ITSMAutomation(BaseAutomation):
                 "//input[@id='mui-10']"
             ]
             
+            # 폼 스키마 locator 우선 (O(1) 조회), 기존 선택자는 대체 경로
+            phone_selectors = self._schema_selectors('phone', phone_selectors)
+            
             for selector in phone_selectors:
                 try:
                     if selector.startswith('//'):
@@ -1929,6 +2221,7 @@ class IP168ITSMAutomation(BaseAutomation):
                     
                     if element.is_displayed():
                         logger.info(f"내선번호 필드 발견: {selector}")
+                        self.annotate_span(selector=selector)
                         
                         # 기존 값 확인
                         current_value = element.get_attribute('value')
@@ -1981,6 +2274,9 @@ class IP168ITSMAutomation(BaseAutomation):
                 "//input[@id='mui-11']"
             ]
             
+            # 폼 스키마 locator 우선 (O(1) 조회), 기존 선택자는 대체 경로
+            mobile_selectors = self._schema_selectors('mobile', mobile_selectors)
+            
             for selector in mobile_selectors:
                 try:
                     if selector.startswith('//'):
@@ -1990,6 +2286,7 @@ class IP168ITSMAutomation(BaseAutomation):
                     
                     if element.is_displayed():
                         logger.info(f"휴대폰 필드 발견: {selector}")
+                        self.annotate_span(selector=selector)
                         
                         # 기존 값 확인
                         current_value = element.get_attribute('value')
@@ -2042,6 +2339,9 @@ class IP168ITSMAutomation(BaseAutomation):
                 "//input[@id='mui-13']"
             ]
             
+            # 폼 스키마 locator 우선 (O(1) 조회), 기존 선택자는 대체 경로
+            email_selectors = self._schema_selectors('email', email_selectors)
+            
             for selector in email_selectors:
                 try:
                     if selector.startswith('//'):
@@ -2051,6 +2351,7 @@ class IP168ITSMAutomation(BaseAutomation):
                     
                     if element.is_displayed():
                         logger.info(f"메일 필드 발견: {selector}")
+                        self.annotate_span(selector=selector)
                         
                         # 기존 값 확인
                         current_value = element.get_attribute('value')
@@ -2103,6 +2404,9 @@ class IP168ITSMAutomation(BaseAutomation):
                 "//input[@id='mui-15']"
             ]
             
+            # 폼 스키마 locator 우선 (O(1) 조회), 기존 선택자는 대체 경로
+            english_name_selectors = self._schema_selectors('perNmEn', english_name_selectors)
+            
             for selector in english_name_selectors:
                 try:
                     if selector.startswith('//'):
@@ -2112,6 +2416,7 @@ class IP168ITSMAutomation(BaseAutomation):
                     
                     if element.is_displayed():
                         logger.info(f"영문이름 필드 발견: {selector}")
+                        self.annotate_span(selector=selector)
                         
                         # 기존 값 확인
                         current_value = element.get_attribute('value')
@@ -2307,11 +2612,149 @@ class IP168ITSMAutomation(BaseAutomation):
             logger.error(f"사용자 ID 중복확인 테스트 오류: {e}")
             return False
     
+    def load_company_options(self, force: bool = False) -> Optional[OptionIndex]:
+        """법인 옵션 목록을 한 번의 스크립트 호출로 읽어 세션 단위로 캐시"""
+        if self.company_options is not None and not force:
+            return self.company_options
+        
+        # 같은 사이트 빌드에서 이미 읽은 옵션 목록이 있으면 브라우저 호출 없이 사용
+        cache = self.get_site_cache()
+        if not force and cache.build_id:
+            cached_entries = cache.get('company_options')
+            if cached_entries:
+                self.company_options = OptionIndex(cached_entries)
+                logger.info(f"법인 옵션 목록 캐시 사용 (빌드 {cache.build_id}): {len(self.company_options)}개")
+                return self.company_options
+        
+        try:
+            entries = self.driver.execute_async_script("""
+                var done = arguments[arguments.length - 1];
+                var trigger = document.querySelector(arguments[0]);
+                if (!trigger) { done(null); return; }
+                
+                if (trigger.tagName === 'SELECT') {
+                    done(Array.from(trigger.options).map(function(option, index) {
+                        return { text: option.text.trim(), value: option.value, index: index };
+                    }));
+                    return;
+                }
+                
+                // Material-UI Select 는 mousedown 으로 메뉴가 열림
+                trigger.dispatchEvent(new MouseEvent('mousedown', { bubbles: true, button: 0 }));
+                var started = Date.now();
+                (function poll() {
+                    var items = document.querySelectorAll('[role="listbox"] li[role="option"]');
+                    if (items.length) {
+                        var result = Array.from(items).map(function(item, index) {
+                            return { text: item.innerText.trim(), value: item.getAttribute('data-value'), index: index };
+                        });
+                        var listbox = items[0].closest('[role="listbox"]');
+                        listbox.dispatchEvent(new KeyboardEvent('keydown', { key: 'Escape', bubbles: true }));
+                        done(result);
+                        return;
+                    }
+                    if (Date.now() - started > 3000) { done([]); return; }
+                    setTimeout(poll, 50);
+                })();
+            """, self.selectors.COMPANY_SELECT)
+            
+            if not entries:
+                logger.warning("법인 옵션 목록을 읽을 수 없습니다")
+                return None
+            
+            self.company_options = OptionIndex(entries)
+            logger.info(f"법인 옵션 목록 캐시 완료: {len(self.company_options)}개")
+            if cache.build_id:
+                cache.set('company_options', entries)
+            return self.company_options
+            
+        except Exception as e:
+            logger.error(f"법인 옵션 목록 로드 오류: {e}")
+            return None
+    
+    def _select_company_option(self, option: Dict[str, Any]) -> Optional[str]:
+        """캐시된 옵션을 값/순번으로 한 번에 선택하고 선택된 표시 텍스트 반환"""
+        return self.driver.execute_async_script("""
+            var done = arguments[arguments.length - 1];
+            var trigger = document.querySelector(arguments[0]);
+            var value = arguments[1], index = arguments[2];
+            if (!trigger) { done(null); return; }
+            
+            if (trigger.tagName === 'SELECT') {
+                trigger.selectedIndex = index;
+                trigger.dispatchEvent(new Event('change', { bubbles: true }));
+                done(trigger.options[index] ? trigger.options[index].text.trim() : null);
+                return;
+            }
+            
+            trigger.dispatchEvent(new MouseEvent('mousedown', { bubbles: true, button: 0 }));
+            var started = Date.now();
+            (function poll() {
+                var items = document.querySelectorAll('[role="listbox"] li[role="option"]');
+                if (items.length) {
+                    var target = null;
+                    if (value !== null) {
+                        target = Array.from(items).find(function(item) { return item.getAttribute('data-value') === value; });
+                    }
+                    target = target || items[index];
+                    if (!target) { done(null); return; }
+                    target.click();
+                    setTimeout(function() { done(trigger.innerText.trim()); }, 0);
+                    return;
+                }
+                if (Date.now() - started > 3000) { done(null); return; }
+                setTimeout(poll, 50);
+            })();
+        """, self.selectors.COMPANY_SELECT, option.get('value'), option.get('index', 0))
+    
+    def prevalidate_companies(self, company_names: List[Any]) -> List[Any]:
+        """엑셀의 계열사 값들을 캐시된 옵션 목록과 오프라인 매칭하여 알 수 없거나 모호한 법인 목록 반환"""
+        options = self.load_company_options()
+        if options is None:
+            logger.warning("법인 옵션 목록이 없어 사전 검증을 건너뜁니다")
+            return []
+        
+        unknown = options.find_unknown(company_names)
+        if unknown and self.get_site_cache().get('company_options'):
+            # 영속 캐시 이후 옵션이 추가되었을 수 있으므로 페이지에서 다시 읽어 재검증
+            self.get_site_cache().delete('company_options')
+            options = self.load_company_options(force=True) or options
+            unknown = options.find_unknown(company_names)
+        ambiguous = options.find_ambiguous(company_names)
+        for name, candidates in ambiguous.items():
+            logger.warning(f"⚠️ 법인 옵션 후보가 여럿인 계열사: '{name}' → {candidates}")
+        missing = [name for name in unknown if name not in ambiguous]
+        if missing:
+            logger.warning(f"⚠️ 법인 옵션에 없는 계열사 {len(missing)}건: {missing}")
+        if not unknown:
+            logger.info("✅ 모든 계열사 값이 법인 옵션과 매칭됩니다")
+        return unknown
+    
     def fill_company_field_specific(self, company_name: str) -> bool:
         """법인 필드 특별 처리 (Material-UI Select 컴포넌트)"""
         try:
             logger.info(f"법인 필드 특별 처리 시작: {company_name}")
             
+            # 빠른 경로: 캐시된 옵션 목록에서 오프라인 매칭 후 한 번에 선택
+            options = self.load_company_options()
+            option = options.match(company_name) if options else None
+            if option:
+                selected_text = self._select_company_option(option)
+                if selected_text and selected_text == option['text']:
+                    logger.info(f"✅ 법인 옵션 선택 성공: {company_name} → '{option['text']}'")
+                    self.annotate_span(selector=self.selectors.COMPANY_SELECT, option=option['text'])
+                    return True
+                logger.warning(f"캐시 옵션 선택 확인 실패 (선택값: {selected_text}), 기존 방식으로 재시도")
+                self.get_site_cache().delete('company_options')
+                self.company_options = None
+            elif options is not None:
+                candidates = options.candidates(company_name)
+                if len(candidates) > 1:
+                    logger.warning(f"⚠️ 법인 옵션 후보가 여럿이라 선택하지 않습니다: {company_name} → {[c['text'] for c in candidates]}")
+                else:
+                    logger.warning(f"⚠️ 법인 옵션 목록에 없는 계열사입니다: {company_name}")
+                return False
+            
             # 법인 Select 필드 찾기
             company_select_selectors = [
                 "select[id='mui-component-select-compCd']",
@@ -2331,6 +2774,7 @@ class IP168ITSMAutomation(BaseAutomation):
                     
                     if select_element.is_displayed():
                         logger.info(f"법인 Select 필드 발견: {selector}")
+                        self.annotate_span(selector=selector)
                         break
                         
                 except Exception as e:
@@ -2519,52 +2963,89 @@ class IP168ITSMAutomation(BaseAutomation):
             logger.error(f"법인 필드 테스트 오류: {e}")
             return False
     
+    def _find_submit_button(self):
+        """회원등록 폼 제출 버튼 찾기 (없으면 None)"""
+        submit_selectors = [
+            "//button[contains(text(), '가입하기')]",
+            "button[type='submit']",
+            "input[type='submit']",
+            "//button[contains(text(), '등록')]",
+            "//button[contains(text(), '저장')]",
+            "//button[contains(text(), 'Submit')]",
+            "//button[contains(text(), 'Save')]",
+            "//button[contains(text(), '확인')]",
+            "//button[contains(text(), 'OK')]",
+            "//input[@value='등록']",
+            "//input[@value='저장']",
+            "//input[@value='Submit']",
+            "//input[@value='Save']",
+            "button.MuiButton-contained",
+            "button.MuiButton-root",
+            "//button[@class='MuiButton-root MuiButton-contained']",
+            "//button[@class='MuiButton-root MuiButton-contained MuiButton-containedPrimary']"
+        ]
+        
+        for selector in submit_selectors:
+            try:
+                if selector.startswith('//'):
+                    element = self.driver.find_element(By.XPATH, selector)
+                else:
+                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
+                
+                if element.is_displayed():
+                    return element
+                    
+            except Exception:
+                continue
+        return None
+    
+    def _is_submit_enabled(self) -> bool:
+        """실제 제출 여부 (registration.submit_enabled, 기본값은 테스트용으로 제출하지 않음)"""
+        return bool(ConfigManager.get_value(self.config, 'registration.submit_enabled', False))
+    
+    def _submit_confirmation(self, driver) -> Optional[str]:
+        """제출 후 표시된 완료 메시지 (아직 없으면 None)"""
+        confirm_texts = ConfigManager.get_value(
+            self.config, 'registration.submit_confirm_texts', ['등록되었습니다', '저장되었습니다', '완료되었습니다']
+        ) or []
+        return driver.execute_script("""
+            var texts = arguments[0];
+            var nodes = document.querySelectorAll('[role="dialog"], [role="alert"], .MuiSnackbar-root');
+            for (var i = 0; i < nodes.length; i++) {
+                var node = nodes[i];
+                if (!node.getClientRects().length) continue;
+                var text = node.innerText || '';
+                for (var t = 0; t < texts.length; t++) {
+                    if (text.indexOf(texts[t]) !== -1) return texts[t];
+                }
+            }
+            return null;
+        """, confirm_texts)
+    
     def submit_registration_form(self) -> bool:
         """회원등록 폼 제출"""
         try:
             logger.info("회원등록 폼 제출 시도")
             
-            # 제출 버튼 찾기
-            submit_selectors = [
-                "//button[contains(text(), '가입하기')]",
-                "button[type='submit']",
-                "input[type='submit']",
-                "//button[contains(text(), '등록')]",
-                "//button[contains(text(), '저장')]",
-                "//button[contains(text(), 'Submit')]",
-                "//button[contains(text(), 'Save')]",
-                "//button[contains(text(), '확인')]",
-                "//button[contains(text(), 'OK')]",
-                "//input[@value='등록']",
-                "//input[@value='저장']",
-                "//input[@value='Submit']",
-                "//input[@value='Save']",
-                "button.MuiButton-contained",
-                "button.MuiButton-root",
-                "//button[@class='MuiButton-root MuiButton-contained']",
-                "//button[@class='MuiButton-root MuiButton-contained MuiButton-containedPrimary']"
-            ]
+            element = self._find_submit_button()
+            if element is None:
+                logger.warning("⚠️ 회원등록 폼 제출 버튼을 찾을 수 없습니다")
+                return False
             
-            for selector in submit_selectors:
-                try:
-                    if selector.startswith('//'):
-                        element = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    
-                    if element.is_displayed():
-                        # 실제 제출은 하지 않고 로그만 출력 (테스트용)
-                        logger.info("✅ 회원등록 폼 제출 버튼 발견 (실제 제출은 하지 않음)")
-                        # element.click()  # 실제 제출은 주석처리
-                        # logger.info("✅ 회원등록 폼 제출 성공")
-                        # time.sleep(2)  # 제출 후 페이지 로딩 대기
-                        return True
-                        
-                except Exception as e:
-                    continue
+            if not self._is_submit_enabled():
+                # 실제 제출은 하지 않고 로그만 출력 (테스트용)
+                logger.info("✅ 회원등록 폼 제출 버튼 발견 (실제 제출은 하지 않음)")
+                return True
             
-            logger.warning("⚠️ 회원등록 폼 제출 버튼을 찾을 수 없습니다")
-            return False
+            element.click()
+            timeout = ConfigManager.get_value(self.config, 'registration.submit_timeout', 10)
+            try:
+                message = WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(self._submit_confirmation)
+            except TimeoutException:
+                logger.warning("⚠️ 회원등록 폼 제출 완료 메시지가 나타나지 않았습니다")
+                return False
+            logger.info(f"✅ 회원등록 폼 제출 성공: {message}")
+            return True
             
         except Exception as e:
             logger.error(f"회원등록 폼 제출 오류: {e}")
@@ -2613,6 +3094,11 @@ class IP168ITSMAutomation(BaseAutomation):
     def register_all_users_from_excel(self) -> Dict[str, Any]:
         """엑셀의 모든 사용자를 회원등록"""
         try:
+            # 탭 풀 모드 (하나의 로그인 세션에서 여러 탭으로 병행 처리)
+            tab_pool_config = self.config.get('tab_pool', {}) or {}
+            if tab_pool_config.get('enabled', False):
+                return self.register_all_users_in_tabs(tab_pool_config.get('tab_count', 3))
+            
             logger.info("엑셀의 모든 사용자 회원등록 시작")
             
             # 1. 웹사이트 접속 및 로그인
@@ -2638,6 +3124,7 @@ class IP168ITSMAutomation(BaseAutomation):
             logger.info(f"총 {total_rows}명의 사용자 회원등록 시작")
             
             # 한 번만 회원등록 페이지로 직접 이동 (정확한 URL 사용)
+            self.set_step('navigate_to_registration_page_direct')
             if not self.navigate_to_registration_page_direct():
                 logger.error("회원등록 페이지 이동 실패")
                 return {'success': False, 'message': '회원등록 페이지 이동 실패'}
@@ -2646,63 +3133,82 @@ class IP168ITSMAutomation(BaseAutomation):
             failed_count = 0
             results = []
             
+            # 법인 사전 검증 (옵션 목록 1회 로드 후 오프라인 매칭)
+            company_names = [
+                (self.excel_reader.get_user_data(row_index) or {}).get('계열사')
+                for row_index in range(total_rows)
+            ]
+            unknown_companies = set(self.prevalidate_companies(company_names))
+            
             for row_index in range(total_rows):
                 logger.info(f"=== 사용자 {row_index+1}/{total_rows} 회원등록 시작 ===")
+                self.set_step('register_user')
+                with self.span('user_row', row_index=row_index):
                 
-                # 사용자 데이터 가져오기
-                user_data = self.excel_reader.get_user_data(row_index)
-                if not user_data:
-                    logger.error(f"사용자 데이터 {row_index}를 찾을 수 없습니다")
-                    failed_count += 1
-                    results.append({
-                        'row_index': row_index,
-                        'success': False,
-                        'reason': '데이터 로드 실패'
-                    })
-                    continue
+                    # 사용자 데이터 가져오기
+                    user_data = self.excel_reader.get_user_data(row_index)
+                    if not user_data:
+                        logger.error(f"사용자 데이터 {row_index}를 찾을 수 없습니다")
+                        failed_count += 1
+                        results.append({
+                            'row_index': row_index,
+                            'success': False,
+                            'reason': '데이터 로드 실패'
+                        })
+                        continue
                 
-                logger.info(f"사용자 데이터: {user_data}")
+                    logger.info(f"사용자 데이터: {user_data}")
+                    self.annotate_span(user=user_data.get('per_nm', 'Unknown'))
                 
-                # 회원등록 폼 자동 입력
-                if not self.fill_registration_form(user_data):
-                    logger.error(f"사용자 {row_index+1} 회원등록 폼 입력 실패")
-                    failed_count += 1
-                    results.append({
-                        'row_index': row_index,
-                        'success': False,
-                        'reason': '폼 입력 실패'
-                    })
-                    continue
+                    if user_data.get('계열사') in unknown_companies:
+                        logger.error(f"사용자 {row_index+1} 사전 검증 실패: 알 수 없거나 모호한 법인 '{user_data.get('계열사')}'")
+                        failed_count += 1
+                        results.append({
+                            'row_index': row_index,
+                            'success': False,
+                            'reason': f"알 수 없거나 모호한 법인: {user_data.get('계열사')}"
+                        })
+                        continue
+                
+                    # 회원등록 폼 자동 입력
+                    if not self.fill_registration_form(user_data):
+                        logger.error(f"사용자 {row_index+1} 회원등록 폼 입력 실패")
+                        failed_count += 1
+                        results.append({
+                            'row_index': row_index,
+                            'success': False,
+                            'reason': '폼 입력 실패'
+                        })
+                        self.capture_screenshot(f"row_{row_index+1}_form_fill_failed", failed=True)
+                        continue
                 
-                # 폼 제출
-                if not self.submit_registration_form():
-                    logger.error(f"사용자 {row_index+1} 회원등록 폼 제출 실패")
-                    failed_count += 1
+                    # 폼 제출
+                    if not self.submit_registration_form():
+                        logger.error(f"사용자 {row_index+1} 회원등록 폼 제출 실패")
+                        failed_count += 1
+                        results.append({
+                            'row_index': row_index,
+                            'success': False,
+                            'reason': '폼 제출 실패'
+                        })
+                        self.capture_screenshot(f"row_{row_index+1}_form_submit_failed", failed=True)
+                        continue
+                
+                    # 성공
+                    success_count += 1
+                    logger.info(f"✅ 사용자 {row_index+1} ({user_data.get('per_nm', 'Unknown')}) 회원등록 성공")
                     results.append({
                         'row_index': row_index,
-                        'success': False,
-                        'reason': '폼 제출 실패'
+                        'success': True,
+                        'user_name': user_data.get('per_nm', 'Unknown')
                     })
-                    continue
-                
-                # 성공
-                success_count += 1
-                logger.info(f"✅ 사용자 {row_index+1} ({user_data.get('per_nm', 'Unknown')}) 회원등록 성공")
-                results.append({
-                    'row_index': row_index,
-                    'success': True,
-                    'user_name': user_data.get('per_nm', 'Unknown')
-                })
                 
-                # 다음 사용자 전 잠시 대기
-                if row_index < total_rows - 1:
-                    logger.info("다음 사용자 회원등록을 위해 3초 대기...")
-                    time.sleep(3)
-                    
-                    # 다음 사용자를 위해 회원등록 메뉴로 다시 이동
-                    logger.info("다음 사용자를 위해 회원등록 메뉴로 다시 이동...")
-                    if not self.navigate_to_registration_page_direct():
-                        logger.warning("회원등록 메뉴 이동 실패, 현재 페이지에서 계속 진행")
+                    # 다음 사용자를 위해 회원등록 폼 초기화 (실패 시 전체 새로고침)
+                    if row_index < total_rows - 1:
+                        logger.info("다음 사용자를 위해 회원등록 폼 초기화...")
+                        self.set_step('prepare_next_registration')
+                        if not self.prepare_next_registration():
+                            logger.warning("회원등록 폼 초기화 실패, 현재 페이지에서 계속 진행")
             
             logger.info(f"=== 전체 회원등록 완료 ===")
             logger.info(f"성공: {success_count}명, 실패: {failed_count}명")
@@ -2719,6 +3225,167 @@ class IP168ITSMAutomation(BaseAutomation):
             logger.error(f"전체 사용자 회원등록 오류: {e}")
             return {'success': False, 'message': f'오류: {e}'}
     
+    def _is_registration_form_ready(self, driver) -> bool:
+        """회원등록 폼 로딩 완료 여부 (탭 이동 직후의 이전 문서는 제외)"""
+        return driver.execute_script(
+            "return !window.__rpaNavigating && document.readyState === 'complete' && "
+            "!!document.querySelector(arguments[0]);",
+            self.selectors.REGISTRATION_FORM_READY
+        )
+    
+    def _duplicate_check_answer(self, driver) -> Optional[str]:
+        """중복확인 응답 판별 ('available' / 'duplicate', 응답 전이면 None)"""
+        return driver.execute_script("""
+            var nodes = document.querySelectorAll('[role="dialog"], [role="alert"], .MuiSnackbar-root');
+            for (var i = 0; i < nodes.length; i++) {
+                var node = nodes[i];
+                if (!node.getClientRects().length) continue;
+                var text = node.innerText || '';
+                if (text.indexOf('사용 가능한 ID') !== -1) return 'available';
+                if (text.indexOf('이미 사용 중') !== -1 || text.indexOf('중복된 ID') !== -1) return 'duplicate';
+            }
+            return null;
+        """)
+    
+    def _register_user_task(self, row_index: int, user_data: Dict[str, Any], ready_timeout: float):
+        """탭 풀 작업: 회원등록 페이지 이동 → 폼 로딩 대기 → 입력 → 중복확인 응답 대기 → 입력 및 제출 → 완료 대기
+        
+        네트워크 응답을 기다리는 지점마다 TabWait 를 yield 하여 그동안 다른 탭의 입력을 진행한다.
+        """
+        # 비블로킹 이동 (driver.get 은 로딩 완료까지 블로킹되므로 사용하지 않음)
+        self.driver.execute_script(
+            "window.__rpaNavigating = true; window.location.href = arguments[0];",
+            self.selectors.REGISTRATION_PAGE
+        )
+        yield TabWait(self._is_registration_form_ready, ready_timeout, f"사용자 {row_index+1} 회원등록 폼 로딩")
+        
+        user_name = user_data.get('per_nm', 'Unknown')
+        email_value = user_data.get('email')
+        success_count = 0
+        
+        # 1. 성명 + 사용자 ID 입력 후 중복확인 요청 (응답은 기다리지 않음)
+        with self.span('user_row', row_index=row_index, user=user_name, tab=self.driver.current_window_handle):
+            success_count += self._fill_name_step(user_data)
+            duplicate_requested = bool(
+                email_value
+                and self.traced('field', self.fill_user_id_field_specific, str(email_value),
+                                check_duplicate=False, attributes={'field': 'user_id'})
+                and self.click_duplicate_check_button(wait_for_popup=False)
+            )
+        
+        # 2. 중복확인 응답 대기 (다른 탭 진행)
+        if duplicate_requested:
+            answer = yield TabWait(self._duplicate_check_answer, ready_timeout, f"사용자 {row_index+1} 중복확인 응답")
+            self.close_duplicate_check_dialog()
+            if answer == 'duplicate':
+                logger.warning(f"⚠️ 사용자 {row_index+1} 사용자 ID 중복확인 실패: 이미 사용 중")
+                self.capture_screenshot(f"row_{row_index+1}_duplicate_id", failed=True)
+                return {'row_index': row_index, 'success': False, 'reason': '사용자 ID 중복'}
+            logger.info(f"✅ 사용자 {row_index+1} 사용자 ID 중복확인 완료: 사용 가능")
+            success_count += 1
+        elif email_value:
+            logger.warning(f"⚠️ 사용자 {row_index+1} 사용자 ID 입력/중복확인 요청 실패")
+        
+        # 3. 나머지 필드 입력 및 제출
+        with self.span('user_row', row_index=row_index, user=user_name, tab=self.driver.current_window_handle):
+            success_count += self._fill_detail_fields(user_data)
+            if success_count == 0:
+                logger.error(f"사용자 {row_index+1} 회원등록 폼 입력 실패")
+                self.capture_screenshot(f"row_{row_index+1}_form_fill_failed", failed=True)
+                return {'row_index': row_index, 'success': False, 'reason': '폼 입력 실패'}
+            
+            submit_button = self._find_submit_button()
+            if submit_button is None:
+                logger.error(f"사용자 {row_index+1} 회원등록 폼 제출 실패")
+                self.capture_screenshot(f"row_{row_index+1}_form_submit_failed", failed=True)
+                return {'row_index': row_index, 'success': False, 'reason': '폼 제출 실패'}
+            
+            submit_enabled = self._is_submit_enabled()
+            if submit_enabled:
+                submit_button.click()
+            else:
+                logger.info("✅ 회원등록 폼 제출 버튼 발견 (실제 제출은 하지 않음)")
+        
+        # 4. 제출 완료 메시지 대기 (다른 탭 진행)
+        if submit_enabled:
+            submit_timeout = ConfigManager.get_value(self.config, 'registration.submit_timeout', 10)
+            message = yield TabWait(self._submit_confirmation, submit_timeout, f"사용자 {row_index+1} 회원등록 제출 완료")
+            logger.info(f"✅ 회원등록 폼 제출 성공: {message}")
+        
+        logger.info(f"✅ 사용자 {row_index+1} ({user_name}) 회원등록 성공")
+        return {'row_index': row_index, 'success': True, 'user_name': user_name}
+    
+    def register_all_users_in_tabs(self, tab_count: int = 3) -> Dict[str, Any]:
+        """탭 풀 모드로 엑셀의 모든 사용자 회원등록
+        
+        하나의 로그인 세션을 여러 탭이 공유하고, 한 탭의 페이지 로딩 대기 중에
+        다른 탭의 입력을 진행하여 브라우저를 추가로 띄우지 않고 처리량을 높인다.
+        """
+        pool = None
+        try:
+            logger.info(f"탭 풀 모드 회원등록 시작 (탭 {tab_count}개)")
+            
+            # 1. 웹사이트 접속 및 로그인 (모든 탭이 세션 공유)
+            if not self.run_automation(navigate_to_target=False):
+                logger.error("웹사이트 접속 및 로그인 실패")
+                return {'success': False, 'message': '웹사이트 접속 및 로그인 실패'}
+            
+            # 2. 엑셀 파일 로드
+            if not self.excel_reader.load_excel_file():
+                logger.error("엑셀 파일 로드 실패")
+                return {'success': False, 'message': '엑셀 파일 로드 실패'}
+            
+            total_rows = self.excel_reader.get_total_rows()
+            if total_rows == 0:
+                logger.warning("회원가입할 사용자 데이터가 없습니다")
+                return {'success': False, 'message': '사용자 데이터 없음'}
+            
+            tab_pool_config = self.config.get('tab_pool', {}) or {}
+            ready_timeout = tab_pool_config.get('ready_timeout', 15)
+            
+            results: List[Dict[str, Any]] = []
+            tasks = []
+            task_rows = []
+            for row_index in range(total_rows):
+                user_data = self.excel_reader.get_user_data(row_index)
+                if not user_data:
+                    logger.error(f"사용자 데이터 {row_index}를 찾을 수 없습니다")
+                    results.append({'row_index': row_index, 'success': False, 'reason': '데이터 로드 실패'})
+                    continue
+                tasks.append(lambda r=row_index, u=user_data: self._register_user_task(r, u, ready_timeout))
+                task_rows.append(row_index)
+            
+            # 3. 탭 풀 실행
+            self.set_step('register_user')
+            pool = TabPool(self.driver, size=min(tab_count, max(len(tasks), 1)),
+                           poll_interval=tab_pool_config.get('poll_interval', 0.2),
+                           on_new_tab=lambda driver: WebDriverManager.apply_resource_blocking(driver, self.config))
+            # 탭 작업 예외/대기 시간 초과 결과에는 row_index 가 없으므로 항상 행 번호를 붙임
+            for row_index, result in zip(task_rows, pool.run(tasks)):
+                results.append({'row_index': row_index, **(result or {'success': False, 'reason': '결과 없음'})})
+            
+            results.sort(key=lambda r: r['row_index'])
+            success_count = sum(1 for r in results if r['success'])
+            failed_count = len(results) - success_count
+            
+            logger.info(f"=== 탭 풀 회원등록 완료 ===")
+            logger.info(f"성공: {success_count}명, 실패: {failed_count}명")
+            
+            return {
+                'success': True,
+                'total_users': total_rows,
+                'success_count': success_count,
+                'failed_count': failed_count,
+                'results': results
+            }
+            
+        except Exception as e:
+            logger.error(f"탭 풀 회원등록 오류: {e}")
+            return {'success': False, 'message': f'오류: {e}'}
+        finally:
+            if pool:
+                pool.close()
+    
     def analyze_page_structure(self):
         """페이지 구조를 상세히 분석하는 함수"""
         logger.info("=== 페이지 구조 상세 분석 시작 ===")
@@ -11,6 +11,14 @@ class IP168ITSMSelectors:
     MAIN_PAGE = "http://4.144.198.168/sign-in"
     LOGIN_PAGE = "http://4.144.198.168/sign-in"
     
+    # 회원등록 페이지 (SPA 라우트)
+    REGISTRATION_PAGE = "http://4.144.198.168/ims/ImsMng001.R01.cmd?rootMenu=MNU180516000001"
+    REGISTRATION_FORM_READY = "input[name='perNm']"
+    USER_ID_INPUT = "input[name='perId']"
+    
+    # 법인(compCd) Material-UI Select
+    COMPANY_SELECT = "#mui-component-select-compCd"
+    
     # 로그인 폼 요소들
     USERNAME_INPUT = "input[name='userName']"
     PASSWORD_INPUT = "input[name='password']"
@@ -0,0 +1,58 @@
+"""
+옵션 인덱스(정규화/매칭) 테스트 스크립트
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent
+sys.path.append(str(project_root))
+
+from src.core.option_index import OptionIndex, normalize_option_text
+
+
+def make_index(texts):
+    return OptionIndex([{'text': text, 'value': str(i), 'index': i} for i, text in enumerate(texts)])
+
+
+def test_normalize_strips_markers_only_at_token_boundaries():
+    """법인 표기는 앞/뒤 독립 토큰일 때만 제거"""
+    assert normalize_option_text("Principal Financial") == "principalfinancial"
+    assert normalize_option_text("Incheon Steel") == "incheonsteel"
+    assert normalize_option_text("Incorp Systems") == "incorpsystems"
+
+
+def test_normalize_strips_leading_and_trailing_markers():
+    """앞/뒤 법인 표기 제거"""
+    assert normalize_option_text("삼성전자(주)") == "삼성전자"
+    assert normalize_option_text("(주) 삼성전자") == "삼성전자"
+    assert normalize_option_text("㈜삼성전자") == "삼성전자"
+    assert normalize_option_text("주식회사 메타넷") == "메타넷"
+    assert normalize_option_text("메타넷 주식회사") == "메타넷"
+    assert normalize_option_text("Samsung Co., Ltd.") == "samsung"
+    assert normalize_option_text("Acme, Inc.") == "acme"
+
+
+def test_match_does_not_use_substrings():
+    """부분 문자열로 다른 법인을 선택하지 않음"""
+    index = make_index(["메타넷", "삼성전자"])
+    assert index.match("메타넷티플랫폼") is None
+    assert index.match("전자") is None
+    assert index.find_unknown(["메타", "전자", "메타넷티플랫폼"]) == ["메타", "전자", "메타넷티플랫폼"]
+
+
+def test_match_exact_after_normalization():
+    """정규화 후 정확히 일치하면 선택"""
+    index = make_index(["메타넷티플랫폼 주식회사", "Principal Financial"])
+    assert index.match("메타넷티플랫폼")['text'] == "메타넷티플랫폼 주식회사"
+    assert index.match("Principal Financial Inc.")['text'] == "Principal Financial"
+    assert index.find_unknown(["메타넷티플랫폼"]) == []
+
+
+def test_ambiguous_names_are_reported():
+    """최고 유사도 후보가 여럿이면 선택하지 않고 모호한 이름으로 보고"""
+    index = make_index(["일진전기A", "일진전기B"])
+    assert index.match("일진전기C") is None
+    assert index.find_unknown(["일진전기C"]) == ["일진전기C"]
+    assert index.find_ambiguous(["일진전기C", "일진전기A"]) == {"일진전기C": ["일진전기A", "일진전기B"]}
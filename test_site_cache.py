@@ -0,0 +1,84 @@
+"""
+사이트 캐시 병합 저장 테스트 스크립트 (같은 사이트 캐시를 여러 워커가 저장하는 경우)
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent
+sys.path.append(str(project_root))
+
+from src.core.site_cache import SiteCache
+from src.core.strategy_memo import StrategyMemo
+
+
+def read_entries(tmp_path):
+    with open(tmp_path / "site.json", 'r', encoding='utf-8') as f:
+        return json.load(f).get('entries', {})
+
+
+def test_instances_keep_each_others_keys(tmp_path):
+    """각 인스턴스가 바꾼 키만 저장되어 다른 인스턴스의 키를 덮어쓰지 않음"""
+    first = SiteCache("site", str(tmp_path))
+    second = SiteCache("site", str(tmp_path))
+
+    first.set('company_options', ['A'])
+    second.set('registration_form_schema', ['B'])
+    first.delete('company_options')
+    first.set('language_strategy', 'C')
+
+    entries = read_entries(tmp_path)
+    assert set(entries) == {'registration_form_schema', 'language_strategy'}
+    assert first.get('registration_form_schema') == ['B']
+
+
+def test_rebind_keeps_entries_of_worker_already_on_new_build(tmp_path):
+    """다른 워커가 먼저 새 빌드에 연결하고 저장한 항목은 늦게 연결한 워커가 지우지 않음"""
+    first = SiteCache("site", str(tmp_path))
+    first.bind_build('build-1')
+    first.set('old', 1)
+    second = SiteCache("site", str(tmp_path))
+
+    first.bind_build('build-2')
+    first.set('new', 2)
+    assert second.bind_build('build-2') is True
+    second.set('other', 3)
+
+    assert set(read_entries(tmp_path)) == {'new', 'other'}
+
+
+def test_stale_build_changes_are_dropped(tmp_path):
+    """다른 워커가 새 빌드로 갱신한 뒤 이전 빌드 기준의 변경은 저장하지 않음"""
+    first = SiteCache("site", str(tmp_path))
+    first.bind_build('build-1')
+    second = SiteCache("site", str(tmp_path))
+
+    first.bind_build('build-2')
+    second.set('stale', 1)
+
+    assert read_entries(tmp_path) == {}
+    assert second.build_id == 'build-2'
+
+
+def test_strategy_memo_merges_winners_across_workers(tmp_path):
+    """여러 워커의 전략 메모 성공 방법과 지표가 모두 유지됨"""
+    memos = [StrategyMemo(SiteCache("site", str(tmp_path))) for _ in range(4)]
+
+    def work(number, memo):
+        memo.record(f"kind{number}", 'fast', True)
+        memo.record('shared', 'slow', False)
+        memo.flush()
+
+    threads = [threading.Thread(target=work, args=(number, memo)) for number, memo in enumerate(memos)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stored = read_entries(tmp_path)['strategy_memo']['value']
+    assert stored['winners'] == {f"kind{number}": 'fast' for number in range(4)}
+    assert stored['metrics']['shared']['slow'] == {'wins': 0, 'failures': 4}
+    assert StrategyMemo(SiteCache("site", str(tmp_path))).order('kind3', ['slow', 'fast']) == ['fast', 'slow']
@@ -0,0 +1,95 @@
+"""
+탭 풀 실행 테스트 스크립트 (작업 예외/대기 시간 초과 결과 처리)
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent
+sys.path.append(str(project_root))
+
+from src.core.tab_pool import TabPool, TabWait
+from src.websites.ip_168_itsm.automation import IP168ITSMAutomation
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def new_window(self, kind):
+        self.driver.handle_count += 1
+        self.driver.current_window_handle = f"tab-{self.driver.handle_count}"
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """탭 전환만 흉내 내는 드라이버"""
+
+    def __init__(self):
+        self.handle_count = 1
+        self.current_window_handle = 'tab-1'
+        self.switch_to = FakeSwitchTo(self)
+
+    def close(self):
+        pass
+
+
+class FakeExcelReader:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def load_excel_file(self):
+        return True
+
+    def get_total_rows(self):
+        return len(self.rows)
+
+    def get_user_data(self, row_index):
+        return self.rows[row_index]
+
+
+def succeeding_task(row_index):
+    yield TabWait(lambda d: True, 1, "즉시 완료")
+    return {'row_index': row_index, 'success': True}
+
+
+def timing_out_task():
+    yield TabWait(lambda d: False, 0.01, "응답 없음")
+    return {'success': True}
+
+
+def raising_task():
+    yield TabWait(lambda d: True, 1, "즉시 완료")
+    raise RuntimeError("입력 실패")
+
+
+def test_pool_reports_timeout_and_exception_in_order():
+    """대기 시간 초과/예외 작업은 실패 결과가 되고 나머지 작업 결과는 입력 순서대로 유지"""
+    pool = TabPool(FakeDriver(), size=2, poll_interval=0)
+    results = pool.run([lambda: succeeding_task(0), timing_out_task, raising_task])
+
+    assert results[0] == {'row_index': 0, 'success': True}
+    assert results[1]['success'] is False and '대기 시간 초과' in results[1]['reason']
+    assert results[2]['success'] is False and '입력 실패' in results[2]['reason']
+
+
+def test_register_all_users_in_tabs_keeps_row_results_on_task_failure():
+    """탭 작업이 시간 초과/예외로 끝나도 전체 실행이 실패하지 않고 행별 결과에 row_index 가 붙음"""
+    automation = IP168ITSMAutomation.__new__(IP168ITSMAutomation)
+    automation.config = {'tab_pool': {'poll_interval': 0}}
+    automation.profiler = automation.tracer = automation.watchdog = None
+    automation.driver = FakeDriver()
+    automation.excel_reader = FakeExcelReader([{'per_nm': '가'}, None, {'per_nm': '나'}, {'per_nm': '다'}])
+    automation.run_automation = lambda **kwargs: True
+    tasks = {0: lambda: succeeding_task(0), 2: timing_out_task, 3: raising_task}
+    automation._register_user_task = lambda row_index, user_data, ready_timeout: tasks[row_index]()
+
+    result = automation.register_all_users_in_tabs(tab_count=2)
+
+    assert result['success'] is True
+    assert [row['row_index'] for row in result['results']] == [0, 1, 2, 3]
+    assert [row['success'] for row in result['results']] == [True, False, False, False]
+    assert result['success_count'] == 1 and result['failed_count'] == 3
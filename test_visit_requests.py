@@ -0,0 +1,120 @@
+"""
+방문신청 블록 파싱/분할 테스트 스크립트 (data/input/sample_data.xlsx 블록 구조 기준)
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent
+sys.path.append(str(project_root))
+
+from src.core.excel_processor import ExcelProcessor
+from src.websites.iljin_holdings.batch_runner import expand_visit_requests, split_visitors
+
+
+HEADER = ['방문사업장', '피방문자 연락처', '피방문자', '신청자', '연락처', '소속회사', '회사주소', '방문기간', '방문목적', '내용']
+VISITOR_HEADER = ['방문객정보', '성명', '휴대폰번호', '차종', '차량번호', '', '', '', '', '']
+EMPTY = [''] * 10
+
+
+def applicant_row(name, phone):
+    return ['마곡빌딩(홀딩스)', '010-9043-5907', '김성윤', name, phone, '메타넷글로벌',
+            '서울 송파구 중대로113 12층 메타넷글로벌', 45887, '업무협의', '일진홀딩스 업무시스템 이관프로젝트 수행']
+
+
+def visitor_row(no, name, phone, car='', number=''):
+    return [no, name, phone, car, number, '', '', '', '', '']
+
+
+def make_visitors(count):
+    return [{'번호': i, '성명': f"방문객{i}", '휴대폰번호': f"010-0000-{i:04d}"} for i in range(1, count + 1)]
+
+
+def test_parse_sample_block():
+    """sample_data.xlsx 와 같은 블록 1개: 신청자 1명 + 방문객"""
+    rows = [
+        HEADER,
+        applicant_row('임수현', '010-7343-2568'),
+        EMPTY,
+        VISITOR_HEADER,
+        visitor_row(1, '이재민', '010-9076-2505', '그랜저', '175하8086'),
+        visitor_row(2, '김종현', '010-9348-1971'),
+    ]
+    requests = ExcelProcessor.parse_visit_request_rows(rows)
+
+    assert len(requests) == 1
+    assert requests[0]['applicant']['신청자'] == '임수현'
+    assert requests[0]['applicant']['방문사업장'] == '마곡빌딩(홀딩스)'
+    assert [visitor['성명'] for visitor in requests[0]['visitors']] == ['이재민', '김종현']
+    assert requests[0]['visitors'][0]['차량번호'] == '175하8086'
+
+
+def test_parse_repeated_blocks():
+    """헤더 → 신청자 → 방문객정보 블록이 반복되면 블록마다 방문신청 1건"""
+    rows = [
+        HEADER, applicant_row('임수현', '010-7343-2568'), VISITOR_HEADER, visitor_row(1, '이재민', '010-9076-2505'),
+        EMPTY,
+        HEADER, applicant_row('최선정', '010-7916-6230'), VISITOR_HEADER, visitor_row(1, '장선욱', '010-9135-1958'),
+    ]
+    requests = ExcelProcessor.parse_visit_request_rows(rows)
+
+    assert [request['applicant']['신청자'] for request in requests] == ['임수현', '최선정']
+    assert [request['visitors'][0]['성명'] for request in requests] == ['이재민', '장선욱']
+
+
+def test_parse_multiple_applicant_rows_under_one_header():
+    """헤더 아래 신청자 행이 여러 개면 각각 별도 방문신청 (방문객은 마지막 신청자에 속함)"""
+    rows = [
+        HEADER,
+        applicant_row('임수현', '010-7343-2568'),
+        applicant_row('최선정', '010-7916-6230'),
+        VISITOR_HEADER,
+        visitor_row(1, '장선욱', '010-9135-1958'),
+    ]
+    requests = ExcelProcessor.parse_visit_request_rows(rows)
+
+    assert [request['applicant']['신청자'] for request in requests] == ['임수현', '최선정']
+    assert requests[0]['visitors'] == []
+    assert [visitor['성명'] for visitor in requests[1]['visitors']] == ['장선욱']
+
+
+def test_parse_skips_rows_before_header_and_blank_visitors():
+    """헤더 이전 행, 성명이 빈 방문객 행은 무시"""
+    rows = [
+        ['안내', '', '', '', '', '', '', '', '', ''],
+        HEADER,
+        applicant_row('임수현', '010-7343-2568'),
+        VISITOR_HEADER,
+        visitor_row(1, '', ''),
+        visitor_row(2, '이재민', '010-9076-2505'),
+    ]
+    requests = ExcelProcessor.parse_visit_request_rows(rows)
+
+    assert len(requests) == 1
+    assert [visitor['성명'] for visitor in requests[0]['visitors']] == ['이재민']
+
+
+def test_split_visitors():
+    """한도 단위 분할"""
+    visitors = make_visitors(45)
+    chunks = split_visitors(visitors, 20)
+
+    assert [len(chunk) for chunk in chunks] == [20, 20, 5]
+    assert chunks[2][0]['성명'] == '방문객41'
+    assert split_visitors([], 20) == []
+    assert [len(chunk) for chunk in split_visitors(make_visitors(3), 0)] == [1, 1, 1]
+
+
+def test_expand_visit_requests_numbering():
+    """한도 초과 블록은 '번호-순번', 나머지는 '번호' 로 전개하고 방문객 없는 블록도 1건 유지"""
+    visit_requests = [
+        {'applicant': {'신청자': '임수현'}, 'visitors': make_visitors(25)},
+        {'applicant': {'신청자': '최선정'}, 'visitors': make_visitors(3)},
+        {'applicant': {'신청자': '장선욱'}, 'visitors': []},
+    ]
+    jobs = expand_visit_requests(visit_requests, 20)
+
+    assert [job['request_no'] for job in jobs] == ['1-1', '1-2', '2', '3']
+    assert [len(job['visitors']) for job in jobs] == [20, 5, 3, 0]
+    assert jobs[1]['applicant']['신청자'] == '임수현'